@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark for get_page_content with render="browser" versus render="http".
+
+Serves a static, server-rendered article page from a local HTTP server and
+fetches it repeatedly through BrowserService.get_page_content, once in
+Chromium and once over the HTTP fast path, reporting median latency and
+throughput with a few calls in flight at once.
+
+Usage:
+    python benchmarks/bench_http_render.py [--requests 100] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the project root directory to Python path to allow module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.http_render import close_http_client
+
+
+PARAGRAPH = "<p>" + "Server-rendered article text with a few links. " * 30 + "</p>"
+
+
+async def start_server():
+    links = "".join(f'<a href="/page/{i}">Page {i}</a> ' for i in range(100))
+    body = f"<html><head><title>Article</title></head><body><h1>Article</h1>{PARAGRAPH * 20}{links}</body></html>"
+
+    async def page(request):
+        return web.Response(text=body, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+async def measure(service: BrowserService, url: str, requests: int, concurrency: int, render: str):
+    timings = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            result = await service.get_page_content(url, render=render, fields=["title", "text", "links"])
+            timings.append((time.perf_counter() - started) * 1000)
+            assert "error" not in result, result
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    return statistics.median(timings), requests / elapsed, time.process_time() - cpu_started
+
+
+async def run(requests: int, concurrency: int):
+    runner, url = await start_server()
+    service = BrowserService()
+    try:
+        rows = []
+        for render in ("http", "browser"):
+            rows.append((render, *await measure(service, url, requests, concurrency, render)))
+        print(f"{requests} requests, concurrency {concurrency}")
+        print(f"{'render':<10} {'median ms':>10} {'pages/s':>10} {'server CPU s':>13}")
+        for render, median_ms, rate, cpu in rows:
+            print(f"{render:<10} {median_ms:>10.1f} {rate:>10.1f} {cpu:>13.2f}")
+        print("server CPU excludes Chromium's own processes, which do most of the browser's work")
+    finally:
+        await service.close()
+        await close_http_client()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.concurrency))
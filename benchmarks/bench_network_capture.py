@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark for passive vs. intercepting network capture.
+
+Serves a local fixture page with hundreds of subresources (scripts, stylesheets
+and images) and loads it with NetworkCapture in each mode. Reports the page's
+own load time from the Navigation Timing API (loadEventEnd), which is what
+route interception skews, and checks both modes capture the same requests.
+
+Usage:
+    python benchmarks/bench_network_capture.py [--resources 300] [--iterations 10]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+
+# Add the project root directory to Python path to allow module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+from playwright.async_api import async_playwright
+
+from mcp_server.browser.network_capture import NetworkCapture, CAPTURE_MODES
+
+
+LOAD_TIME_SCRIPT = "() => performance.getEntriesByType('navigation')[0].loadEventEnd"
+
+
+async def start_server(resources: int):
+    tags = []
+    for i in range(resources):
+        kind = i % 3
+        if kind == 0:
+            tags.append(f'<script src="/res/{i}.js"></script>')
+        elif kind == 1:
+            tags.append(f'<link rel="stylesheet" href="/res/{i}.css">')
+        else:
+            tags.append(f'<img src="/res/{i}.png">')
+    html = f"<!DOCTYPE html><html><head><title>Fixture</title></head><body>{''.join(tags)}</body></html>"
+
+    content_types = {"js": "text/javascript", "css": "text/css", "png": "image/png"}
+
+    async def page(request):
+        return web.Response(text=html, content_type="text/html")
+
+    async def resource(request):
+        extension = request.match_info["name"].rsplit(".", 1)[-1]
+        body = b"/* x */" if extension != "png" else b"\x89PNG\r\n\x1a\n"
+        return web.Response(body=body, content_type=content_types[extension],
+                            headers={"Cache-Control": "no-store"})
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    app.router.add_get("/res/{name}", resource)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+async def load_once(browser, url: str, mode: str):
+    context = await browser.new_context()
+    page = await context.new_page()
+    capture = NetworkCapture(mode)
+    await capture.attach(page)
+    await page.goto(url, wait_until="load")
+    load_ms = await page.evaluate(LOAD_TIME_SCRIPT)
+    await context.close()
+    return load_ms, capture.result()["total_requests"]
+
+
+async def run(resources: int, iterations: int):
+    runner, url = await start_server(resources)
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        # Warm up the browser and the local server
+        await load_once(browser, url, "passive")
+
+        print(f"{resources} subresources, {iterations} loads per mode")
+        print(f"{'mode':<10} {'load ms (median)':>17} {'p90':>8} {'requests':>9}")
+        for mode in CAPTURE_MODES:
+            timings, counts = [], set()
+            for _ in range(iterations):
+                load_ms, requests = await load_once(browser, url, mode)
+                timings.append(load_ms)
+                counts.add(requests)
+            timings.sort()
+            p90 = timings[max(0, int(len(timings) * 0.9) - 1)]
+            print(f"{mode:<10} {statistics.median(timings):>17.1f} {p90:>8.1f} {'/'.join(map(str, sorted(counts))):>9}")
+        await browser.close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resources", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.resources, args.iterations))
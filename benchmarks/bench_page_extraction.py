@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for get_page_content's DOM extraction.
+
+Compares the previous sequence of six separate Playwright calls (title, content,
+text_content and three eval_on_selector_all) against the single in-page
+evaluation now used by BrowserService, on large generated fixture pages. The
+last column restricts the evaluation to fields=["title", "text"].
+
+Usage:
+    python benchmarks/bench_page_extraction.py [--iterations 20]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the project root directory to Python path to allow module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+
+from mcp_server.browser.browser_service import EXTRACT_CONTENT_SCRIPT, CONTENT_FIELDS
+
+
+FIXTURE_SIZES = [
+    # (links, images, paragraphs)
+    (100, 20, 50),
+    (2000, 200, 500),
+    (10000, 1000, 2000),
+]
+
+
+def build_fixture(links: int, images: int, paragraphs: int) -> str:
+    """Generate a large, self-contained HTML page."""
+    parts = [
+        "<!DOCTYPE html><html><head><title>Extraction fixture</title>",
+        '<meta name="description" content="fixture"><meta property="og:title" content="fixture">',
+        "</head><body>",
+    ]
+    parts.extend(f"<p>Paragraph {i} with some filler text to extract.</p>" for i in range(paragraphs))
+    parts.extend(f'<a href="/page/{i}">Link number {i}</a>' for i in range(links))
+    parts.extend(f'<img src="/img/{i}.png" alt="Image {i}">' for i in range(images))
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+async def legacy_extract(page):
+    """The six-round-trip extraction previously used by get_page_content."""
+    title = await page.title()
+    html_content = await page.content()
+    text_content = await page.text_content('body')
+    meta_elements = await page.eval_on_selector_all('meta',
+        'elements => elements.map(el => ({name: el.name || el.property, content: el.content}))')
+    links = await page.eval_on_selector_all('a',
+        'elements => elements.map(el => ({text: el.innerText, href: el.href}))')
+    images = await page.eval_on_selector_all('img',
+        'elements => elements.map(el => ({src: el.src, alt: el.alt}))')
+    return {"title": title, "html": html_content, "text": text_content,
+            "meta": meta_elements, "links": links, "images": images}
+
+
+def extraction_options(fields):
+    return {"fields": list(fields), "maxLinks": None, "maxImages": None,
+            "maxTextChars": None, "maxHtmlChars": None}
+
+
+async def single_evaluation_extract(page):
+    """The single evaluation used by BrowserService._extract_page_content."""
+    return await page.evaluate(EXTRACT_CONTENT_SCRIPT, extraction_options(CONTENT_FIELDS))
+
+
+async def title_text_extract(page):
+    """The single evaluation restricted to fields=["title", "text"]."""
+    return await page.evaluate(EXTRACT_CONTENT_SCRIPT, extraction_options(["title", "text"]))
+
+
+async def time_extraction(page, extract, iterations: int) -> list:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await extract(page)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def run(iterations: int):
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        print(f"{'links':>7} {'images':>7} {'legacy ms':>12} {'single ms':>12} {'speedup':>8} {'title+text ms':>14}")
+        for links, images, paragraphs in FIXTURE_SIZES:
+            await page.set_content(build_fixture(links, images, paragraphs))
+
+            # Both paths must produce the same payload
+            legacy = await legacy_extract(page)
+            single = await single_evaluation_extract(page)
+            assert legacy["html"] == single["html"] and legacy["links"] == single["links"]
+
+            legacy_ms = statistics.median(await time_extraction(page, legacy_extract, iterations))
+            single_ms = statistics.median(await time_extraction(page, single_evaluation_extract, iterations))
+            subset_ms = statistics.median(await time_extraction(page, title_text_extract, iterations))
+            print(f"{links:>7} {images:>7} {legacy_ms:>12.2f} {single_ms:>12.2f} "
+                  f"{legacy_ms / single_ms:>7.2f}x {subset_ms:>14.2f}")
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
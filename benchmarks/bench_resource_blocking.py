@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark for page loads with and without resource blocking.
+
+Serves an image-heavy page from a local HTTP server (each image is a few
+hundred KB and delayed slightly, like a CDN on a real link) and loads it
+through BrowserService.inspect_page with content and network capture, which
+waits for the load event and for the network to settle. Each page is loaded
+once as before and once with
+block_resources={"resource_types": ["image", "font", "media"]}.
+
+Usage:
+    python benchmarks/bench_resource_blocking.py [--images 60] [--iterations 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the project root directory to Python path to allow module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+
+
+IMAGE_BYTES = 300 * 1024
+IMAGE_DELAY = 0.05  # seconds
+
+
+async def start_server(images: int):
+    served = {"bytes": 0}
+    body = b"\x00" * IMAGE_BYTES
+
+    async def page(request):
+        tags = "".join(f'<img src="/img/{i}.png" alt="image {i}">' for i in range(images))
+        return web.Response(text=f"<html><head><title>Gallery</title></head><body><p>Gallery</p>{tags}</body></html>",
+                            content_type="text/html")
+
+    async def image(request):
+        await asyncio.sleep(IMAGE_DELAY)
+        served["bytes"] += len(body)
+        return web.Response(body=body, content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    app.router.add_get("/img/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", served
+
+
+async def measure(service: BrowserService, url: str, served: dict, iterations: int, block_resources=None):
+    timings, served_bytes = [], []
+    for _ in range(iterations):
+        served["bytes"] = 0
+        started = time.perf_counter()
+        result = await service.inspect_page(url, include_console=False, fields=["title", "text"],
+                                            block_resources=block_resources)
+        timings.append((time.perf_counter() - started) * 1000)
+        # Let in-flight image responses finish so served bytes are comparable
+        await asyncio.sleep(IMAGE_DELAY * 2)
+        served_bytes.append(served["bytes"])
+        assert "error" not in result, result
+    return statistics.median(timings), statistics.median(served_bytes), result.get("blocked_resources")
+
+
+async def run(images: int, iterations: int):
+    runner, url, served = await start_server(images)
+    service = BrowserService()
+    await service.initialize()
+    try:
+        baseline_ms, baseline_bytes, _ = await measure(service, url, served, iterations)
+        blocked_ms, blocked_bytes, stats = await measure(
+            service, url, served, iterations, {"resource_types": ["image", "font", "media"]}
+        )
+        print(f"{images} images x {IMAGE_BYTES // 1024} KB")
+        print(f"{'mode':<10} {'median ms':>10} {'served KB':>10}")
+        print(f"{'all':<10} {baseline_ms:>10.1f} {baseline_bytes / 1024:>10.0f}")
+        print(f"{'blocked':<10} {blocked_ms:>10.1f} {blocked_bytes / 1024:>10.0f}")
+        print(f"speedup {baseline_ms / blocked_ms:.1f}x, blocked_resources={stats}")
+    finally:
+        await service.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=60)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.images, args.iterations))
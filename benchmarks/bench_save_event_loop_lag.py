@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark for event-loop lag caused by writing crawl outputs.
+
+Writes a batch of multi-MB files (HTML-like text and PDF/screenshot-like bytes)
+with the synchronous utils.save and with utils.save_async, while a ticker task
+measures how late the event loop wakes it up. Lag is what every other concurrent
+tool call on the server would experience during the writes.
+
+Usage:
+    python benchmarks/bench_save_event_loop_lag.py [--files 20] [--size-mb 8]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the project root directory to Python path to allow module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_server.utils import save, save_async, shutdown_io_executor
+
+
+TICK_SECONDS = 0.001
+
+
+async def measure_lag(stop: asyncio.Event, samples: list):
+    """Record how late each 1 ms sleep wakes up, in milliseconds."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        samples.append((time.perf_counter() - started - TICK_SECONDS) * 1000)
+
+
+def make_payloads(files: int, size_mb: int) -> list:
+    size = size_mb * 1024 * 1024
+    text = ("<div>" + "x" * 59 + "</div>\n") * (size // 70)
+    blob = os.urandom(size)
+    return [(f"output-{i}.{'html' if i % 2 else 'pdf'}", text if i % 2 else blob) for i in range(files)]
+
+
+async def run_case(name: str, payloads: list, use_async: bool):
+    samples = []
+    stop = asyncio.Event()
+    with tempfile.TemporaryDirectory() as directory:
+        ticker = asyncio.ensure_future(measure_lag(stop, samples))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        if use_async:
+            await asyncio.gather(*(save_async(directory, n, data, lambda f: None) for n, data in payloads))
+        else:
+            for n, data in payloads:
+                save(directory, n, data, lambda f: None)
+                await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1] if samples else 0.0
+    print(f"{name:<12} {elapsed:>9.2f} {statistics.mean(samples):>10.2f} {p99:>10.2f} {max(samples):>10.2f}")
+
+
+async def run(files: int, size_mb: int):
+    payloads = make_payloads(files, size_mb)
+    print(f"{files} files x {size_mb} MB")
+    print(f"{'writer':<12} {'total s':>9} {'mean lag':>10} {'p99 lag':>10} {'max lag':>10}   (lag in ms)")
+    await run_case("save", payloads, use_async=False)
+    await run_case("save_async", payloads, use_async=True)
+    shutdown_io_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--size-mb", type=int, default=8)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.files, args.size_mb))
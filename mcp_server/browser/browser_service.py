@@ -4,12 +4,143 @@ console messages, and network requests information.
 """
 
 import asyncio
+import copy
+import os
 import re
 from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Browser, Page, Route, Response
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, Response
 import json
 import urllib.parse
 
+from mcp_server.http_render import validate_render_mode, extract_static_content, parse_off_loop
+from mcp_server.render_table import fetch_for_render, learn_render
+from mcp_server.single_flight import SingleFlight
+from mcp_server.browser_cache import browser_cache_enabled, profile_dir, disk_cache_args
+from mcp_server.browser.context_pool import ContextPool, SharedContextPool
+from mcp_server.browser.page_cache import PageCache, page_cache_key
+from mcp_server.browser.subresource_cache import SubresourceCache
+from mcp_server.browser.settle import ActivityMonitor, validate_settle_options
+from mcp_server.browser.resource_blocking import attach_resource_blocker
+from mcp_server.browser.emulation import apply_emulation
+from mcp_server.browser.network_capture import NetworkCapture
+from mcp_server.browser.console_capture import ConsoleCapture
+from mcp_server.browser.har_writer import TrafficExporter
+from mcp_server.browser.coverage import CoverageCollector, build_coverage_report
+from mcp_server.browser.performance import (
+    PERFORMANCE_OBSERVER_SCRIPT, COLLECT_PERFORMANCE_SCRIPT, build_performance_report
+)
+
+
+class BrowserServiceConfig:
+    """Configuration for the browser service."""
+
+    # Number of browser contexts kept warm for reuse
+    CONTEXT_POOL_SIZE = int(os.getenv("MCP_BROWSER_CONTEXT_POOL_SIZE", "4"))
+
+    # Number of checkouts after which a pooled context is closed and replaced
+    CONTEXT_MAX_USES = int(os.getenv("MCP_BROWSER_CONTEXT_MAX_USES", "50"))
+
+    # Maximum number of pages open at the same time; further calls queue
+    MAX_CONCURRENT_PAGES = int(os.getenv("MCP_BROWSER_MAX_CONCURRENT_PAGES", "4"))
+
+    # Maximum time a call waits in the queue for a free page slot
+    PAGE_ACQUIRE_TIMEOUT = float(os.getenv("MCP_BROWSER_PAGE_ACQUIRE_TIMEOUT", "120"))  # seconds
+
+
+# Fields get_page_content can return besides url, status and timestamp
+CONTENT_FIELDS = ("title", "html", "text", "meta", "links", "images")
+
+# Collects the requested get_page_content fields in a single round trip to the browser.
+# Fields that are not requested are never computed; limits are applied before
+# serialization so oversized parts never leave the page. The html field matches
+# page.content() (doctype + documentElement.outerHTML).
+EXTRACT_CONTENT_SCRIPT = """
+({fields, maxLinks, maxImages, maxTextChars, maxHtmlChars}) => {
+    const want = new Set(fields);
+    const result = {};
+    const truncated = {};
+
+    const clip = (name, value, max) => {
+        if (value !== null && max !== null && value.length > max) {
+            truncated[name] = value.length;
+            return value.slice(0, max);
+        }
+        return value;
+    };
+    const collect = (name, selector, max, map) => {
+        const elements = document.querySelectorAll(selector);
+        const count = max === null ? elements.length : Math.min(elements.length, max);
+        if (count < elements.length) {
+            truncated[name] = elements.length;
+        }
+        return Array.from({length: count}, (_, i) => map(elements[i]));
+    };
+
+    if (want.has('title')) {
+        result.title = document.title;
+    }
+    if (want.has('html')) {
+        const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+        const root = document.documentElement;
+        result.html = clip('html', doctype + (root ? root.outerHTML : ''), maxHtmlChars);
+    }
+    if (want.has('text')) {
+        result.text = clip('text', document.body ? document.body.textContent : null, maxTextChars);
+    }
+    if (want.has('meta')) {
+        result.meta = collect('meta', 'meta', null, el => ({
+            name: el.name || el.getAttribute('property'),
+            content: el.content
+        }));
+    }
+    if (want.has('links')) {
+        result.links = collect('links', 'a', maxLinks, el => ({text: el.innerText, href: el.href}));
+    }
+    if (want.has('images')) {
+        result.images = collect('images', 'img', maxImages, el => ({src: el.src, alt: el.alt}));
+    }
+    if (Object.keys(truncated).length) {
+        result.truncated = truncated;
+    }
+    return result;
+}
+"""
+
+
+def validate_content_options(fields: Optional[List[str]] = None, max_links: Optional[int] = None,
+                             max_images: Optional[int] = None, max_text_chars: Optional[int] = None,
+                             max_html_chars: Optional[int] = None):
+    """Validate get_page_content field selection and limits, raising ValueError on bad input."""
+    if fields is not None:
+        if not isinstance(fields, list) or not fields:
+            raise ValueError("fields must be a non-empty list")
+        for field in fields:
+            if field not in CONTENT_FIELDS:
+                raise ValueError(f"fields entries must be one of {list(CONTENT_FIELDS)}, got {field!r}")
+    limits = {
+        "max_links": max_links,
+        "max_images": max_images,
+        "max_text_chars": max_text_chars,
+        "max_html_chars": max_html_chars,
+    }
+    for name, value in limits.items():
+        if value is None:
+            continue
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{name} must be an integer")
+        if value < 0:
+            raise ValueError(f"{name} must not be negative")
+
+
+async def _notify_progress(progress_callback, message: str):
+    """Send a progress update through a sync or async callback."""
+    if not progress_callback:
+        return
+    if asyncio.iscoroutinefunction(progress_callback):
+        await progress_callback(message)
+    else:
+        progress_callback(message)
+
 
 class BrowserService:
     """Encapsulates browser automation functionality using Playwright."""
@@ -17,41 +148,167 @@ class BrowserService:
     def __init__(self):
         self._playwright = None
         self._browser = None
-        self._pages = {}  # Store context information for different pages
+        self._context_pool: Optional[ContextPool] = None
+        self._pages: Dict[Page, BrowserContext] = {}  # Store context information for different pages
+        self._init_lock = asyncio.Lock()
+        self._page_slots = asyncio.Semaphore(max(1, BrowserServiceConfig.MAX_CONCURRENT_PAGES))
+        self._waiters = 0
+        self._page_cache = PageCache()
+        self._page_flights = SingleFlight()
+        self._subresource_cache = SubresourceCache()
 
     async def initialize(self):
-        """Initialize Playwright and launch browser."""
-        if self._playwright is None:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu',
-                    '--disable-web-security'
-                ]
-            )
+        """
+        Initialize Playwright, launch browser and warm up the context pool.
+
+        With MCP_BROWSER_CACHE_DIR set, the browser runs in a persistent profile
+        so its HTTP disk cache is kept across restarts (see browser_cache).
+        """
+        async with self._init_lock:
+            if self._playwright is not None:
+                return
+            playwright = await async_playwright().start()
+            args = [
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-accelerated-2d-canvas',
+                '--no-first-run',
+                '--no-zygote',
+                '--disable-gpu',
+                '--disable-web-security'
+            ]
+            try:
+                if browser_cache_enabled():
+                    # One persistent profile whose disk cache outlives the server; closing
+                    # its context closes the browser, so it stands in for the browser below
+                    browser = await playwright.chromium.launch_persistent_context(
+                        profile_dir("browser-service"), headless=True, args=args + disk_cache_args()
+                    )
+                    context_pool = SharedContextPool(browser)
+                else:
+                    browser = await playwright.chromium.launch(headless=True, args=args)
+                    context_pool = ContextPool(
+                        browser,
+                        size=BrowserServiceConfig.CONTEXT_POOL_SIZE,
+                        max_uses=BrowserServiceConfig.CONTEXT_MAX_USES
+                    )
+                await context_pool.start()
+            except Exception:
+                await playwright.stop()
+                raise
+            self._playwright = playwright
+            self._browser = browser
+            self._context_pool = context_pool
 
     async def close(self):
         """Close browser and cleanup resources."""
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        async with self._init_lock:
+            if self._context_pool:
+                await self._context_pool.close()
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+            self._context_pool = None
+            self._browser = None
+            self._playwright = None
+            self._pages.clear()
 
     async def _create_page_with_context(self) -> Page:
-        """Create a new browser page with context."""
+        """
+        Create a new browser page in a pooled context.
+
+        Waits for a free page slot first, so at most MAX_CONCURRENT_PAGES pages
+        are open at once. Every page must be handed back with _release_page.
+        With the subresource cache enabled, its route is attached first, so
+        per-call routes such as resource blocking run before it.
+        """
         if not self._browser:
             await self.initialize()
 
-        page = await self._browser.new_page()
+        self._waiters += 1
+        try:
+            await asyncio.wait_for(self._page_slots.acquire(), timeout=BrowserServiceConfig.PAGE_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"No browser page slot became available within {BrowserServiceConfig.PAGE_ACQUIRE_TIMEOUT} seconds"
+            )
+        finally:
+            self._waiters -= 1
+
+        try:
+            context = await self._context_pool.acquire()
+            try:
+                page = await context.new_page()
+                if self._subresource_cache.enabled:
+                    try:
+                        await self._subresource_cache.attach(page)
+                    except Exception:
+                        await page.close()
+                        raise
+            except Exception:
+                await self._context_pool.release(context)
+                raise
+        except BaseException:
+            self._page_slots.release()
+            raise
+
+        self._pages[page] = context
         return page
 
+    async def _release_page(self, page: Page):
+        """Close a page and return its context and page slot to the pool."""
+        context = self._pages.pop(page, None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+        finally:
+            if context is not None:
+                try:
+                    if self._context_pool:
+                        await self._context_pool.release(context)
+                finally:
+                    self._page_slots.release()
+
+    async def _cache_page(self, key: str, result: Dict[str, Any]):
+        # Error responses are not cached, so a retry reaches the site again
+        status = result.get("status")
+        if status is None or status < 400:
+            await self._page_cache.put(key, result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return page concurrency and context pool statistics."""
+        return {
+            "initialized": self._browser is not None,
+            "max_concurrent_pages": BrowserServiceConfig.MAX_CONCURRENT_PAGES,
+            "active_pages": len(self._pages),
+            "waiters": self._waiters,
+            "contexts": self._context_pool.stats() if self._context_pool else None,
+            "page_cache": self._page_cache.stats(),
+            "single_flight": self._page_flights.stats(),
+            "subresource_cache": self._subresource_cache.stats() if self._subresource_cache.enabled else None,
+        }
+
+    async def _extract_page_content(self, page: Page, fields: Optional[List[str]] = None,
+                                    max_links: Optional[int] = None, max_images: Optional[int] = None,
+                                    max_text_chars: Optional[int] = None,
+                                    max_html_chars: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Extract the requested content fields from a loaded page in one evaluation.
+
+        Fields default to all of CONTENT_FIELDS. A `truncated` entry maps every
+        field cut by a limit to its original length or element count.
+        """
+        return await page.evaluate(EXTRACT_CONTENT_SCRIPT, {
+            "fields": list(fields) if fields else list(CONTENT_FIELDS),
+            "maxLinks": max_links,
+            "maxImages": max_images,
+            "maxTextChars": max_text_chars,
+            "maxHtmlChars": max_html_chars,
+        })
+
     def _sanitize_url(self, url: str) -> str:
         """Sanitize URL to prevent potential security issues."""
         # Basic URL length check
@@ -82,23 +339,125 @@ class BrowserService:
         return url
 
     async def get_page_content(self, url: str, wait_for_selector: Optional[str] = None,
-                              wait_timeout: int = 30000, progress_callback=None) -> Dict[str, Any]:
+                              wait_timeout: int = 30000, progress_callback=None,
+                              fields: Optional[List[str]] = None, max_links: Optional[int] = None,
+                              max_images: Optional[int] = None, max_text_chars: Optional[int] = None,
+                              max_html_chars: Optional[int] = None,
+                              block_resources: Optional[Dict[str, Any]] = None,
+                              emulation: Optional[Any] = None,
+                              render: Optional[str] = None, max_age: Optional[float] = None,
+                              bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Get the content of a web page by the specified URL
 
+        Repeat calls are served from the page cache, and calls made while an
+        identical one is still loading share its result (see single_flight).
+
         Args:
             url: The URL of the target page
             wait_for_selector: Optional CSS selector to wait for a specific element to appear
             wait_timeout: Wait timeout time (milliseconds), default 30 seconds
             progress_callback: Optional callback function to report progress
+            fields: Content fields to return (see CONTENT_FIELDS), default all
+            max_links: Maximum number of links to return
+            max_images: Maximum number of images to return
+            max_text_chars: Maximum number of text characters to return
+            max_html_chars: Maximum number of HTML characters to return
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            render: "browser" loads the page in Chromium, "http" fetches and parses it without a
+                browser, "auto" fetches it over HTTP and uses the browser only if the page looks
+                like it needs JavaScript or its host was learned to (see http_render and
+                render_table). Default MCP_DEFAULT_RENDER
+            max_age: Only serve a cached result younger than this many seconds (see page_cache)
+            bypass_cache: Load the page even if a cached result exists; the new result is cached
 
         Returns:
             Dictionary containing page content
         """
-        page = None
         try:
             # Validate and clean URL
             sanitized_url = self._sanitize_url(url)
+            render = validate_render_mode(render)
+            if render == "http" and emulation is not None:
+                raise ValueError("emulation requires render \"browser\" or \"auto\"")
+            if render == "http" and block_resources is not None:
+                raise ValueError("block_resources requires render \"browser\" or \"auto\"")
+
+            # Serve a repeat call from the page cache instead of loading the page again
+            cache_key = page_cache_key(
+                sanitized_url, wait_for_selector=wait_for_selector,
+                fields=sorted(fields) if fields else None, max_links=max_links, max_images=max_images,
+                max_text_chars=max_text_chars, max_html_chars=max_html_chars,
+                block_resources=block_resources, emulation=emulation, render=render
+            )
+            if not bypass_cache:
+                cached = await self._page_cache.get(cache_key, max_age)
+                if cached is not None:
+                    result, age = cached
+                    await _notify_progress(progress_callback, "Serving cached page content...")
+                    result["cache"] = {"hit": True, "age_seconds": round(age, 3)}
+                    return result
+
+            # A call identical to one already loading this page waits for that load instead
+            if self._page_flights.in_flight(cache_key):
+                await _notify_progress(progress_callback, "Waiting for an identical call already loading this page...")
+            result, joined = await self._page_flights.run(cache_key, lambda: self._load_page_content(
+                sanitized_url, cache_key, wait_for_selector, wait_timeout, progress_callback,
+                fields, max_links, max_images, max_text_chars, max_html_chars,
+                block_resources, emulation, render
+            ))
+            return copy.deepcopy(result) if joined else result
+
+        except Exception as e:
+            if progress_callback:
+                if asyncio.iscoroutinefunction(progress_callback):
+                    await progress_callback(f"Error occurred during processing: {str(e)}")
+                else:
+                    progress_callback(f"Error occurred during processing: {str(e)}")
+            return {
+                "url": url,
+                "error": str(e),
+                "timestamp": asyncio.get_event_loop().time()
+            }
+
+    async def _load_page_content(self, sanitized_url: str, cache_key: str, wait_for_selector: Optional[str],
+                                 wait_timeout: int, progress_callback, fields: Optional[List[str]],
+                                 max_links: Optional[int], max_images: Optional[int],
+                                 max_text_chars: Optional[int], max_html_chars: Optional[int],
+                                 block_resources: Optional[Dict[str, Any]], emulation: Optional[Any],
+                                 render: str) -> Dict[str, Any]:
+        """Load a page for get_page_content, over HTTP or in the browser, and cache the result."""
+        page = None
+        try:
+            # Static pages are fetched and parsed without starting a browser page
+            render_info = None
+            fetched = None
+            if render != "browser":
+                if emulation is not None:
+                    reason = "emulation requested"
+                elif block_resources is not None:
+                    reason = "resource blocking requested"
+                else:
+                    reason = None
+                if reason is None:
+                    await _notify_progress(progress_callback, "Fetching page over HTTP...")
+                    fetched, reason = await fetch_for_render(sanitized_url, render, wait_for_selector)
+                if reason is None:
+                    await _notify_progress(progress_callback, "Extracting static content...")
+                    result = {
+                        "url": sanitized_url,
+                        "status": fetched.status,
+                        **await parse_off_loop(
+                            extract_static_content, fetched, fields, max_links, max_images,
+                            max_text_chars, max_html_chars
+                        ),
+                        "render": {"mode": "http"},
+                        "timestamp": asyncio.get_event_loop().time()
+                    }
+                    await self._cache_page(cache_key, result)
+                    return result
+                render_info = {"mode": "browser", "reason": reason}
 
             # Send progress update
             if progress_callback:
@@ -113,6 +472,12 @@ class BrowserService:
             # Set page load timeout
             page.set_default_timeout(wait_timeout)
 
+            # Abort blocked subresources before they reach the network
+            blocker = await attach_resource_blocker(page, block_resources)
+
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+
             # Visit page
             response = await page.goto(sanitized_url, wait_until="domcontentloaded")
 
@@ -148,38 +513,24 @@ class BrowserService:
                 else:
                     progress_callback("Extracting DOM content...")
 
-            # Get page title
-            title = await page.title()
-
-            # Get page HTML content
-            html_content = await page.content()
-
-            # Get page text content
-            text_content = await page.text_content('body')
-
-            # Get page metadata
-            meta_elements = await page.eval_on_selector_all('meta',
-                'elements => elements.map(el => ({name: el.name || el.property, content: el.content}))')
-
-            # Get page links
-            links = await page.eval_on_selector_all('a',
-                'elements => elements.map(el => ({text: el.innerText, href: el.href}))')
-
-            # Get page images
-            images = await page.eval_on_selector_all('img',
-                'elements => elements.map(el => ({src: el.src, alt: el.alt}))')
-
             result = {
                 "url": sanitized_url,
                 "status": response.status if response else None,
-                "title": title,
-                "html": html_content,
-                "text": text_content,
-                "meta": meta_elements,
-                "links": links,
-                "images": images,
+                **await self._extract_page_content(
+                    page, fields, max_links, max_images, max_text_chars, max_html_chars
+                ),
                 "timestamp": asyncio.get_event_loop().time()
             }
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
+            if render_info is not None:
+                # Compare the fetched document with the rendered DOM so the host's renderer is learned
+                if fetched is not None and fetched.is_html:
+                    render_info.update(await learn_render(sanitized_url, fetched.html, await page.content()))
+                result["render"] = render_info
+            await self._cache_page(cache_key, result)
 
             # Send progress update
             if progress_callback:
@@ -197,16 +548,23 @@ class BrowserService:
                 else:
                     progress_callback(f"Error occurred during processing: {str(e)}")
             return {
-                "url": url,
+                "url": sanitized_url,
                 "error": str(e),
                 "timestamp": asyncio.get_event_loop().time()
             }
         finally:
             if page:
-                await page.close()
+                await self._release_page(page)
 
     async def get_console_messages(self, url: str, wait_for_selector: Optional[str] = None,
-                                  wait_timeout: int = 30000, progress_callback=None) -> Dict[str, Any]:
+                                  wait_timeout: int = 30000, progress_callback=None,
+                                  settle_quiet_ms: Optional[int] = None,
+                                  settle_max_ms: Optional[int] = None,
+                                  block_resources: Optional[Dict[str, Any]] = None,
+                                  emulation: Optional[Any] = None,
+                                  levels: Optional[List[str]] = None,
+                                  max_messages: Optional[int] = None,
+                                  dedupe: bool = True) -> Dict[str, Any]:
         """
         Get console messages from the specified page
 
@@ -215,47 +573,24 @@ class BrowserService:
             wait_for_selector: Optional CSS selector to wait for a specific element to appear
             wait_timeout: Wait timeout time (milliseconds), default 30 seconds
             progress_callback: Optional callback function to report progress
+            settle_quiet_ms: Return once the page has been quiet this long (milliseconds)
+            settle_max_ms: Upper bound for the settle wait (milliseconds)
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            levels: Console message types to keep, e.g. ["error", "warning", "pageerror"]; default all
+            max_messages: Maximum number of distinct messages kept; later ones are only counted
+            dedupe: Collapse identical messages into one record with a repeat count
 
         Returns:
             Dictionary containing console messages
         """
         page = None
-        console_messages = []
-
-        def handle_console_msg(msg):
-            """Callback function to handle console messages"""
-            try:
-                # Get message type and text
-                message_type = msg.type
-                text = msg.text
-                location = {
-                    "url": msg.page.url if msg.page else "unknown",
-                    "line_number": getattr(msg, 'line_number', 0),
-                    "column_number": getattr(msg, 'column_number', 0)
-                }
-
-                # If message includes error stack, try to get it
-                stack = getattr(msg, 'stack', None)
-
-                console_messages.append({
-                    "type": message_type,
-                    "text": text,
-                    "location": location,
-                    "stack": stack,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
-            except Exception as e:
-                console_messages.append({
-                    "type": "error",
-                    "text": f"Error processing console message: {str(e)}",
-                    "location": {},
-                    "stack": None,
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+        console = ConsoleCapture(levels=levels, max_messages=max_messages, dedupe=dedupe)
 
         try:
             # Validate and clean URL
             sanitized_url = self._sanitize_url(url)
+            settle_quiet_ms, settle_max_ms = validate_settle_options(settle_quiet_ms, settle_max_ms)
 
             # Send progress update
             if progress_callback:
@@ -270,8 +605,15 @@ class BrowserService:
             # Set page load timeout
             page.set_default_timeout(wait_timeout)
 
-            # Listen for console messages
-            page.on("console", handle_console_msg)
+            # Abort blocked subresources before they reach the network
+            blocker = await attach_resource_blocker(page, block_resources)
+
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+
+            # Listen for console messages and uncaught page errors
+            console.attach(page)
+            activity = ActivityMonitor(page)
 
             # Visit page
             response = await page.goto(sanitized_url, wait_until="domcontentloaded")
@@ -300,20 +642,21 @@ class BrowserService:
                         else:
                             progress_callback("Waiting for selector timed out, continuing processing...")
 
-            # Wait extra time to capture more console messages
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Capturing console messages...")
-                else:
-                    progress_callback("Capturing console messages...")
-            await page.wait_for_timeout(3000)
+            # Wait until the page goes quiet to capture late console messages
+            await _notify_progress(progress_callback, "Capturing console messages...")
+            settle = await activity.wait(settle_quiet_ms, settle_max_ms)
 
             result = {
                 "url": sanitized_url,
                 "status": response.status if response else None,
-                "console_messages": console_messages,
+                **console.result(),
+                "settle": settle,
                 "timestamp": asyncio.get_event_loop().time()
             }
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
 
             # Send progress update
             if progress_callback:
@@ -333,15 +676,28 @@ class BrowserService:
             return {
                 "url": url,
                 "error": str(e),
-                "console_messages": console_messages,  # Return collected messages even if error occurs
+                **console.result(),  # Return collected messages even if error occurs
                 "timestamp": asyncio.get_event_loop().time()
             }
         finally:
             if page:
-                await page.close()
+                await self._release_page(page)
 
     async def get_network_requests(self, url: str, wait_for_selector: Optional[str] = None,
-                                  wait_timeout: int = 30000, progress_callback=None) -> Dict[str, Any]:
+                                  wait_timeout: int = 30000, progress_callback=None,
+                                  settle_quiet_ms: Optional[int] = None,
+                                  settle_max_ms: Optional[int] = None,
+                                  block_resources: Optional[Dict[str, Any]] = None,
+                                  emulation: Optional[Any] = None,
+                                  capture_mode: Optional[str] = None,
+                                  max_records: Optional[int] = None,
+                                  include_headers: Optional[List[str]] = None,
+                                  summary_only: bool = False,
+                                  export_path: Optional[str] = None,
+                                  export_format: Optional[str] = None,
+                                  include_bodies: bool = False,
+                                  max_body_bytes: Optional[int] = None,
+                                  body_content_types: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get a list of all network requests made when loading the specified page
 
@@ -350,60 +706,40 @@ class BrowserService:
             wait_for_selector: Optional CSS selector to wait for a specific element to appear
             wait_timeout: Wait timeout time (milliseconds), default 30 seconds
             progress_callback: Optional callback function to report progress
+            settle_quiet_ms: Return once the page has been quiet this long (milliseconds)
+            settle_max_ms: Upper bound for the settle wait (milliseconds)
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            capture_mode: "passive" (default) records requests from page events without delaying them;
+                "intercept" routes every request through a handler before it is sent
+            max_records: Maximum number of request records returned; the oldest are dropped first
+            include_headers: Request and response headers kept in records, ["*"] for all
+            summary_only: Return only the per-domain and per-resource-type summary
+            export_path: Stream every request to this HAR/NDJSON file instead of returning records;
+                the result then holds only the export report and the summary
+            export_format: "har" (default) or "ndjson"
+            include_bodies: Whether to export response bodies
+            max_body_bytes: Response bodies larger than this are left out of the export
+            body_content_types: Content type prefixes whose bodies are exported
 
         Returns:
             Dictionary containing network request information
         """
         page = None
-        requests_list = []
-        responses_list = []
-
-        async def handle_request(route):
-            """Callback function to handle requests"""
-            try:
-                request = route.request
-                request_info = {
-                    "url": request.url,
-                    "method": request.method,
-                    "resource_type": request.resource_type,
-                    "frame_url": request.frame.url if request.frame else None,
-                    "headers": dict(request.headers),
-                    "timestamp": asyncio.get_event_loop().time()
-                }
-                requests_list.append(request_info)
-                # Continue with the request
-                await route.continue_()
-            except Exception as e:
-                requests_list.append({
-                    "error": f"Error processing request: {str(e)}",
-                    "timestamp": asyncio.get_event_loop().time()
-                })
-                await route.continue_()
-
-        def handle_response(response):
-            """Callback function to handle responses"""
-            try:
-                response_info = {
-                    "url": response.url,
-                    "status": response.status,
-                    "status_text": response.status_text,
-                    "headers": dict(response.headers),
-                    "request_headers": dict(response.request.headers) if response.request else {},
-                    "content_type": response.headers.get('content-type', ''),
-                    "content_length": response.headers.get('content-length', ''),
-                    "timestamp": asyncio.get_event_loop().time()
-                }
-                responses_list.append(response_info)
-            except Exception as e:
-                responses_list.append({
-                    "error": f"Error processing response: {str(e)}",
-                    "url": response.url if response else "unknown",
-                    "timestamp": asyncio.get_event_loop().time()
-                })
+        capture = None
+        exporter = None
 
         try:
             # Validate and clean URL
             sanitized_url = self._sanitize_url(url)
+            settle_quiet_ms, settle_max_ms = validate_settle_options(settle_quiet_ms, settle_max_ms)
+            # Exported traffic goes to disk, so only the summary is kept in memory
+            capture = NetworkCapture(capture_mode or "passive", max_records, include_headers,
+                                     summary_only or export_path is not None)
+            if export_path is not None:
+                exporter = TrafficExporter(export_path, export_format, include_bodies,
+                                           max_body_bytes, body_content_types)
+                await exporter.open()
 
             # Send progress update
             if progress_callback:
@@ -418,14 +754,21 @@ class BrowserService:
             # Set page load timeout
             page.set_default_timeout(wait_timeout)
 
-            # Enable request interception to capture requests
-            await page.route("**/*", handle_request)
+            # Start capturing requests and responses
+            await capture.attach(page)
+            if exporter is not None:
+                exporter.attach(page)
 
-            # Listen for responses
-            page.on("response", handle_response)
+            # Registered after an intercept route so it runs first; blocked requests are not
+            # recorded in intercept mode
+            blocker = await attach_resource_blocker(page, block_resources)
 
-            # Visit page
-            response = await page.goto(sanitized_url, wait_until="networkidle")
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+            activity = ActivityMonitor(page)
+
+            # Visit page; late requests are picked up by the settle wait below
+            response = await page.goto(sanitized_url, wait_until="load")
 
             # Send progress update
             if progress_callback:
@@ -451,23 +794,25 @@ class BrowserService:
                         else:
                             progress_callback("Waiting for selector timed out, continuing processing...")
 
-            # Wait extra time to capture more network requests
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Capturing network requests...")
-                else:
-                    progress_callback("Capturing network requests...")
-            await page.wait_for_timeout(3000)
+            # Wait until the network goes quiet to capture late requests
+            await _notify_progress(progress_callback, "Capturing network requests...")
+            settle = await activity.wait(settle_quiet_ms, settle_max_ms)
 
             result = {
                 "url": sanitized_url,
                 "status": response.status if response else None,
-                "requests": requests_list,
-                "responses": responses_list,
-                "total_requests": len(requests_list),
-                "total_responses": len(responses_list),
+                "capture_mode": capture.mode,
+                **capture.result(),
+                "settle": settle,
                 "timestamp": asyncio.get_event_loop().time()
             }
+            if exporter is not None:
+                await _notify_progress(progress_callback, "Finishing traffic export...")
+                result["export"] = await exporter.close(await page.title())
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
 
             # Send progress update
             if progress_callback:
@@ -487,24 +832,386 @@ class BrowserService:
             return {
                 "url": url,
                 "error": str(e),
-                "requests": requests_list,
-                "responses": responses_list,
-                "total_requests": len(requests_list),
-                "total_responses": len(responses_list),
+                # Return collected requests even if error occurs
+                **(capture or NetworkCapture()).result(),
+                **({"export": exporter.report()} if exporter is not None else {}),
+                "timestamp": asyncio.get_event_loop().time()
+            }
+        finally:
+            # Stop the export writer before the page and its response bodies go away
+            if exporter is not None:
+                await exporter.abort()
+            if page:
+                await self._release_page(page)
+
+    async def inspect_page(self, url: str, wait_for_selector: Optional[str] = None,
+                           wait_timeout: int = 30000, include_content: bool = True,
+                           include_console: bool = True, include_network: bool = True,
+                           progress_callback=None, fields: Optional[List[str]] = None,
+                           max_links: Optional[int] = None, max_images: Optional[int] = None,
+                           max_text_chars: Optional[int] = None,
+                           max_html_chars: Optional[int] = None,
+                           settle_quiet_ms: Optional[int] = None,
+                           settle_max_ms: Optional[int] = None,
+                           block_resources: Optional[Dict[str, Any]] = None,
+                           emulation: Optional[Any] = None,
+                           max_records: Optional[int] = None,
+                           include_headers: Optional[List[str]] = None,
+                           summary_only: bool = False,
+                           levels: Optional[List[str]] = None,
+                           max_messages: Optional[int] = None,
+                           dedupe: bool = True) -> Dict[str, Any]:
+        """
+        Load a page once and return any combination of its content, console messages and network traffic
+
+        Args:
+            url: The URL of the target page
+            wait_for_selector: Optional CSS selector to wait for a specific element to appear
+            wait_timeout: Wait timeout time (milliseconds), default 30 seconds
+            include_content: Whether to extract the page content (as get_page_content)
+            include_console: Whether to capture console messages (as get_console_messages)
+            include_network: Whether to capture network requests and responses (as get_network_requests)
+            progress_callback: Optional callback function to report progress
+            fields, max_links, max_images, max_text_chars, max_html_chars:
+                Content field selection and limits, as for get_page_content
+            settle_quiet_ms, settle_max_ms:
+                Settle wait for console and network capture, as for get_network_requests
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            max_records, include_headers, summary_only:
+                Network record caps and header selection, as for get_network_requests
+            levels, max_messages, dedupe:
+                Console type filter, cap and deduplication, as for get_console_messages
+
+        Returns:
+            Dictionary containing the selected parts of the page
+        """
+        page = None
+        console = None
+        capture = None
+
+        def partial_result() -> Dict[str, Any]:
+            """Collected console and network data, included even if an error occurs"""
+            result = {}
+            if include_console and console is not None:
+                result.update(console.result())
+            if include_network and capture is not None:
+                result.update(capture.result())
+            return result
+
+        try:
+            # Validate and clean URL
+            sanitized_url = self._sanitize_url(url)
+            settle_quiet_ms, settle_max_ms = validate_settle_options(settle_quiet_ms, settle_max_ms)
+            console = ConsoleCapture(levels=levels, max_messages=max_messages, dedupe=dedupe)
+            capture = NetworkCapture(max_records=max_records, include_headers=include_headers,
+                                     summary_only=summary_only)
+
+            await _notify_progress(progress_callback, "Opening page for inspection...")
+
+            # Create new page
+            page = await self._create_page_with_context()
+
+            # Set page load timeout
+            page.set_default_timeout(wait_timeout)
+
+            # Abort blocked subresources before they reach the network
+            blocker = await attach_resource_blocker(page, block_resources)
+
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+
+            # Attach every listener before the single navigation
+            if include_console:
+                console.attach(page)
+            if include_network:
+                # Passive capture does not hold requests back, unlike route interception
+                await capture.attach(page)
+            activity = ActivityMonitor(page)
+
+            # Visit page
+            response = await page.goto(
+                sanitized_url,
+                wait_until="load" if include_network else "domcontentloaded"
+            )
+
+            await _notify_progress(progress_callback, "Page loaded, waiting for selector...")
+
+            # If selector is specified, wait for it to appear
+            if wait_for_selector:
+                try:
+                    await page.wait_for_selector(wait_for_selector, state="visible", timeout=wait_timeout)
+                    await _notify_progress(progress_callback, "Selector element found...")
+                except:
+                    # If wait times out, continue getting content
+                    await _notify_progress(progress_callback, "Waiting for selector timed out, continuing processing...")
+
+            # Wait until the page goes quiet to capture late console messages and requests
+            settle = None
+            if include_console or include_network:
+                await _notify_progress(progress_callback, "Capturing console messages and network requests...")
+                settle = await activity.wait(settle_quiet_ms, settle_max_ms)
+
+            result = {
+                "url": sanitized_url,
+                "status": response.status if response else None,
+            }
+            if settle is not None:
+                result["settle"] = settle
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
+            if include_content:
+                await _notify_progress(progress_callback, "Extracting DOM content...")
+                result["content"] = await self._extract_page_content(
+                    page, fields, max_links, max_images, max_text_chars, max_html_chars
+                )
+            result.update(partial_result())
+            result["timestamp"] = asyncio.get_event_loop().time()
+
+            await _notify_progress(progress_callback, "Page inspection completed...")
+
+            return result
+
+        except Exception as e:
+            await _notify_progress(progress_callback, f"Error occurred during processing: {str(e)}")
+            return {
+                "url": url,
+                "error": str(e),
+                **partial_result(),
                 "timestamp": asyncio.get_event_loop().time()
             }
         finally:
             if page:
-                await page.close()
+                await self._release_page(page)
+
+    async def get_page_performance(self, url: str, wait_for_selector: Optional[str] = None,
+                                   wait_timeout: int = 30000, progress_callback=None,
+                                   settle_quiet_ms: Optional[int] = None,
+                                   settle_max_ms: Optional[int] = None,
+                                   block_resources: Optional[Dict[str, Any]] = None,
+                                   emulation: Optional[Any] = None,
+                                   slowest_resources: int = 10) -> Dict[str, Any]:
+        """
+        Load a page once and report its Navigation Timing, paint, LCP, CLS, long task and resource timing data
+
+        Args:
+            url: The URL of the target page
+            wait_for_selector: Optional CSS selector to wait for a specific element to appear
+            wait_timeout: Wait timeout time (milliseconds), default 30 seconds
+            progress_callback: Optional callback function to report progress
+            settle_quiet_ms, settle_max_ms:
+                Settle wait after the load event, as for get_network_requests, so late LCP
+                candidates, layout shifts and long tasks are observed
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            slowest_resources: Number of slowest resources listed individually
+
+        Returns:
+            Dictionary containing the performance report
+        """
+        page = None
+        try:
+            # Validate and clean URL
+            sanitized_url = self._sanitize_url(url)
+            settle_quiet_ms, settle_max_ms = validate_settle_options(settle_quiet_ms, settle_max_ms)
+
+            await _notify_progress(progress_callback, "Opening page to measure performance...")
+
+            # Create new page
+            page = await self._create_page_with_context()
+
+            # Set page load timeout
+            page.set_default_timeout(wait_timeout)
+
+            # Abort blocked subresources before they reach the network
+            blocker = await attach_resource_blocker(page, block_resources)
+
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+
+            # Observers must be installed before any page script runs
+            await page.add_init_script(PERFORMANCE_OBSERVER_SCRIPT)
+            activity = ActivityMonitor(page)
+
+            # Visit page
+            response = await page.goto(sanitized_url, wait_until="load")
+
+            await _notify_progress(progress_callback, "Page loaded, waiting for selector...")
+
+            # If selector is specified, wait for it to appear
+            if wait_for_selector:
+                try:
+                    await page.wait_for_selector(wait_for_selector, state="visible", timeout=wait_timeout)
+                    await _notify_progress(progress_callback, "Selector element found...")
+                except:
+                    # If wait times out, continue measuring
+                    await _notify_progress(progress_callback, "Waiting for selector timed out, continuing processing...")
+
+            # Let late paints, layout shifts and long tasks be observed
+            await _notify_progress(progress_callback, "Collecting performance entries...")
+            settle = await activity.wait(settle_quiet_ms, settle_max_ms)
+
+            raw = await page.evaluate(COLLECT_PERFORMANCE_SCRIPT)
+            result = {
+                "url": sanitized_url,
+                "status": response.status if response else None,
+                **build_performance_report(raw, slowest_resources),
+                "settle": settle,
+                "timestamp": asyncio.get_event_loop().time()
+            }
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
+
+            await _notify_progress(progress_callback, "Performance measurement completed...")
+
+            return result
+
+        except Exception as e:
+            await _notify_progress(progress_callback, f"Error occurred during processing: {str(e)}")
+            return {
+                "url": url,
+                "error": str(e),
+                "timestamp": asyncio.get_event_loop().time()
+            }
+        finally:
+            if page:
+                await self._release_page(page)
+
+    async def get_code_coverage(self, url: str, wait_for_selector: Optional[str] = None,
+                                wait_timeout: int = 30000, progress_callback=None,
+                                settle_quiet_ms: Optional[int] = None,
+                                settle_max_ms: Optional[int] = None,
+                                block_resources: Optional[Dict[str, Any]] = None,
+                                emulation: Optional[Any] = None,
+                                max_entries: int = 20) -> Dict[str, Any]:
+        """
+        Load a page once and report how many bytes of each script and stylesheet were actually used
+
+        Args:
+            url: The URL of the target page
+            wait_for_selector: Optional CSS selector to wait for a specific element to appear
+            wait_timeout: Wait timeout time (milliseconds), default 30 seconds
+            progress_callback: Optional callback function to report progress
+            settle_quiet_ms, settle_max_ms:
+                Settle wait after the load event, as for get_network_requests, so code run by
+                late timers and lazily added styles is counted
+            block_resources: Optional resource types, hosts and URL patterns to block (see resource_blocking)
+            emulation: Optional network, CPU and device emulation profiles or settings (see emulation)
+            max_entries: Number of scripts and stylesheets listed, worst offenders first
+
+        Returns:
+            Dictionary containing the coverage report
+        """
+        page = None
+        cdp = None
+        try:
+            # Validate and clean URL
+            sanitized_url = self._sanitize_url(url)
+            settle_quiet_ms, settle_max_ms = validate_settle_options(settle_quiet_ms, settle_max_ms)
+
+            await _notify_progress(progress_callback, "Opening page to measure code coverage...")
+
+            # Create new page
+            page = await self._create_page_with_context()
+
+            # Set page load timeout
+            page.set_default_timeout(wait_timeout)
+
+            # Abort blocked subresources before they reach the network
+            blocker = await attach_resource_blocker(page, block_resources)
+
+            # Throttle network and CPU and emulate the device before the page starts loading
+            emulated = await apply_emulation(page, emulation)
+
+            # Coverage must be running before the first script is parsed
+            cdp = await page.context.new_cdp_session(page)
+            collector = CoverageCollector(cdp)
+            await collector.start()
+            activity = ActivityMonitor(page)
+
+            # Visit page
+            response = await page.goto(sanitized_url, wait_until="load")
+
+            await _notify_progress(progress_callback, "Page loaded, waiting for selector...")
+
+            # If selector is specified, wait for it to appear
+            if wait_for_selector:
+                try:
+                    await page.wait_for_selector(wait_for_selector, state="visible", timeout=wait_timeout)
+                    await _notify_progress(progress_callback, "Selector element found...")
+                except:
+                    # If wait times out, continue measuring
+                    await _notify_progress(progress_callback, "Waiting for selector timed out, continuing processing...")
+
+            # Let timers and late-loaded code run before taking coverage
+            await _notify_progress(progress_callback, "Collecting coverage...")
+            settle = await activity.wait(settle_quiet_ms, settle_max_ms)
+
+            scripts, stylesheets = await collector.stop()
+            result = {
+                "url": sanitized_url,
+                "status": response.status if response else None,
+                **build_coverage_report(scripts, stylesheets, max_entries),
+                "settle": settle,
+                "timestamp": asyncio.get_event_loop().time()
+            }
+            if blocker is not None:
+                result["blocked_resources"] = blocker.stats()
+            if emulated is not None:
+                result["emulation"] = emulated
+
+            await _notify_progress(progress_callback, "Code coverage measurement completed...")
+
+            return result
+
+        except Exception as e:
+            await _notify_progress(progress_callback, f"Error occurred during processing: {str(e)}")
+            return {
+                "url": url,
+                "error": str(e),
+                "timestamp": asyncio.get_event_loop().time()
+            }
+        finally:
+            if cdp is not None:
+                try:
+                    await cdp.detach()
+                except Exception:
+                    pass
+            if page:
+                await self._release_page(page)
 
 
 # Global browser service instance
 _browser_service = None
+_browser_service_lock = asyncio.Lock()
 
 async def get_browser_service():
     """Get the browser service instance"""
     global _browser_service
+    # The lock makes concurrent first calls share one browser instead of launching several
+    async with _browser_service_lock:
+        if _browser_service is None:
+            service = BrowserService()
+            await service.initialize()
+            _browser_service = service
+    return _browser_service
+
+
+def get_browser_service_stats() -> Dict[str, Any]:
+    """Get browser service statistics without launching a browser."""
     if _browser_service is None:
-        _browser_service = BrowserService()
-        await _browser_service.initialize()
-    return _browser_service
\ No newline at end of file
+        return {"initialized": False}
+    return _browser_service.get_stats()
+
+
+async def close_browser_service():
+    """Close the browser service instance if it was started."""
+    global _browser_service
+    async with _browser_service_lock:
+        if _browser_service is not None:
+            await _browser_service.close()
+            _browser_service = None
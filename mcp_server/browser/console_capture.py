@@ -0,0 +1,164 @@
+"""
+Console capture for browser pages.
+
+Console messages and uncaught page errors ("pageerror") are recorded as they
+arrive, filtered by type, with identical messages (same type, text and
+source location) collapsed into one record carrying a repeat count. At most
+`max_messages` distinct records are kept and message text is clipped, so a
+page that logs in a loop cannot grow the capture or the response without
+bound; per-type counts still cover every message seen.
+"""
+
+import asyncio
+import hashlib
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+
+class ConsoleCaptureConfig:
+    """Configuration for console capture."""
+
+    # Maximum number of distinct console records kept per page
+    MAX_MESSAGES = int(os.getenv("MCP_CONSOLE_MAX_MESSAGES", "1000"))
+
+    # Console message text and stacks longer than this are clipped
+    MAX_TEXT_CHARS = int(os.getenv("MCP_CONSOLE_MAX_TEXT_CHARS", "2000"))
+
+
+# Playwright console message types, plus "pageerror" for uncaught exceptions
+CONSOLE_TYPES = (
+    "log", "debug", "info", "error", "warning", "dir", "dirxml", "table", "trace",
+    "clear", "startGroup", "startGroupCollapsed", "endGroup", "assert",
+    "profile", "profileEnd", "count", "timeEnd", "pageerror",
+)
+
+
+def validate_console_options(levels: Optional[List[str]] = None, max_messages: Optional[int] = None,
+                             dedupe: Optional[bool] = None):
+    """
+    Validate console type filters and caps.
+
+    Raises:
+        ValueError: If an option has the wrong type or value
+    """
+    if levels is not None:
+        if not isinstance(levels, list) or not all(isinstance(level, str) for level in levels):
+            raise ValueError("levels must be a list of console message types")
+        invalid = [level for level in levels if level not in CONSOLE_TYPES]
+        if invalid:
+            raise ValueError(
+                f"Invalid console message types: {', '.join(invalid)}. Valid types: {', '.join(CONSOLE_TYPES)}"
+            )
+    if max_messages is not None:
+        if not isinstance(max_messages, int) or isinstance(max_messages, bool):
+            raise ValueError("max_messages must be an integer")
+        if max_messages < 0 or max_messages > 100000:
+            raise ValueError("max_messages must be between 0 and 100000")
+    if dedupe is not None and not isinstance(dedupe, bool):
+        raise ValueError("dedupe must be a boolean")
+
+
+def _clip(text: Optional[str], limit: int) -> Optional[str]:
+    if text is not None and len(text) > limit:
+        return text[:limit] + f"... [{len(text) - limit} more characters]"
+    return text
+
+
+class ConsoleCapture:
+    """Collects filtered, deduplicated and bounded console records for one page."""
+
+    def __init__(self, levels: Optional[List[str]] = None, max_messages: Optional[int] = None,
+                 dedupe: bool = True, max_text_chars: Optional[int] = None):
+        self.levels = frozenset(levels) if levels else None
+        self.max_messages = ConsoleCaptureConfig.MAX_MESSAGES if max_messages is None else max_messages
+        self.dedupe = dedupe
+        self.max_text_chars = ConsoleCaptureConfig.MAX_TEXT_CHARS if max_text_chars is None else max_text_chars
+        self._loop = asyncio.get_event_loop()
+        self.records: List[Dict[str, Any]] = []
+        # Dedupe key -> record, for the records kept
+        self._seen: Dict[Tuple, Dict[str, Any]] = {}
+        self.total_messages = 0
+        self.dropped_messages = 0
+        self._by_type: Dict[str, int] = {}
+
+    def attach(self, page: Page):
+        """Start capturing; call before navigation."""
+        page.on("console", self._on_console)
+        page.on("pageerror", self._on_page_error)
+
+    def _wanted(self, message_type: str) -> bool:
+        self.total_messages += 1
+        self._by_type[message_type] = self._by_type.get(message_type, 0) + 1
+        return self.levels is None or message_type in self.levels
+
+    def _add(self, message_type: str, text: str, location: Dict[str, Any], stack: Optional[str]):
+        # A digest stands in for the text, so the kept keys stay small however long the messages are
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (message_type, digest, location.get("url"), location.get("line_number"), location.get("column_number"))
+        if self.dedupe:
+            record = self._seen.get(key)
+            if record is not None:
+                record["count"] += 1
+                record["last_timestamp"] = self._loop.time()
+                return
+        if len(self.records) >= self.max_messages:
+            self.dropped_messages += 1
+            return
+
+        record = {
+            "type": message_type,
+            "text": _clip(text, self.max_text_chars),
+            "location": location,
+            "stack": _clip(stack, self.max_text_chars),
+            "timestamp": self._loop.time(),
+        }
+        if self.dedupe:
+            record["count"] = 1
+            record["last_timestamp"] = record["timestamp"]
+            self._seen[key] = record
+        self.records.append(record)
+
+    def _on_console(self, msg):
+        try:
+            message_type = msg.type
+            if not self._wanted(message_type):
+                return
+            source = msg.location or {}
+            location = {
+                "url": source.get("url") or (msg.page.url if msg.page else "unknown"),
+                "line_number": source.get("lineNumber", 0),
+                "column_number": source.get("columnNumber", 0),
+            }
+            self._add(message_type, msg.text, location, None)
+        except Exception as e:
+            self._add("error", f"Error processing console message: {str(e)}", {}, None)
+
+    def _on_page_error(self, error):
+        if not self._wanted("pageerror"):
+            return
+        try:
+            name = getattr(error, "name", None) or "Error"
+            text = f"{name}: {error.message}"
+            stack = getattr(error, "stack", None)
+        except Exception as e:
+            text, stack = f"Error processing page error: {str(e)}", None
+        self._add("pageerror", text, {}, stack)
+
+    def summary(self) -> Dict[str, Any]:
+        """Message counts per type, and how many records were kept or dropped."""
+        return {
+            "total": self.total_messages,
+            "by_type": dict(self._by_type),
+            "records": len(self.records),
+            "dropped": self.dropped_messages,
+            "truncated": self.dropped_messages > 0,
+        }
+
+    def result(self) -> Dict[str, Any]:
+        """The capture in the shape returned by get_console_messages."""
+        return {
+            "console_messages": list(self.records),
+            "console_summary": self.summary(),
+        }
@@ -0,0 +1,141 @@
+"""
+Pool of reusable Playwright browser contexts for the browser service.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict
+
+from playwright.async_api import Browser, BrowserContext
+
+
+class ContextPool:
+    """
+    Keeps pre-created BrowserContexts warm and hands them out one page at a time.
+
+    Contexts are reset (cookies, permissions, leftover pages) before they go back
+    to the pool and are recycled after `max_uses` checkouts so that storage which
+    cannot be cleared cheaply (localStorage, IndexedDB, HTTP cache) does not leak
+    between unrelated calls for long. When every pooled context is busy a
+    temporary context is created and closed again on release.
+    """
+
+    def __init__(self, browser: Browser, size: int, max_uses: int = 50):
+        self._browser = browser
+        self._size = max(1, size)
+        self._max_uses = max(1, max_uses)
+        self._idle: Deque[BrowserContext] = deque()
+        self._uses: Dict[BrowserContext, int] = {}
+        self._in_use = 0
+        self._created = 0
+        self._recycled = 0
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self._browser.new_context()
+        self._uses[context] = 0
+        self._created += 1
+        return context
+
+    async def _discard(self, context: BrowserContext):
+        self._uses.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            logging.warning(f"Error closing browser context: {e}")
+
+    async def start(self):
+        """Pre-create the pooled contexts."""
+        while len(self._idle) < self._size:
+            self._idle.append(await self._new_context())
+
+    async def acquire(self) -> BrowserContext:
+        """Take an idle context, or create one if all of them are busy."""
+        context = self._idle.popleft() if self._idle else await self._new_context()
+        self._uses[context] = self._uses.get(context, 0) + 1
+        self._in_use += 1
+        return context
+
+    async def release(self, context: BrowserContext):
+        """Reset a context and return it to the pool, or close it if it is worn out or surplus."""
+        self._in_use -= 1
+
+        if self._uses.get(context, 0) >= self._max_uses or len(self._idle) >= self._size:
+            self._recycled += 1
+            await self._discard(context)
+            return
+
+        try:
+            for page in list(context.pages):
+                await page.close()
+            await context.clear_cookies()
+            await context.clear_permissions()
+        except Exception as e:
+            logging.warning(f"Failed to reset browser context, discarding it: {e}")
+            await self._discard(context)
+            return
+
+        self._idle.append(context)
+
+    async def close(self):
+        """Close every context owned by the pool."""
+        contexts = list(self._uses.keys())
+        self._idle.clear()
+        for context in contexts:
+            await self._discard(context)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current pool usage."""
+        return {
+            "size": self._size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "created": self._created,
+            "recycled": self._recycled,
+        }
+
+
+class SharedContextPool:
+    """
+    Hands out the single context of a persistent browser profile.
+
+    A browser launched with a user data directory has exactly one context, so
+    every page shares it, along with its disk cache. Cookies are cleared
+    whenever the last page is released, so calls that do not overlap do not
+    see each other's sessions; localStorage and IndexedDB are kept.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+        self._in_use = 0
+
+    async def start(self):
+        """Drop cookies left over from the previous run."""
+        await self._context.clear_cookies()
+
+    async def acquire(self) -> BrowserContext:
+        """Return the shared context."""
+        self._in_use += 1
+        return self._context
+
+    async def release(self, context: BrowserContext):
+        """Note that a page was released, and clear cookies once no page is open."""
+        self._in_use -= 1
+        if self._in_use == 0:
+            try:
+                await self._context.clear_cookies()
+            except Exception as e:
+                logging.warning(f"Failed to clear cookies of the persistent context: {e}")
+
+    async def close(self):
+        """Nothing to close: the context closes with its browser."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current pool usage."""
+        return {
+            "size": 1,
+            "in_use": self._in_use,
+            "idle": 0 if self._in_use else 1,
+            "created": 1,
+            "recycled": 0,
+            "persistent": True,
+        }
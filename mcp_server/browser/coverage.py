@@ -0,0 +1,196 @@
+"""
+JavaScript and CSS code coverage through the Chrome DevTools Protocol.
+
+Playwright's Python API has no coverage helper, so CoverageCollector drives
+the CDP Profiler (precise block coverage) and CSS (rule usage tracking)
+domains directly on a page's CDP session. Coverage is started before
+navigation and collected once the load has settled; the report gives total
+and used bytes per script and stylesheet, ranked by unused bytes.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]]) -> int:
+    """Total length covered by possibly overlapping [start, end) ranges."""
+    covered = 0
+    current_start = current_end = None
+    for start, end in sorted(ranges):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        covered += current_end - current_start
+    return covered
+
+
+def js_used_ranges(functions: List[Dict[str, Any]]) -> List[Tuple[int, int]]:
+    """
+    Flatten V8 block coverage into the [start, end) ranges that executed.
+
+    V8 reports nested ranges per function, where an inner range overrides the
+    count of the range enclosing it. Sweeping over all range boundaries with a
+    stack of open ranges gives disjoint segments whose count is that of the
+    innermost range, as Puppeteer's JSCoverage does.
+    """
+    points = []
+    for function in functions:
+        for r in function.get("ranges", []):
+            points.append((r["startOffset"], 0, r))
+            points.append((r["endOffset"], 1, r))
+    # Starts before ends at the same offset, which is harmless: no segment lies between points at
+    # one offset, and an end removes its own range wherever it is in the stack. Among starts,
+    # wider ranges open first so the innermost range is on top
+    points.sort(key=lambda p: (p[0], p[1], -(p[2]["endOffset"] - p[2]["startOffset"]) if p[1] == 0 else 0))
+
+    used: List[Tuple[int, int]] = []
+    stack: List[Dict[str, Any]] = []
+    last_offset = 0
+    for offset, kind, r in points:
+        if stack and last_offset < offset and stack[-1]["count"] > 0:
+            if used and used[-1][1] == last_offset:
+                used[-1] = (used[-1][0], offset)
+            else:
+                used.append((last_offset, offset))
+        last_offset = offset
+        if kind == 0:
+            stack.append(r)
+        else:
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i] is r:
+                    del stack[i]
+                    break
+    return used
+
+
+def build_coverage_report(scripts: List[Dict[str, Any]], stylesheets: List[Dict[str, Any]],
+                          max_entries: int = 20) -> Dict[str, Any]:
+    """
+    Group script and stylesheet coverage by URL and rank by unused bytes.
+
+    Each input entry has url, type ("js" or "css"), total_bytes, used_bytes and inline.
+    """
+    grouped: Dict[Tuple[str, str, bool], Dict[str, Any]] = {}
+    for entry in list(scripts) + list(stylesheets):
+        key = (entry["type"], entry["url"], entry.get("inline", False))
+        group = grouped.get(key)
+        if group is None:
+            group = grouped[key] = {
+                "url": entry["url"], "type": entry["type"], "inline": entry.get("inline", False),
+                "count": 0, "total_bytes": 0, "used_bytes": 0,
+            }
+        group["count"] += 1
+        group["total_bytes"] += entry["total_bytes"]
+        group["used_bytes"] += entry["used_bytes"]
+
+    entries = []
+    for group in grouped.values():
+        group["unused_bytes"] = group["total_bytes"] - group["used_bytes"]
+        group["unused_percent"] = round(100 * group["unused_bytes"] / group["total_bytes"], 1) if group["total_bytes"] else 0.0
+        entries.append(group)
+    entries.sort(key=lambda e: e["unused_bytes"], reverse=True)
+
+    def totals(kind: str) -> Dict[str, Any]:
+        total = sum(e["total_bytes"] for e in entries if e["type"] == kind)
+        used = sum(e["used_bytes"] for e in entries if e["type"] == kind)
+        return {
+            "files": sum(1 for e in entries if e["type"] == kind),
+            "total_bytes": total,
+            "used_bytes": used,
+            "unused_bytes": total - used,
+            "unused_percent": round(100 * (total - used) / total, 1) if total else 0.0,
+        }
+
+    return {
+        "js": totals("js"),
+        "css": totals("css"),
+        "worst_offenders": entries[:max_entries],
+        "total_entries": len(entries),
+    }
+
+
+class CoverageCollector:
+    """Collects precise JS coverage and CSS rule usage for one page over a CDP session."""
+
+    def __init__(self, cdp_session, include_js: bool = True, include_css: bool = True):
+        self._cdp = cdp_session
+        self.include_js = include_js
+        self.include_css = include_css
+        self._scripts: Dict[str, Dict[str, Any]] = {}
+        self._stylesheets: Dict[str, Dict[str, Any]] = {}
+
+    def _on_script_parsed(self, event: Dict[str, Any]):
+        # Scripts without a URL are evals and injected snippets, not page weight
+        if event.get("url"):
+            self._scripts[event["scriptId"]] = {
+                "url": event["url"],
+                "length": event.get("length"),
+                # Inline <script> blocks are parsed with a non-zero start position in the document
+                "inline": bool(event.get("startLine") or event.get("startColumn")),
+            }
+
+    def _on_stylesheet_added(self, event: Dict[str, Any]):
+        header = event["header"]
+        self._stylesheets[header["styleSheetId"]] = {
+            "url": header.get("sourceURL") or "",
+            "length": header.get("length") or 0,
+            "inline": bool(header.get("isInline")),
+        }
+
+    async def start(self):
+        """Enable coverage; call before navigation."""
+        if self.include_js:
+            self._cdp.on("Debugger.scriptParsed", self._on_script_parsed)
+            await self._cdp.send("Debugger.enable")
+            await self._cdp.send("Debugger.setSkipAllPauses", {"skip": True})
+            await self._cdp.send("Profiler.enable")
+            await self._cdp.send("Profiler.startPreciseCoverage", {"callCount": False, "detailed": True})
+        if self.include_css:
+            self._cdp.on("CSS.styleSheetAdded", self._on_stylesheet_added)
+            await self._cdp.send("DOM.enable")
+            await self._cdp.send("CSS.enable")
+            await self._cdp.send("CSS.startRuleUsageTracking")
+
+    async def _script_length(self, script_id: str, script: Dict[str, Any]) -> int:
+        if script["length"] is not None:
+            return script["length"]
+        source = await self._cdp.send("Debugger.getScriptSource", {"scriptId": script_id})
+        return len(source.get("scriptSource", ""))
+
+    async def stop(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Stop coverage and return per-script and per-stylesheet byte counts."""
+        scripts: List[Dict[str, Any]] = []
+        stylesheets: List[Dict[str, Any]] = []
+
+        if self.include_js:
+            coverage = await self._cdp.send("Profiler.takePreciseCoverage")
+            await self._cdp.send("Profiler.stopPreciseCoverage")
+            await self._cdp.send("Profiler.disable")
+            await self._cdp.send("Debugger.disable")
+            for entry in coverage.get("result", []):
+                script = self._scripts.get(entry["scriptId"])
+                if script is None:
+                    continue
+                total = await self._script_length(entry["scriptId"], script)
+                used = min(total, _merge_ranges(js_used_ranges(entry.get("functions", []))))
+                scripts.append({"url": script["url"], "type": "js", "inline": script["inline"],
+                                "total_bytes": total, "used_bytes": used})
+
+        if self.include_css:
+            usage = await self._cdp.send("CSS.stopRuleUsageTracking")
+            used_ranges: Dict[str, List[Tuple[int, int]]] = {}
+            for rule in usage.get("ruleUsage", []):
+                if rule.get("used"):
+                    used_ranges.setdefault(rule["styleSheetId"], []).append((int(rule["startOffset"]), int(rule["endOffset"])))
+            await self._cdp.send("CSS.disable")
+            await self._cdp.send("DOM.disable")
+            for sheet_id, sheet in self._stylesheets.items():
+                total = int(sheet["length"])
+                used = min(total, _merge_ranges(used_ranges.get(sheet_id, [])))
+                stylesheets.append({"url": sheet["url"], "type": "css", "inline": sheet["inline"],
+                                    "total_bytes": total, "used_bytes": used})
+
+        return scripts, stylesheets
@@ -0,0 +1,211 @@
+"""
+Network, CPU and device emulation for browser pages.
+
+Named profiles (slow 3G, 4x CPU slowdown, mobile viewport...) are applied to a
+single page through its own CDP session before navigation, so every browser
+tool can measure a page the way a phone on a slow network would load it.
+Profiles can be combined and individual settings overridden per call. The
+settings live and die with the page, so pooled contexts stay unthrottled.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Page
+
+
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (Linux; Android 11; moto g power (2022)) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+)
+
+TABLET_USER_AGENT = (
+    "Mozilla/5.0 (iPad; CPU OS 16_0 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1"
+)
+
+# Network presets follow Chrome DevTools; lighthouse-mobile follows Lighthouse's mobile defaults
+EMULATION_PROFILES: Dict[str, Dict[str, Any]] = {
+    "offline": {"offline": True},
+    "slow-3g": {"latency_ms": 2000, "download_kbps": 400, "upload_kbps": 400},
+    "fast-3g": {"latency_ms": 562.5, "download_kbps": 1440, "upload_kbps": 675},
+    "4g": {"latency_ms": 170, "download_kbps": 9000, "upload_kbps": 9000},
+    "cpu-2x": {"cpu_slowdown": 2},
+    "cpu-4x": {"cpu_slowdown": 4},
+    "cpu-6x": {"cpu_slowdown": 6},
+    "mobile": {
+        "viewport": {"width": 412, "height": 823}, "device_scale_factor": 1.75,
+        "is_mobile": True, "has_touch": True, "user_agent": MOBILE_USER_AGENT,
+    },
+    "tablet": {
+        "viewport": {"width": 820, "height": 1180}, "device_scale_factor": 2,
+        "is_mobile": True, "has_touch": True, "user_agent": TABLET_USER_AGENT,
+    },
+    "lighthouse-mobile": {
+        "latency_ms": 150, "download_kbps": 1638.4, "upload_kbps": 750, "cpu_slowdown": 4,
+        "viewport": {"width": 412, "height": 823}, "device_scale_factor": 1.75,
+        "is_mobile": True, "has_touch": True, "user_agent": MOBILE_USER_AGENT,
+    },
+}
+
+# Settings that can be overridden per call, with their accepted types
+EMULATION_SETTINGS = {
+    "offline": (bool,),
+    "latency_ms": (int, float),
+    "download_kbps": (int, float),
+    "upload_kbps": (int, float),
+    "cpu_slowdown": (int, float),
+    "viewport": (dict,),
+    "device_scale_factor": (int, float),
+    "is_mobile": (bool,),
+    "has_touch": (bool,),
+    "user_agent": (str,),
+}
+
+# JSON schema of the emulation tool argument
+EMULATION_SCHEMA = {
+    "anyOf": [
+        {"type": "string", "enum": list(EMULATION_PROFILES)},
+        {"type": "array", "items": {"type": "string", "enum": list(EMULATION_PROFILES)}},
+        {
+            "type": "object",
+            "properties": {
+                "profiles": {"type": "array", "items": {"type": "string", "enum": list(EMULATION_PROFILES)}},
+                "offline": {"type": "boolean"},
+                "latency_ms": {"type": "number", "description": "Added round-trip latency in milliseconds"},
+                "download_kbps": {"type": "number", "description": "Download throughput in kilobits per second"},
+                "upload_kbps": {"type": "number", "description": "Upload throughput in kilobits per second"},
+                "cpu_slowdown": {"type": "number", "description": "CPU slowdown factor, 1 for none"},
+                "viewport": {
+                    "type": "object",
+                    "properties": {"width": {"type": "integer"}, "height": {"type": "integer"}}
+                },
+                "device_scale_factor": {"type": "number"},
+                "is_mobile": {"type": "boolean"},
+                "has_touch": {"type": "boolean"},
+                "user_agent": {"type": "string"}
+            }
+        }
+    ],
+    "description": (
+        "Emulate a slower device or network: a profile name (" + ", ".join(EMULATION_PROFILES) + "), "
+        "a list of profiles to combine, e.g. [\"mobile\", \"slow-3g\", \"cpu-4x\"], or an object with "
+        "\"profiles\" and individual settings that override them"
+    )
+}
+
+
+def validate_emulation(emulation: Any) -> Optional[Dict[str, Any]]:
+    """
+    Validate an emulation option and resolve its profiles into one set of settings.
+
+    Returns:
+        The merged settings plus the list of applied "profiles", or None if nothing is emulated
+
+    Raises:
+        ValueError: If a profile is unknown or a setting is malformed
+    """
+    if emulation is None:
+        return None
+    if isinstance(emulation, str):
+        emulation = {"profiles": [emulation]}
+    elif isinstance(emulation, list):
+        emulation = {"profiles": emulation}
+    elif not isinstance(emulation, dict):
+        raise ValueError("emulation must be a profile name, a list of profile names or an object")
+
+    unknown = [key for key in emulation if key != "profiles" and key not in EMULATION_SETTINGS]
+    if unknown:
+        raise ValueError(f"Unknown emulation settings: {', '.join(unknown)}")
+
+    profiles = emulation.get("profiles") or []
+    if not isinstance(profiles, list) or not all(isinstance(p, str) for p in profiles):
+        raise ValueError("emulation profiles must be a list of profile names")
+    invalid = [p for p in profiles if p not in EMULATION_PROFILES]
+    if invalid:
+        raise ValueError(
+            f"Unknown emulation profiles: {', '.join(invalid)}. Valid profiles: {', '.join(EMULATION_PROFILES)}"
+        )
+
+    settings: Dict[str, Any] = {}
+    for profile in profiles:
+        settings.update(EMULATION_PROFILES[profile])
+
+    for key, types in EMULATION_SETTINGS.items():
+        if key not in emulation:
+            continue
+        value = emulation[key]
+        if not isinstance(value, types) or (bool not in types and isinstance(value, bool)):
+            raise ValueError(f"emulation.{key} has the wrong type")
+        settings[key] = value
+
+    for key in ("latency_ms", "download_kbps", "upload_kbps"):
+        if settings.get(key, 0) < 0:
+            raise ValueError(f"emulation.{key} must not be negative")
+    if "cpu_slowdown" in settings and not 1 <= settings["cpu_slowdown"] <= 20:
+        raise ValueError("emulation.cpu_slowdown must be between 1 and 20")
+    if "device_scale_factor" in settings and not 0 < settings["device_scale_factor"] <= 10:
+        raise ValueError("emulation.device_scale_factor must be between 0 and 10")
+    viewport = settings.get("viewport")
+    if viewport is not None:
+        width, height = viewport.get("width"), viewport.get("height")
+        if set(viewport) - {"width", "height"} or not all(
+            isinstance(v, int) and not isinstance(v, bool) and 1 <= v <= 10000 for v in (width, height)
+        ):
+            raise ValueError("emulation.viewport must have integer width and height between 1 and 10000")
+
+    if not settings:
+        return None
+    settings["profiles"] = list(profiles)
+    return settings
+
+
+def _throughput(kbps: Optional[float]) -> float:
+    # CDP takes bytes per second; -1 disables throttling
+    return kbps * 1000 / 8 if kbps else -1
+
+
+async def apply_emulation(page: Page, emulation: Any) -> Optional[Dict[str, Any]]:
+    """
+    Apply an emulation option to `page`; call before navigation.
+
+    Returns:
+        The applied settings, or None if nothing is emulated
+    """
+    settings = validate_emulation(emulation)
+    if settings is None:
+        return None
+
+    cdp = await page.context.new_cdp_session(page)
+    commands: List[tuple] = []
+
+    network_keys = ("offline", "latency_ms", "download_kbps", "upload_kbps")
+    if any(key in settings for key in network_keys):
+        commands.append(("Network.enable", {}))
+        commands.append(("Network.emulateNetworkConditions", {
+            "offline": settings.get("offline", False),
+            "latency": settings.get("latency_ms", 0),
+            "downloadThroughput": _throughput(settings.get("download_kbps")),
+            "uploadThroughput": _throughput(settings.get("upload_kbps")),
+        }))
+
+    if "cpu_slowdown" in settings:
+        commands.append(("Emulation.setCPUThrottlingRate", {"rate": settings["cpu_slowdown"]}))
+
+    if any(key in settings for key in ("viewport", "device_scale_factor", "is_mobile")):
+        viewport = settings.get("viewport") or page.viewport_size or {"width": 1280, "height": 720}
+        commands.append(("Emulation.setDeviceMetricsOverride", {
+            "width": viewport["width"],
+            "height": viewport["height"],
+            "deviceScaleFactor": settings.get("device_scale_factor", 0),
+            "mobile": settings.get("is_mobile", False),
+        }))
+
+    if "has_touch" in settings:
+        commands.append(("Emulation.setTouchEmulationEnabled", {"enabled": settings["has_touch"]}))
+
+    if "user_agent" in settings:
+        commands.append(("Network.setUserAgentOverride", {"userAgent": settings["user_agent"]}))
+
+    for method, params in commands:
+        await cdp.send(method, params)
+    return settings
@@ -0,0 +1,302 @@
+"""
+Streaming export of captured page traffic to a HAR 1.2 or NDJSON file.
+
+Entries are written one at a time as requests finish or fail, by a single
+writer task that drains a bounded queue of finished requests, so memory stays
+flat however many requests the page makes; requests finishing while the queue
+is full are left out and counted. Response bodies are optional and
+limited by size and content type. File writes run on the shared I/O thread
+pool (see utils.AsyncFileWriter).
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import urllib.parse
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Page
+
+from mcp_server.utils import AsyncFileWriter
+
+
+class HarExportConfig:
+    """Configuration for traffic export."""
+
+    # Response bodies larger than this are left out of the export
+    MAX_BODY_BYTES = int(os.getenv("MCP_HAR_MAX_BODY_BYTES", str(1024 * 1024)))
+
+    # Finished requests waiting to be written; further requests are dropped from the export
+    QUEUE_SIZE = int(os.getenv("MCP_HAR_QUEUE_SIZE", "1000"))
+
+
+EXPORT_FORMATS = ("har", "ndjson")
+
+# Content types whose bodies are exported by default (prefix match)
+DEFAULT_BODY_CONTENT_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+
+CREATOR = {"name": "dev-tool-mcp", "version": "1.0"}
+
+
+def validate_export_options(export_path: Optional[str], export_format: Optional[str] = None,
+                            include_bodies: Optional[bool] = None, max_body_bytes: Optional[int] = None,
+                            body_content_types: Optional[List[str]] = None):
+    """
+    Validate traffic export options.
+
+    Raises:
+        ValueError: If an option has the wrong type or value
+    """
+    if export_path is None:
+        return
+    if not isinstance(export_path, str) or not export_path:
+        raise ValueError("export_path must be a non-empty string")
+    if export_format is not None and export_format not in EXPORT_FORMATS:
+        raise ValueError(f"export_format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if include_bodies is not None and not isinstance(include_bodies, bool):
+        raise ValueError("include_bodies must be a boolean")
+    if max_body_bytes is not None:
+        if not isinstance(max_body_bytes, int) or isinstance(max_body_bytes, bool) or max_body_bytes < 0:
+            raise ValueError("max_body_bytes must be a non-negative integer")
+    if body_content_types is not None:
+        if not isinstance(body_content_types, list) or not all(isinstance(t, str) for t in body_content_types):
+            raise ValueError("body_content_types must be a list of content type prefixes")
+
+
+def _iso_time(epoch_ms: Optional[float]) -> str:
+    if not epoch_ms or epoch_ms < 0:
+        return datetime.now(timezone.utc).isoformat()
+    return datetime.fromtimestamp(epoch_ms / 1000, timezone.utc).isoformat()
+
+
+def _har_headers(headers: Dict[str, str]) -> List[Dict[str, str]]:
+    return [{"name": name, "value": value} for name, value in headers.items()]
+
+
+def _har_timings(timing: Dict[str, float]) -> Dict[str, float]:
+    """Convert Playwright resource timing into HAR timings (milliseconds, -1 if not applicable)."""
+    def span(start_key: str, end_key: str) -> float:
+        start, end = timing.get(start_key, -1), timing.get(end_key, -1)
+        return round(end - start, 3) if start >= 0 and end >= 0 else -1
+
+    return {
+        "blocked": -1,
+        "dns": span("domainLookupStart", "domainLookupEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("secureConnectionStart", "connectEnd"),
+        "send": 0,
+        "wait": max(0, span("requestStart", "responseStart")),
+        "receive": max(0, span("responseStart", "responseEnd")),
+    }
+
+
+class TrafficExporter:
+    """Writes one HAR or NDJSON entry per finished request of a page."""
+
+    def __init__(self, path: str, export_format: Optional[str] = None, include_bodies: bool = False,
+                 max_body_bytes: Optional[int] = None, body_content_types: Optional[List[str]] = None):
+        self.path = path
+        self.format = export_format or "har"
+        self.include_bodies = include_bodies
+        self.max_body_bytes = HarExportConfig.MAX_BODY_BYTES if max_body_bytes is None else max_body_bytes
+        self.body_content_types = tuple(
+            t.lower() for t in (body_content_types if body_content_types is not None else DEFAULT_BODY_CONTENT_TYPES)
+        )
+        self.entries = 0
+        self.bodies = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self._started = datetime.now(timezone.utc).isoformat()
+        self._queue: "asyncio.Queue" = asyncio.Queue(maxsize=max(1, HarExportConfig.QUEUE_SIZE))
+        self._writer: Optional[AsyncFileWriter] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self):
+        """Create the file and start the writer task."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        writer = AsyncFileWriter(self.path)
+        await writer.__aenter__()
+        # Only an opened file is closed by close/abort
+        self._writer = writer
+        if self.format == "har":
+            await self._write('{"log": {"version": "1.2", "creator": ' + json.dumps(CREATOR) + ', "entries": [\n')
+        self._task = asyncio.create_task(self._drain())
+
+    def attach(self, page: Page):
+        """Queue every finished or failed request of `page` for export."""
+        page.on("requestfinished", lambda request: self._enqueue(request, False))
+        page.on("requestfailed", lambda request: self._enqueue(request, True))
+
+    def _enqueue(self, request, failed: bool):
+        # Once the writer task has stopped (e.g. disk full) nothing would drain the queue
+        if self._task is not None and not self._task.done():
+            try:
+                self._queue.put_nowait((request, failed))
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    async def _write(self, text: str):
+        data = text.encode("utf-8")
+        await self._writer.write(data)
+        self.bytes_written += len(data)
+
+    async def _drain(self):
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                request, failed = item
+                try:
+                    entry = await self._build_entry(request, failed)
+                except Exception as e:
+                    logging.warning(f"Failed to export request: {e}")
+                    continue
+                line = json.dumps(entry, ensure_ascii=False)
+                if self.format == "har":
+                    line = ("" if self.entries == 0 else ",\n") + line
+                else:
+                    line += "\n"
+                await self._write(line)
+                self.entries += 1
+            finally:
+                self._queue.task_done()
+
+    def _wants_body(self, mime_type: str, declared_length: Optional[str]) -> bool:
+        if not self.include_bodies or self.max_body_bytes == 0:
+            return False
+        if not mime_type.lower().startswith(self.body_content_types):
+            return False
+        try:
+            return declared_length is None or int(declared_length) <= self.max_body_bytes
+        except ValueError:
+            return True
+
+    async def _content(self, response) -> Dict[str, Any]:
+        headers = response.headers
+        mime_type = headers.get("content-type", "")
+        content: Dict[str, Any] = {"size": -1, "mimeType": mime_type}
+        declared = headers.get("content-length")
+        if declared is not None and declared.isdigit():
+            content["size"] = int(declared)
+        if not self._wants_body(mime_type, declared):
+            return content
+
+        try:
+            body = await response.body()
+        except Exception as e:
+            content["comment"] = f"Body unavailable: {e}"
+            return content
+        content["size"] = len(body)
+        if len(body) > self.max_body_bytes:
+            content["comment"] = f"Body of {len(body)} bytes exceeds max_body_bytes"
+            return content
+        try:
+            content["text"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            content["text"] = base64.b64encode(body).decode("ascii")
+            content["encoding"] = "base64"
+        self.bodies += 1
+        return content
+
+    async def _build_entry(self, request, failed: bool) -> Dict[str, Any]:
+        timing = request.timing or {}
+        response = None if failed else await request.response()
+        timings = _har_timings(timing)
+        total = timing.get("responseEnd", -1)
+
+        query = urllib.parse.parse_qsl(urllib.parse.urlsplit(request.url).query, keep_blank_values=True)
+        har_request: Dict[str, Any] = {
+            "method": request.method,
+            "url": request.url,
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": _har_headers(request.headers),
+            "queryString": [{"name": k, "value": v} for k, v in query],
+            "headersSize": -1,
+            "bodySize": -1,
+        }
+        try:
+            post_data = request.post_data
+        except Exception:
+            post_data = None
+        if post_data is not None:
+            har_request["postData"] = {"mimeType": request.headers.get("content-type", ""), "text": post_data}
+            har_request["bodySize"] = len(post_data.encode("utf-8"))
+
+        if response is not None:
+            har_response = {
+                "status": response.status,
+                "statusText": response.status_text,
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": _har_headers(response.headers),
+                "content": await self._content(response),
+                "redirectURL": response.headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": -1,
+            }
+        else:
+            har_response = {
+                "status": 0, "statusText": "", "httpVersion": "", "cookies": [], "headers": [],
+                "content": {"size": 0, "mimeType": ""}, "redirectURL": "", "headersSize": -1, "bodySize": -1,
+            }
+
+        entry = {
+            "pageref": "page_1",
+            "startedDateTime": _iso_time(timing.get("startTime")),
+            "time": round(total, 3) if total >= 0 else 0,
+            "request": har_request,
+            "response": har_response,
+            "cache": {},
+            "timings": timings,
+            "_resourceType": request.resource_type,
+        }
+        if failed:
+            entry["_failure"] = request.failure
+        return entry
+
+    async def close(self, title: str = "") -> Dict[str, Any]:
+        """
+        Wait for queued entries, finish the file and return an export report.
+        """
+        try:
+            if self._task is not None:
+                if not self._task.done():
+                    await self._queue.put(None)
+                await self._task
+            if self.format == "har" and self._writer is not None:
+                page = {"id": "page_1", "startedDateTime": self._started, "title": title, "pageTimings": {}}
+                await self._write('\n], "pages": [' + json.dumps(page, ensure_ascii=False) + ']}}\n')
+        finally:
+            if self._writer is not None:
+                await self._writer.__aexit__(None, None, None)
+                self._writer = None
+        return self.report()
+
+    async def abort(self):
+        """Stop the writer task and close the file without waiting for queued entries."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._writer is not None:
+            await self._writer.__aexit__(None, None, None)
+            self._writer = None
+
+    def report(self) -> Dict[str, Any]:
+        """Path, format and size of the export so far."""
+        return {
+            "path": os.path.abspath(self.path),
+            "format": self.format,
+            "entries": self.entries,
+            "bodies": self.bodies,
+            "bytes_written": self.bytes_written,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,294 @@
+"""
+Network capture for browser pages.
+
+The default passive mode records requests from page events ("request",
+"response", "requestfinished", "requestfailed") and never holds a request
+back. The intercept mode routes every request through a Python handler before
+Chromium may send it, as get_network_requests originally did; it is kept for
+comparison and for callers that rely on seeing requests at routing time, but
+it slows the page it measures.
+
+Each request is kept as one compact record holding its response, with only
+allowlisted headers, in a ring buffer of at most `max_records` entries. A
+per-domain and per-resource-type summary is aggregated as events arrive, so
+it covers every request even when old records have been dropped.
+"""
+
+import asyncio
+import os
+import urllib.parse
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from playwright.async_api import Page, Route
+
+
+class NetworkCaptureConfig:
+    """Configuration for network capture."""
+
+    # Maximum number of request records kept per page; the oldest are dropped first
+    MAX_RECORDS = int(os.getenv("MCP_NETWORK_MAX_RECORDS", "2000"))
+
+    # Request and response headers kept in records ("*" keeps all of them)
+    HEADERS = tuple(
+        h.strip().lower()
+        for h in os.getenv(
+            "MCP_NETWORK_HEADERS",
+            "content-type,content-length,content-encoding,cache-control,location,referer"
+        ).split(",")
+        if h.strip()
+    )
+
+
+CAPTURE_MODES = ("passive", "intercept")
+
+
+def validate_capture_mode(capture_mode: Optional[str]) -> str:
+    """Return the capture mode, defaulting to passive; raises ValueError if unknown."""
+    if capture_mode is None:
+        return "passive"
+    if capture_mode not in CAPTURE_MODES:
+        raise ValueError(f"capture_mode must be one of: {', '.join(CAPTURE_MODES)}")
+    return capture_mode
+
+
+def validate_network_options(max_records: Optional[int] = None,
+                             include_headers: Optional[List[str]] = None,
+                             summary_only: Optional[bool] = None):
+    """
+    Validate record caps and header selection for network capture.
+
+    Raises:
+        ValueError: If an option has the wrong type or range
+    """
+    if max_records is not None:
+        if not isinstance(max_records, int) or isinstance(max_records, bool):
+            raise ValueError("max_records must be an integer")
+        if max_records < 0 or max_records > 100000:
+            raise ValueError("max_records must be between 0 and 100000")
+    if include_headers is not None:
+        if not isinstance(include_headers, list) or not all(isinstance(h, str) for h in include_headers):
+            raise ValueError("include_headers must be a list of header names")
+    if summary_only is not None and not isinstance(summary_only, bool):
+        raise ValueError("summary_only must be a boolean")
+
+
+class _HeaderFilter:
+    """Keeps only allowlisted headers; "*" keeps all of them."""
+
+    __slots__ = ("_names", "_all")
+
+    def __init__(self, names):
+        names = [n.lower() for n in names]
+        self._all = "*" in names
+        self._names = frozenset(names)
+
+    def __call__(self, headers: Dict[str, str]) -> Dict[str, str]:
+        if self._all:
+            return dict(headers)
+        if not self._names:
+            return {}
+        return {k: v for k, v in headers.items() if k.lower() in self._names}
+
+
+class ResponseRecord:
+    """Compact response data of one request."""
+
+    __slots__ = ("url", "status", "status_text", "headers", "content_type", "content_length", "timestamp")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "status_text": self.status_text,
+            "headers": self.headers,
+            "content_type": self.content_type,
+            "content_length": self.content_length,
+            "timestamp": self.timestamp,
+        }
+
+
+class RequestRecord:
+    """Compact record of one request, its response, timing and failure."""
+
+    __slots__ = ("url", "method", "resource_type", "frame_url", "headers", "timestamp",
+                 "timing", "failure", "response", "error")
+
+    def __init__(self):
+        self.timing = None
+        self.failure = None
+        self.response: Optional[ResponseRecord] = None
+        self.error = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.error:
+            return {"error": self.error, "timestamp": self.timestamp}
+        info = {
+            "url": self.url,
+            "method": self.method,
+            "resource_type": self.resource_type,
+            "frame_url": self.frame_url,
+            "headers": self.headers,
+            "timestamp": self.timestamp,
+        }
+        if self.timing is not None:
+            info["timing"] = self.timing
+        if self.failure is not None:
+            info["failure"] = self.failure
+        return info
+
+
+def _timing_info(request) -> Optional[Dict[str, Any]]:
+    """Resource timing of a finished request, in milliseconds relative to its start."""
+    try:
+        timing = request.timing
+    except Exception:
+        return None
+    if not timing:
+        return None
+    info = dict(timing)
+    response_end = timing.get("responseEnd", -1)
+    info["duration_ms"] = round(response_end, 3) if response_end is not None and response_end >= 0 else None
+    return info
+
+
+def _content_length(value: Optional[str]) -> int:
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+class NetworkCapture:
+    """Collects bounded request records and an aggregated summary for one page."""
+
+    def __init__(self, mode: str = "passive", max_records: Optional[int] = None,
+                 include_headers: Optional[List[str]] = None, summary_only: bool = False):
+        self.mode = validate_capture_mode(mode)
+        self.max_records = NetworkCaptureConfig.MAX_RECORDS if max_records is None else max_records
+        self.summary_only = summary_only
+        self._filter_headers = _HeaderFilter(
+            NetworkCaptureConfig.HEADERS if include_headers is None else include_headers
+        )
+        self._loop = asyncio.get_event_loop()
+        self.records: Deque[RequestRecord] = deque(maxlen=0 if summary_only else self.max_records)
+        # Requests still waiting for their response, finish or failure event
+        self._pending: Dict[Any, RequestRecord] = {}
+        self.total_requests = 0
+        self.total_responses = 0
+        self._by_domain: Dict[str, Dict[str, int]] = {}
+        self._by_type: Dict[str, Dict[str, int]] = {}
+        self._by_status: Dict[str, int] = {}
+        self._failed = 0
+        self._bytes = 0
+
+    async def attach(self, page: Page):
+        """Start capturing; call before navigation."""
+        if self.mode == "intercept":
+            await page.route("**/*", self._handle_route)
+        else:
+            page.on("request", self._record_request)
+        page.on("response", self._record_response)
+        page.on("requestfinished", self._on_finished)
+        page.on("requestfailed", self._on_failed)
+
+    @staticmethod
+    def _bucket(table: Dict[str, Dict[str, int]], key: str) -> Dict[str, int]:
+        bucket = table.get(key)
+        if bucket is None:
+            bucket = table[key] = {"requests": 0, "bytes": 0, "failed": 0}
+        return bucket
+
+    def _record_request(self, request):
+        record = RequestRecord()
+        record.timestamp = self._loop.time()
+        try:
+            record.url = request.url
+            record.method = request.method
+            record.resource_type = request.resource_type
+            record.frame_url = request.frame.url if request.frame else None
+            record.headers = self._filter_headers(request.headers)
+        except Exception as e:
+            record.error = f"Error processing request: {str(e)}"
+            record.url = getattr(request, "url", "unknown")
+            record.resource_type = "other"
+
+        self.total_requests += 1
+        self._bucket(self._by_domain, urllib.parse.urlsplit(record.url).hostname or "")["requests"] += 1
+        self._bucket(self._by_type, record.resource_type or "other")["requests"] += 1
+
+        self._pending[request] = record
+        self.records.append(record)
+        return record
+
+    async def _handle_route(self, route: Route):
+        self._record_request(route.request)
+        # Continue with the request
+        await route.continue_()
+
+    def _record_response(self, response):
+        self.total_responses += 1
+        request = response.request
+        record = self._pending.get(request) or self._record_request(request)
+
+        info = ResponseRecord()
+        info.timestamp = self._loop.time()
+        info.url = response.url
+        try:
+            headers = response.headers
+            info.status = response.status
+            info.status_text = response.status_text
+            info.headers = self._filter_headers(headers)
+            info.content_type = headers.get("content-type", "")
+            info.content_length = headers.get("content-length", "")
+        except Exception as e:
+            info.status, info.status_text, info.headers = None, f"Error processing response: {str(e)}", {}
+            info.content_type = info.content_length = ""
+        record.response = info
+
+        size = _content_length(info.content_length)
+        self._bytes += size
+        self._bucket(self._by_domain, urllib.parse.urlsplit(record.url).hostname or "")["bytes"] += size
+        self._bucket(self._by_type, record.resource_type or "other")["bytes"] += size
+        status_class = f"{info.status // 100}xx" if info.status else "unknown"
+        self._by_status[status_class] = self._by_status.get(status_class, 0) + 1
+
+    def _on_finished(self, request):
+        record = self._pending.pop(request, None)
+        if record is not None:
+            record.timing = _timing_info(request)
+
+    def _on_failed(self, request):
+        record = self._pending.pop(request, None)
+        if record is None:
+            return
+        record.failure = request.failure
+        record.timing = _timing_info(request)
+        self._failed += 1
+        self._bucket(self._by_domain, urllib.parse.urlsplit(record.url).hostname or "")["failed"] += 1
+        self._bucket(self._by_type, record.resource_type or "other")["failed"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Request counts and Content-Length bytes per domain, resource type and status class."""
+        return {
+            "requests": self.total_requests,
+            "responses": self.total_responses,
+            "failed": self._failed,
+            "bytes": self._bytes,
+            "by_domain": self._by_domain,
+            "by_resource_type": self._by_type,
+            "by_status": self._by_status,
+        }
+
+    def result(self) -> Dict[str, Any]:
+        """The capture in the shape returned by get_network_requests."""
+        result: Dict[str, Any] = {}
+        if not self.summary_only:
+            records = list(self.records)
+            result["requests"] = [record.to_dict() for record in records]
+            result["responses"] = [record.response.to_dict() for record in records if record.response]
+            result["dropped_records"] = self.total_requests - len(records)
+        result["total_requests"] = self.total_requests
+        result["total_responses"] = self.total_responses
+        result["summary"] = self.summary()
+        return result
@@ -0,0 +1,141 @@
+"""
+In-process cache of get_page_content results.
+
+Agents tend to ask for the same page several times in a session. Results
+are kept per BrowserService, keyed by the URL, wait_for_selector and every
+option that changes the result, and served again until they are older than
+MCP_PAGE_CACHE_TTL or the caller's `max_age`. Entries are stored serialized,
+so the byte budget is exact and callers never share mutable results; the
+least recently used entries are evicted once the budget is exceeded. Results
+can be megabytes of text, so they are serialized and parsed on the shared
+I/O thread pool rather than on the event loop.
+
+A repeat call can return a page that changed in the meantime, so the cache
+is off unless MCP_PAGE_CACHE_MAX_BYTES is set.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from mcp_server.utils import get_io_executor
+
+
+class PageCacheConfig:
+    """Configuration for the page content cache."""
+
+    # Seconds a cached result can be served
+    TTL = float(os.getenv("MCP_PAGE_CACHE_TTL", "300"))
+
+    # Total bytes kept for all cached results; 0 disables the cache
+    MAX_BYTES = int(os.getenv("MCP_PAGE_CACHE_MAX_BYTES", "0"))
+
+
+def validate_cache_options(max_age: Optional[float] = None, bypass_cache: Optional[bool] = None):
+    """
+    Validate the per-call cache options.
+
+    Raises:
+        ValueError: If an option has the wrong type or value
+    """
+    if max_age is not None:
+        if not isinstance(max_age, (int, float)) or isinstance(max_age, bool):
+            raise ValueError("max_age must be a number of seconds")
+        if max_age < 0:
+            raise ValueError("max_age must not be negative")
+    if bypass_cache is not None and not isinstance(bypass_cache, bool):
+        raise ValueError("bypass_cache must be a boolean")
+
+
+def page_cache_key(url: str, **options: Any) -> str:
+    """Cache key for a call: the URL and every option that changes its result."""
+    return json.dumps({"url": url, **options}, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _serialize(result: Dict[str, Any]) -> bytes:
+    return json.dumps(result, ensure_ascii=False).encode("utf-8")
+
+
+class _CachedPage:
+    __slots__ = ("data", "stored_at")
+
+    def __init__(self, data: bytes, stored_at: float):
+        self.data = data
+        self.stored_at = stored_at
+
+
+class PageCache:
+    """A byte-budgeted, TTL-limited cache of results, evicting least recently used first."""
+
+    def __init__(self, ttl: float = None, max_bytes: int = None, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl if ttl is not None else PageCacheConfig.TTL
+        self._max_bytes = max_bytes if max_bytes is not None else PageCacheConfig.MAX_BYTES
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CachedPage]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.data)
+
+    def _evict_expired(self):
+        expired_before = self._clock() - self._ttl
+        for key in [k for k, entry in self._entries.items() if entry.stored_at <= expired_before]:
+            self._remove(key)
+            self._evictions += 1
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    async def get(self, key: str, max_age: Optional[float] = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Return a copy of a cached result and its age in seconds, or None on a miss.
+
+        A result older than `max_age` is a miss but stays cached for callers that accept it.
+        """
+        self._evict_expired()
+        entry = self._entries.get(key)
+        age = self._clock() - entry.stored_at if entry is not None else None
+        if entry is None or (max_age is not None and age > max_age):
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return await asyncio.get_running_loop().run_in_executor(get_io_executor(), json.loads, entry.data), age
+
+    async def put(self, key: str, result: Dict[str, Any]):
+        """Cache a result; results larger than the whole budget are not cached."""
+        if not self.enabled:
+            return
+        data = await asyncio.get_running_loop().run_in_executor(get_io_executor(), _serialize, result)
+        if key in self._entries:
+            self._remove(key)
+        if len(data) > self._max_bytes:
+            return
+
+        self._evict_expired()
+        while self._entries and self._bytes + len(data) > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+        self._entries[key] = _CachedPage(data, self._clock())
+        self._bytes += len(data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache usage and hit/miss counts."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "ttl_seconds": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
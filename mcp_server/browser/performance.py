@@ -0,0 +1,194 @@
+"""
+Page performance metrics collected during a single load.
+
+An init script installs PerformanceObservers for paint, largest-contentful-paint,
+layout-shift and longtask entries before any page script runs, and enlarges the
+resource timing buffer. After the load settles one evaluation reads Navigation
+Timing, resource timing and the observed entries, and build_performance_report
+turns them into a report with a per-domain and per-resource-type waterfall.
+"""
+
+import urllib.parse
+from typing import Any, Dict, List, Optional
+
+
+# Installed with page.add_init_script so observers see the whole load
+PERFORMANCE_OBSERVER_SCRIPT = """
+(() => {
+    const store = window.__mcpPerformance = {lcp: null, cls: 0, shifts: 0, longTasks: [], paints: []};
+    try { performance.setResourceTimingBufferSize(100000); } catch (e) {}
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) {}
+    };
+    observe('paint', e => store.paints.push({name: e.name, startTime: e.startTime}));
+    observe('largest-contentful-paint', e => {
+        store.lcp = {
+            startTime: e.startTime,
+            size: e.size,
+            url: e.url || null,
+            element: e.element ? e.element.tagName.toLowerCase() + (e.element.id ? '#' + e.element.id : '') : null
+        };
+    });
+    observe('layout-shift', e => {
+        if (!e.hadRecentInput) {
+            store.cls += e.value;
+            store.shifts += 1;
+        }
+    });
+    observe('longtask', e => store.longTasks.push({startTime: e.startTime, duration: e.duration}));
+})();
+"""
+
+# Evaluated once after the load has settled
+COLLECT_PERFORMANCE_SCRIPT = """
+() => {
+    const store = window.__mcpPerformance || {lcp: null, cls: 0, shifts: 0, longTasks: [], paints: []};
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paints = store.paints.length ? store.paints
+        : performance.getEntriesByType('paint').map(e => ({name: e.name, startTime: e.startTime}));
+    return {
+        navigation: nav ? nav.toJSON() : null,
+        paints,
+        lcp: store.lcp,
+        cls: store.cls,
+        layoutShifts: store.shifts,
+        longTasks: store.longTasks,
+        resources: performance.getEntriesByType('resource').map(e => ({
+            name: e.name,
+            initiatorType: e.initiatorType,
+            startTime: e.startTime,
+            duration: e.duration,
+            responseEnd: e.responseEnd,
+            transferSize: e.transferSize,
+            encodedBodySize: e.encodedBodySize,
+            decodedBodySize: e.decodedBodySize,
+            nextHopProtocol: e.nextHopProtocol
+        }))
+    };
+}
+"""
+
+# Long tasks count towards total blocking time beyond this many milliseconds
+LONG_TASK_THRESHOLD_MS = 50
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+def _span(timing: Dict[str, Any], start_key: str, end_key: str) -> Optional[float]:
+    # A zero start means the phase did not happen (no redirect, no TLS, reused connection...)
+    start, end = timing.get(start_key), timing.get(end_key)
+    if not start or end is None or end < start:
+        return None
+    return _ms(end - start)
+
+
+def navigation_metrics(navigation: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Phase durations and milestones (ms since navigation start) from a Navigation Timing entry."""
+    if not navigation:
+        return None
+    return {
+        "type": navigation.get("type"),
+        "protocol": navigation.get("nextHopProtocol"),
+        "redirect": _span(navigation, "redirectStart", "redirectEnd"),
+        "dns": _span(navigation, "domainLookupStart", "domainLookupEnd"),
+        "connect": _span(navigation, "connectStart", "connectEnd"),
+        "tls": _span(navigation, "secureConnectionStart", "connectEnd"),
+        "request": _span(navigation, "requestStart", "responseStart"),
+        "response": _span(navigation, "responseStart", "responseEnd"),
+        "ttfb": _ms(navigation.get("responseStart")),
+        "dom_interactive": _ms(navigation.get("domInteractive")),
+        "dom_content_loaded": _ms(navigation.get("domContentLoadedEventEnd")),
+        "load": _ms(navigation.get("loadEventEnd")),
+        "transfer_size": navigation.get("transferSize"),
+        "decoded_body_size": navigation.get("decodedBodySize"),
+    }
+
+
+def waterfall_summary(resources: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate resource timing entries by "domain" or "type".
+
+    Each group reports its request count, transferred and decoded bytes, the
+    window it occupied on the waterfall (first start to last response end),
+    and its total and slowest single duration.
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for entry in resources:
+        if key == "domain":
+            name = urllib.parse.urlsplit(entry.get("name", "")).hostname or ""
+        else:
+            name = entry.get("initiatorType") or "other"
+        group = groups.get(name)
+        if group is None:
+            group = groups[name] = {
+                "requests": 0, "transfer_bytes": 0, "decoded_bytes": 0,
+                "start": None, "end": None, "total_duration": 0.0, "max_duration": 0.0,
+            }
+        start = entry.get("startTime") or 0.0
+        end = entry.get("responseEnd") or start
+        duration = entry.get("duration") or 0.0
+        group["requests"] += 1
+        group["transfer_bytes"] += entry.get("transferSize") or 0
+        group["decoded_bytes"] += entry.get("decodedBodySize") or 0
+        group["start"] = start if group["start"] is None else min(group["start"], start)
+        group["end"] = end if group["end"] is None else max(group["end"], end)
+        group["total_duration"] += duration
+        group["max_duration"] = max(group["max_duration"], duration)
+
+    for group in groups.values():
+        for field in ("start", "end", "total_duration", "max_duration"):
+            group[field] = _ms(group[field])
+    # Heaviest groups first
+    return dict(sorted(groups.items(), key=lambda item: item[1]["transfer_bytes"], reverse=True))
+
+
+def build_performance_report(raw: Dict[str, Any], slowest: int = 10) -> Dict[str, Any]:
+    """Turn the collected performance entries into a structured report."""
+    paints = {p["name"]: p["startTime"] for p in raw.get("paints") or []}
+    fcp = paints.get("first-contentful-paint")
+    lcp = raw.get("lcp")
+
+    long_tasks = raw.get("longTasks") or []
+    resources = raw.get("resources") or []
+
+    return {
+        "navigation": navigation_metrics(raw.get("navigation")),
+        "paint": {
+            "first_paint": _ms(paints.get("first-paint")),
+            "first_contentful_paint": _ms(fcp),
+            "largest_contentful_paint": _ms(lcp["startTime"]) if lcp else None,
+            "lcp_element": lcp.get("element") if lcp else None,
+            "lcp_url": lcp.get("url") if lcp else None,
+            "lcp_size": lcp.get("size") if lcp else None,
+        },
+        "layout": {
+            "cumulative_layout_shift": round(raw.get("cls") or 0.0, 4),
+            "layout_shifts": raw.get("layoutShifts") or 0,
+        },
+        "long_tasks": {
+            "count": len(long_tasks),
+            "total_duration": _ms(sum(t["duration"] for t in long_tasks)),
+            "total_blocking_time": _ms(sum(max(0.0, t["duration"] - LONG_TASK_THRESHOLD_MS) for t in long_tasks)),
+            "longest": _ms(max((t["duration"] for t in long_tasks), default=0.0)),
+        },
+        "resources": {
+            "count": len(resources),
+            "transfer_bytes": sum(e.get("transferSize") or 0 for e in resources),
+            "by_domain": waterfall_summary(resources, "domain"),
+            "by_type": waterfall_summary(resources, "type"),
+            "slowest": [
+                {
+                    "url": e.get("name"),
+                    "type": e.get("initiatorType"),
+                    "start": _ms(e.get("startTime")),
+                    "duration": _ms(e.get("duration")),
+                    "transfer_bytes": e.get("transferSize"),
+                }
+                for e in sorted(resources, key=lambda e: e.get("duration") or 0.0, reverse=True)[:slowest]
+            ],
+        },
+    }
@@ -0,0 +1,187 @@
+"""
+Per-call blocking of subresources (images, fonts, media, trackers) during page loads.
+
+A ResourceBlocker routes every request of a page and aborts the ones matching
+the configured resource types, hosts or URL patterns before they reach the
+network. Everything else falls through to any other route handlers, so the
+blocker composes with request capture and caching routes.
+"""
+
+import fnmatch
+import urllib.parse
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Page, Route
+
+
+# Resource types that can be blocked; "document" is excluded so the page itself always loads
+BLOCKABLE_RESOURCE_TYPES = (
+    "stylesheet", "image", "media", "font", "script", "texttrack",
+    "xhr", "fetch", "eventsource", "websocket", "manifest", "other",
+)
+
+# Well-known advertising and analytics hosts blocked by `"trackers": true`
+TRACKER_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+    "connect.facebook.net", "analytics.twitter.com", "ads-twitter.com", "bat.bing.com", "clarity.ms",
+    "scorecardresearch.com", "quantserve.com", "hotjar.com", "segment.io", "segment.com",
+    "mixpanel.com", "amplitude.com", "fullstory.com", "criteo.com", "criteo.net",
+    "taboola.com", "outbrain.com", "adnxs.com", "amazon-adsystem.com", "moatads.com",
+)
+
+BLOCK_RESOURCES_KEYS = ("resource_types", "hosts", "url_patterns", "trackers")
+
+# JSON schema of the block_resources tool argument
+BLOCK_RESOURCES_SCHEMA = {
+    "type": "object",
+    "description": "Subresources to abort instead of loading, e.g. {\"resource_types\": [\"image\", \"font\", \"media\"], \"trackers\": true}",
+    "properties": {
+        "resource_types": {
+            "type": "array",
+            "items": {"type": "string", "enum": list(BLOCKABLE_RESOURCE_TYPES)},
+            "description": "Resource types to block"
+        },
+        "hosts": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Hosts to block, including their subdomains"
+        },
+        "url_patterns": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Shell-style URL patterns to block, e.g. \"*/analytics.js*\""
+        },
+        "trackers": {
+            "type": "boolean",
+            "description": "Block a built-in list of common advertising and analytics hosts"
+        }
+    }
+}
+
+
+def validate_block_resources(block_resources: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Validate a block_resources option.
+
+    Accepted keys are resource_types (see BLOCKABLE_RESOURCE_TYPES), hosts
+    (blocked together with their subdomains), url_patterns (shell-style globs
+    matched against the full URL) and trackers (block TRACKER_HOSTS).
+
+    Returns:
+        The normalized option, or None if nothing is blocked
+
+    Raises:
+        ValueError: If the option is malformed
+    """
+    if block_resources is None:
+        return None
+    if not isinstance(block_resources, dict):
+        raise ValueError("block_resources must be an object")
+    unknown = [key for key in block_resources if key not in BLOCK_RESOURCES_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown block_resources keys: {', '.join(unknown)}")
+
+    normalized: Dict[str, Any] = {}
+    for key in ("resource_types", "hosts", "url_patterns"):
+        values = block_resources.get(key) or []
+        if not isinstance(values, list) or not all(isinstance(v, str) and v for v in values):
+            raise ValueError(f"block_resources.{key} must be a list of non-empty strings")
+        normalized[key] = [v.lower() for v in values] if key != "url_patterns" else list(values)
+
+    invalid = [t for t in normalized["resource_types"] if t not in BLOCKABLE_RESOURCE_TYPES]
+    if invalid:
+        raise ValueError(
+            f"Invalid resource types: {', '.join(invalid)}. Valid types: {', '.join(BLOCKABLE_RESOURCE_TYPES)}"
+        )
+
+    trackers = block_resources.get("trackers", False)
+    if not isinstance(trackers, bool):
+        raise ValueError("block_resources.trackers must be a boolean")
+    normalized["trackers"] = trackers
+
+    if not (normalized["resource_types"] or normalized["hosts"] or normalized["url_patterns"] or trackers):
+        return None
+    return normalized
+
+
+def _is_main_document(request) -> bool:
+    """The page's own navigation request is never blocked."""
+    if request.resource_type != "document":
+        return False
+    try:
+        return request.frame.parent_frame is None
+    except Exception:
+        return False
+
+
+class ResourceBlocker:
+    """Aborts matching requests of a page and counts what was blocked and what was loaded."""
+
+    def __init__(self, block_resources: Dict[str, Any]):
+        self._types = frozenset(block_resources.get("resource_types") or ())
+        hosts: List[str] = list(block_resources.get("hosts") or ())
+        if block_resources.get("trackers"):
+            hosts.extend(TRACKER_HOSTS)
+        self._hosts = frozenset(h.lstrip(".") for h in hosts)
+        self._patterns = list(block_resources.get("url_patterns") or ())
+        self.blocked_requests = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.allowed_requests = 0
+        self.loaded_bytes = 0
+
+    async def attach(self, page: Page):
+        """Route every request of `page` through the blocker."""
+        await page.route("**/*", self._handle)
+        page.on("response", self._on_response)
+
+    def _host_blocked(self, host: str) -> bool:
+        # Walk up the domain so "a.b.example.com" matches a blocked "example.com"
+        while host:
+            if host in self._hosts:
+                return True
+            _, _, host = host.partition(".")
+        return False
+
+    def matches(self, resource_type: str, url: str) -> bool:
+        """Return True if a request of this type and URL is blocked."""
+        if resource_type in self._types:
+            return True
+        if self._hosts and self._host_blocked((urllib.parse.urlsplit(url).hostname or "").lower()):
+            return True
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self._patterns)
+
+    async def _handle(self, route: Route):
+        request = route.request
+        if not _is_main_document(request) and self.matches(request.resource_type, request.url):
+            self.blocked_requests += 1
+            self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+            await route.abort("blockedbyclient")
+            return
+        self.allowed_requests += 1
+        await route.fallback()
+
+    def _on_response(self, response):
+        try:
+            self.loaded_bytes += int(response.headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Return what was blocked and what was still loaded."""
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "allowed_requests": self.allowed_requests,
+            "loaded_bytes": self.loaded_bytes,
+        }
+
+
+async def attach_resource_blocker(page: Page, block_resources: Optional[Dict[str, Any]]) -> Optional[ResourceBlocker]:
+    """Attach a ResourceBlocker to `page` if `block_resources` blocks anything."""
+    block_resources = validate_block_resources(block_resources)
+    if block_resources is None:
+        return None
+    blocker = ResourceBlocker(block_resources)
+    await blocker.attach(page)
+    return blocker
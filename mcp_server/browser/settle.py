@@ -0,0 +1,92 @@
+"""
+Adaptive settle wait for pages that keep issuing requests or console output after load.
+
+Instead of sleeping for a fixed time after navigation, the browser service waits
+until the page has been quiet (no request started or finished, no console
+message) for `quiet_ms`, or until `max_ms` has elapsed, whichever comes first.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional, Tuple
+
+
+class SettleConfig:
+    """Configuration for the settle wait."""
+
+    # Quiet period without requests or console messages after which a page counts as settled
+    QUIET_MS = int(os.getenv("MCP_BROWSER_SETTLE_QUIET_MS", "500"))
+
+    # Hard upper bound for the settle wait
+    MAX_MS = int(os.getenv("MCP_BROWSER_SETTLE_MAX_MS", "3000"))
+
+
+# Page events that count as activity
+ACTIVITY_EVENTS = ("request", "requestfinished", "requestfailed", "console")
+
+
+def validate_settle_options(quiet_ms: Optional[int] = None, max_ms: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Validate settle options and fill in the configured defaults.
+
+    Returns:
+        (quiet_ms, max_ms)
+
+    Raises:
+        ValueError: If an option is not an integer in the allowed range
+    """
+    quiet_ms = SettleConfig.QUIET_MS if quiet_ms is None else quiet_ms
+    max_ms = SettleConfig.MAX_MS if max_ms is None else max_ms
+    for name, value in (("settle_quiet_ms", quiet_ms), ("settle_max_ms", max_ms)):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{name} must be an integer")
+        if value < 0 or value > 60000:
+            raise ValueError(f"{name} must be between 0 and 60000 milliseconds")
+    return quiet_ms, max_ms
+
+
+class ActivityMonitor:
+    """
+    Tracks the last time a page showed network or console activity.
+
+    Attach it before navigation so that the load itself counts as activity.
+    """
+
+    def __init__(self, page):
+        self._loop = asyncio.get_running_loop()
+        self._last_activity = self._loop.time()
+        self.events = 0
+        for event in ACTIVITY_EVENTS:
+            page.on(event, self._on_activity)
+
+    def _on_activity(self, *_):
+        self._last_activity = self._loop.time()
+        self.events += 1
+
+    async def wait(self, quiet_ms: int, max_ms: int) -> Dict[str, Any]:
+        """
+        Wait until the page has been quiet for `quiet_ms`, at most `max_ms`.
+
+        Returns:
+            A report with waited_ms, settled (False if max_ms was hit) and the limits used
+        """
+        started = self._loop.time()
+        deadline = started + max_ms / 1000
+        quiet = quiet_ms / 1000
+        while True:
+            now = self._loop.time()
+            quiet_until = self._last_activity + quiet
+            if quiet_until <= now:
+                settled = True
+                break
+            if now >= deadline:
+                settled = False
+                break
+            await asyncio.sleep(min(quiet_until, deadline) - now)
+
+        return {
+            "waited_ms": round((self._loop.time() - started) * 1000, 1),
+            "settled": settled,
+            "quiet_ms": quiet_ms,
+            "max_ms": max_ms,
+        }
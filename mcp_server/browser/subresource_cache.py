@@ -0,0 +1,294 @@
+"""
+Shared in-process cache of static subresources served through request interception.
+
+Pages load the same scripts, stylesheets, fonts and images again and again,
+often from a handful of CDN bundles. When enabled, every page of the browser
+service routes these requests through a SubresourceCache: fresh entries are
+fulfilled from memory, stale entries with an ETag or Last-Modified are
+revalidated with a conditional request, and everything else is fetched once
+and stored for every other page and context.
+
+Only what a shared HTTP cache may keep is stored: successful GET responses
+that are not `no-store` or `private`, do not vary on more than the encoding,
+and are fresh for a while or carry a validator. Entries are indexed by URL
+and bodies are stored by their SHA-256, so the same bundle served under
+several URLs is kept once. The byte budget covers the stored bodies; the
+least recently used URLs are evicted first.
+
+Routing a page disables Chromium's own HTTP cache for it, so the cache is
+off unless MCP_SUBRESOURCE_CACHE_MAX_BYTES is set.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+from playwright.async_api import Page, Route
+
+from mcp_server.single_flight import SingleFlight
+
+
+class SubresourceCacheConfig:
+    """Configuration for the subresource cache."""
+
+    # Total bytes of stored bodies; 0 disables the cache
+    MAX_BYTES = int(os.getenv("MCP_SUBRESOURCE_CACHE_MAX_BYTES", "0"))
+
+    # Larger responses are passed through without being stored
+    MAX_ENTRY_BYTES = int(os.getenv("MCP_SUBRESOURCE_CACHE_MAX_ENTRY_BYTES", str(10 * 1024 * 1024)))
+
+
+# Resource types served from the cache
+CACHEABLE_RESOURCE_TYPES = frozenset(("script", "stylesheet", "font", "image"))
+
+# Upper bound of the freshness guessed from Last-Modified when a response has no explicit lifetime
+MAX_HEURISTIC_LIFETIME = 24 * 3600
+
+# Response headers that describe the transfer or the original client rather than the body
+_HOP_HEADERS = frozenset((
+    "connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length",
+    "set-cookie", "age", "date",
+))
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into lowercase directives mapped to their values (or None)."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _seconds(value: Optional[str]) -> Optional[int]:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def is_storable(status: int, headers: Dict[str, str]) -> bool:
+    """Whether a shared cache may store a response with this status and (lowercase) headers."""
+    if status != 200:
+        return False
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-store" in directives or "private" in directives:
+        return False
+    vary = {v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()}
+    return not (vary - {"accept-encoding"})
+
+
+def freshness_lifetime(headers: Dict[str, str]) -> float:
+    """
+    Seconds a response stays fresh from when it was received, after RFC 9111.
+
+    s-maxage and max-age take precedence over Expires; without either, 10% of
+    the time since Last-Modified is used, up to MAX_HEURISTIC_LIFETIME.
+    `no-cache` responses must always be revalidated.
+    """
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives:
+        return 0
+    age = _seconds(headers.get("age")) or 0
+
+    for name in ("s-maxage", "max-age"):
+        lifetime = _seconds(directives.get(name))
+        if lifetime is not None:
+            return max(0, lifetime - age)
+
+    date = _http_date(headers.get("date"))
+    if "expires" in headers:
+        expires = _http_date(headers["expires"])
+        if expires is None or date is None:
+            return 0
+        return max(0, expires - date - age)
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None and date is not None and date > last_modified:
+        return max(0, min((date - last_modified) / 10, MAX_HEURISTIC_LIFETIME) - age)
+    return 0
+
+
+class _Entry:
+    __slots__ = ("digest", "size", "headers", "expires_at")
+
+    def __init__(self, digest: str, size: int, headers: Dict[str, str], expires_at: float):
+        self.digest = digest
+        self.size = size
+        self.headers = headers
+        self.expires_at = expires_at
+
+
+class SubresourceCache:
+    """A content-addressed, byte-budgeted store of subresources that fulfills routed requests."""
+
+    def __init__(self, max_bytes: int = None, max_entry_bytes: int = None,
+                 clock: Callable[[], float] = time.time):
+        self._max_bytes = max_bytes if max_bytes is not None else SubresourceCacheConfig.MAX_BYTES
+        self._max_entry_bytes = (max_entry_bytes if max_entry_bytes is not None
+                                 else SubresourceCacheConfig.MAX_ENTRY_BYTES)
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bodies: Dict[str, bytes] = {}
+        self._refs: Dict[str, int] = {}
+        self._bytes = 0
+        self._flights = SingleFlight()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._stores = 0
+        self._shared_bodies = 0
+        self._uncacheable = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    async def attach(self, page: Page):
+        """Serve the cacheable requests of `page` through the cache; call before navigation."""
+        await page.route("**/*", self._handle)
+
+    def _unref(self, digest: str):
+        self._refs[digest] -= 1
+        if self._refs[digest] == 0:
+            del self._refs[digest]
+            self._bytes -= len(self._bodies.pop(digest))
+
+    def _remove(self, url: str):
+        self._unref(self._entries.pop(url).digest)
+
+    def _store(self, url: str, body: bytes, headers: Dict[str, str], lifetime: float):
+        if url in self._entries:
+            self._remove(url)
+        if len(body) > min(self._max_entry_bytes, self._max_bytes):
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        if digest in self._bodies:
+            self._shared_bodies += 1
+        else:
+            while self._entries and self._bytes + len(body) > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+            self._bodies[digest] = body
+            self._bytes += len(body)
+        self._refs[digest] = self._refs.get(digest, 0) + 1
+
+        kept = {name: value for name, value in headers.items() if name not in _HOP_HEADERS}
+        self._entries[url] = _Entry(digest, len(body), kept, self._clock() + lifetime)
+        self._stores += 1
+
+    def _refresh(self, url: str, entry: _Entry, headers: Dict[str, str]):
+        # A 304 carries updated metadata for the stored body
+        merged = {**entry.headers, **headers}
+        entry.headers = {name: value for name, value in merged.items() if name not in _HOP_HEADERS}
+        entry.expires_at = self._clock() + freshness_lifetime(merged)
+        self._entries.move_to_end(url)
+
+    async def _fulfill(self, route: Route, entry: _Entry):
+        await route.fulfill(status=200, headers=entry.headers, body=self._bodies[entry.digest])
+
+    async def _load(self, route: Route, url: str) -> Optional[_Entry]:
+        """
+        Fetch or revalidate `url` for `route`, fulfill it, and return the up-to-date
+        cache entry, or None if the response cannot be cached.
+        """
+        entry = self._entries.get(url)
+        headers = dict(route.request.headers)
+        if entry is not None:
+            if "etag" in entry.headers:
+                headers["if-none-match"] = entry.headers["etag"]
+            if "last-modified" in entry.headers:
+                headers["if-modified-since"] = entry.headers["last-modified"]
+
+        response = await route.fetch(headers=headers)
+        if response.status == 304 and entry is not None:
+            if self._entries.get(url) is entry:
+                self._refresh(url, entry, {name.lower(): value for name, value in response.headers.items()})
+                self._revalidations += 1
+                await self._fulfill(route, entry)
+                return entry
+            # Evicted while revalidating: load it in full
+            response = await route.fetch()
+
+        self._misses += 1
+        body = await response.body()
+        response_headers = {name.lower(): value for name, value in response.headers.items()}
+        lifetime = freshness_lifetime(response_headers)
+        validated = "etag" in response_headers or "last-modified" in response_headers
+        if is_storable(response.status, response_headers) and (lifetime > 0 or validated):
+            self._store(url, body, response_headers, lifetime)
+        elif url in self._entries:
+            self._remove(url)
+        stored = self._entries.get(url)
+        if stored is None:
+            self._uncacheable += 1
+        # The page that asked gets the response as it arrived, cookies included
+        await route.fulfill(response=response, body=body)
+        return stored
+
+    async def _handle(self, route: Route):
+        request = route.request
+        if (request.resource_type not in CACHEABLE_RESOURCE_TYPES or request.method != "GET"
+                or not request.url.startswith(("http://", "https://"))
+                or "range" in request.headers or "authorization" in request.headers):
+            await route.fallback()
+            return
+
+        url = request.url.split("#", 1)[0]
+        entry = self._entries.get(url)
+        if entry is not None and entry.expires_at > self._clock():
+            self._entries.move_to_end(url)
+            self._hits += 1
+            await self._fulfill(route, entry)
+            return
+
+        # The first request for a URL loads it; identical requests from other pages wait for it
+        try:
+            entry, joined = await self._flights.run(url, lambda: self._load(route, url))
+        except Exception:
+            # Let the request reach the network (or fail there) as if it was never routed
+            try:
+                await route.fallback()
+            except Exception:
+                pass
+            return
+        if not joined:
+            return
+        if entry is not None and self._entries.get(url) is entry:
+            self._hits += 1
+            await self._fulfill(route, entry)
+        else:
+            await route.fallback()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache usage and hit rates."""
+        lookups = self._hits + self._revalidations + self._misses
+        return {
+            "entries": len(self._entries),
+            "bodies": len(self._bodies),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "revalidations": self._revalidations,
+            "misses": self._misses,
+            "hit_rate": round((self._hits + self._revalidations) / lookups, 4) if lookups else None,
+            "stores": self._stores,
+            "shared_bodies": self._shared_bodies,
+            "uncacheable": self._uncacheable,
+            "evictions": self._evictions,
+        }
@@ -0,0 +1,44 @@
+"""
+Persistent browser profiles with an on-disk HTTP cache.
+
+By default Chromium runs without a profile on disk, so every restart and
+every fresh browser context downloads the same scripts, stylesheets and
+fonts again. When MCP_BROWSER_CACHE_DIR is set, the browser service and each
+pooled crawl4ai crawler run in their own persistent profile under that
+directory, with Chromium's disk cache capped at MCP_BROWSER_CACHE_MAX_BYTES.
+Cached subresources survive restarts and are shared by every call made
+through the same browser.
+
+A profile can only be used by one browser at a time, so the browser service
+and every crawler get separate profile directories.
+"""
+
+import os
+from typing import List
+
+
+class BrowserCacheConfig:
+    """Configuration for persistent browser profiles."""
+
+    # Directory holding the browser profiles; empty runs browsers without a profile on disk
+    DIR = os.getenv("MCP_BROWSER_CACHE_DIR", "")
+
+    # Size limit of the disk cache of each profile
+    MAX_BYTES = int(os.getenv("MCP_BROWSER_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+
+def browser_cache_enabled() -> bool:
+    """Whether browsers run with a persistent profile."""
+    return bool(BrowserCacheConfig.DIR)
+
+
+def profile_dir(name: str) -> str:
+    """Create and return the profile directory `name` under MCP_BROWSER_CACHE_DIR."""
+    path = os.path.join(os.path.abspath(os.path.expanduser(BrowserCacheConfig.DIR)), name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def disk_cache_args() -> List[str]:
+    """Chromium command-line switches for the profile's disk cache."""
+    return [f"--disk-cache-size={max(0, BrowserCacheConfig.MAX_BYTES)}"]
@@ -3,6 +3,7 @@ Crawl module for spider MCP server.
 
 This module provides web crawling capabilities using crawl4ai library.
 """
-from .crawl import crawl_web_page
+from .crawl import crawl_web_page, crawl_web_pages
+from .crawler_pool import CrawlerPool, get_crawler_pool, start_crawler_pool, close_crawler_pool
 
-__all__ = ["crawl_web_page"]
\ No newline at end of file
+__all__ = ["crawl_web_page", "crawl_web_pages", "CrawlerPool", "get_crawler_pool", "start_crawler_pool", "close_crawler_pool"]
\ No newline at end of file
@@ -1,22 +1,41 @@
 
 import asyncio
 import os
+import re
 import json
+import time
 import uuid
-import aiohttp
+import logging
+import urllib.parse
 import litellm
 
 from datetime import datetime
-from typing import Callable, List
+from typing import Any, Callable, Dict, List
 from pydantic import BaseModel, Field
 from crawl4ai.models import CrawlResult
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, LLMConfig, LLMExtractionStrategy
+from crawl4ai import CrawlerRunConfig, LLMConfig, LLMExtractionStrategy, SemaphoreDispatcher
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 
-from mcp_server.utils import save
+from mcp_server.utils import save_async
+from mcp_server.crawl.crawler_pool import get_crawler_pool
+from mcp_server.crawl.downloader import download_files
+from mcp_server.crawl.crawl_cache import get_crawl_cache, cache_key
+from mcp_server.http_render import validate_render_mode, parse_off_loop, FetchedPage
+from mcp_server.render_table import fetch_for_render, learn_render
+from mcp_server.single_flight import SingleFlight
 
 
 DEFAULT_INSTRUCTION = ""
 
+# Default number of pages crawled at the same time by crawl_web_pages
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv("MCP_CRAWL_BATCH_CONCURRENCY", "5"))
+
+# Maximum number of URLs accepted by a single crawl_web_pages call
+MAX_BATCH_URLS = int(os.getenv("MCP_CRAWL_BATCH_MAX_URLS", "1000"))
+
+# Renders in progress for crawl_web_page, shared by identical concurrent calls
+_crawl_flights = SingleFlight()
+
 
 def llm_config(
     instruction: str = "",
@@ -66,30 +85,225 @@ def crawl_config(
 ):
     return llm_config(instruction, save_screenshot, save_pdf, generate_markdown)
 
-async def save_download_files_json(path: str, result: CrawlResult, call: Callable[[str], None]):
-    if hasattr(result, 'downloaded_files') and result.downloaded_files:
-        save(path, 'downloaded_files.json', json.dumps(result.downloaded_files), call)
-
-        files_dir = os.path.join(path, 'files')
-        os.makedirs(files_dir, exist_ok=True)
-
-        # Download and save files from the downloaded files list to files subdirectory
-        for file_info in result.downloaded_files:
-            if 'url' in file_info and 'filename' in file_info:
-                file_url = file_info['url']
-                filename = file_info['filename']
-                file_path = os.path.join(files_dir, filename)
-                
-                try:
-                    # Use aiohttp to download file
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(file_url) as response:
-                            if response.status == 200:
-                                content = await response.read()
-                                save(file_path, filename, content, call)
-                except Exception as download_error:
-                    import logging
-                    logging.error(f"Failed to download {file_url}: {download_error}")
+async def save_download_files_json(path: str, result: CrawlResult, call: Callable[[str], None]) -> List[Dict[str, Any]]:
+    """
+    Save the downloaded files list and download every listed file into `path/files`.
+
+    Files are downloaded in parallel over a shared session and streamed to disk.
+    Per-file status, bytes and timing are saved to download_report.json.
+
+    Returns:
+        One download report per file
+    """
+    if not (hasattr(result, 'downloaded_files') and result.downloaded_files):
+        return []
+
+    await save_async(path, 'downloaded_files.json', json.dumps(result.downloaded_files), call)
+
+    files_dir = os.path.join(path, 'files')
+    os.makedirs(files_dir, exist_ok=True)
+
+    # Download and save files from the downloaded files list to files subdirectory
+    files = [
+        file_info for file_info in result.downloaded_files
+        if isinstance(file_info, dict) and 'url' in file_info and 'filename' in file_info
+    ]
+    if not files:
+        return []
+
+    reports = await download_files(files, files_dir, call)
+    await save_async(path, 'download_report.json', json.dumps(reports, ensure_ascii=False, indent=2), call)
+    return reports
+
+
+async def _notify_progress(progress_callback, message: str):
+    """Send a progress update, ignoring errors raised by non-async callbacks."""
+    if not progress_callback:
+        return
+    if asyncio.iscoroutinefunction(progress_callback):
+        await progress_callback(message)
+    else:
+        try:
+            result = progress_callback(message)
+            if asyncio.iscoroutine(result):
+                await result
+        except:
+            # If callback raises an error, just ignore it to maintain compatibility
+            pass
+
+
+async def save_crawl_result(
+    path: str,
+    result: CrawlResult,
+    save_screenshot: bool = False,
+    save_pdf: bool = False,
+    generate_markdown: bool = False,
+    progress_callback=None
+) -> List[str]:
+    """
+    Save a successful crawl result into `path` in all requested formats.
+
+    Args:
+        path: Directory to save the outputs into (created if missing)
+        result: The crawl result to save
+        save_screenshot: Whether to save the screenshot
+        save_pdf: Whether to save the PDF
+        generate_markdown: Whether to save the Markdown
+        progress_callback: Optional callback function to report progress
+
+    Returns:
+        List of saved file paths
+    """
+    os.makedirs(path, exist_ok=True)
+    files_dir = os.path.join(path, 'files')
+    os.makedirs(files_dir, exist_ok=True)
+
+    saved_files = []
+
+    # 1. Save HTML file
+    if result.html:
+        await _notify_progress(progress_callback, "Saving HTML file...")
+        await save_async(path, 'output.html', result.html, lambda s: saved_files.append(s))
+
+    # 2. Save JSON file (extracted_content or full result)
+    json_content = None
+    json_filename = 'output.json'
+
+    # Try to save LLM extracted content as JSON if available
+    if hasattr(result, 'extracted_content') and result.extracted_content:
+        json_content = result.extracted_content
+    # Otherwise save the full crawl result as JSON
+    else:
+        # Create a dictionary representation of the crawl result
+        crawl_result_dict = {
+            'success': result.success,
+            'url': result.url,
+            'html': result.html[:1000] + "..." if result.html and len(result.html) > 1000 else result.html,  # Truncate long HTML
+            'screenshot': bool(result.screenshot),
+            'pdf': bool(result.pdf),
+            'markdown': {
+                'raw_markdown': result.markdown.raw_markdown[:1000] + "..." if result.markdown and result.markdown.raw_markdown and len(result.markdown.raw_markdown) > 1000 else (result.markdown.raw_markdown if result.markdown else None),
+                'links': getattr(result.markdown, 'links', []) if result.markdown else [],
+                'metadata': getattr(result.markdown, 'metadata', {}) if result.markdown else {}
+            } if result.markdown else None,
+            'error_message': result.error_message,
+            'extra_info': result.extra_info if hasattr(result, 'extra_info') else {}
+        }
+        json_content = crawl_result_dict
+
+    if json_content:
+        await _notify_progress(progress_callback, "Generating JSON content...")
+        logging.info(f"Output JSON: {json_content}")
+        await save_async(path, json_filename, json.dumps(json_content, ensure_ascii=False, indent=2), lambda s: saved_files.append(s))
+
+    # 3. Save screenshot file
+    if save_screenshot and result.screenshot:
+        await _notify_progress(progress_callback, "Generating screenshot...")
+        await save_async(path, 'output.png', result.screenshot, lambda s: saved_files.append(s))
+
+    # 4. Save PDF file
+    if save_pdf and result.pdf:
+        await _notify_progress(progress_callback, "Generating PDF...")
+        await save_async(path, 'output.pdf', result.pdf, lambda s: saved_files.append(s))
+
+    # 5. Save Markdown file
+    if generate_markdown and hasattr(result, 'markdown') and result.markdown:
+        await _notify_progress(progress_callback, "Generating Markdown...")
+        await save_async(path, 'raw_markdown.md', result.markdown.raw_markdown, lambda s: saved_files.append(s))
+
+    # 6. Save downloaded files as JSON
+    await _notify_progress(progress_callback, "Processing downloaded files...")
+    await save_download_files_json(path, result, lambda s: saved_files.append(s))
+
+    return saved_files
+
+
+def static_crawl_result(page: FetchedPage, generate_markdown: bool = False) -> CrawlResult:
+    """
+    Build a CrawlResult from a page fetched over HTTP, so it is saved like a browser crawl.
+    """
+    success = page.status < 400
+    markdown = None
+    if generate_markdown and page.is_html:
+        markdown = DefaultMarkdownGenerator().generate_markdown(input_html=page.html, base_url=page.url)
+    return CrawlResult(
+        url=page.url,
+        html=page.html,
+        success=success,
+        markdown=markdown,
+        status_code=page.status,
+        response_headers=page.headers,
+        error_message=None if success else f"HTTP status {page.status}",
+    )
+
+
+async def _crawl_over_http(url: str, render: str, browser_only: bool,
+                           generate_markdown: bool, progress_callback=None):
+    """
+    Try the HTTP fast path for crawl_web_page.
+
+    Returns:
+        (CrawlResult, None, None) if the page was fetched without a browser, else (None, reason the
+        browser is needed, the fetched page to compare with the browser's result or None)
+    """
+    if browser_only:
+        if render == "http":
+            raise ValueError("instruction, save_screenshot and save_pdf require render \"browser\" or \"auto\"")
+        return None, "instruction, screenshot or PDF requested", None
+
+    await _notify_progress(progress_callback, "Fetching page over HTTP...")
+    fetched, reason = await fetch_for_render(url, render)
+    if reason is not None:
+        return None, reason, fetched
+    # Markdown generation parses the whole document
+    return await parse_off_loop(static_crawl_result, fetched, generate_markdown), None, None
+
+
+async def _render_for_crawl(url: str, render: str, instruction: str, save_screenshot: bool,
+                           save_pdf: bool, generate_markdown: bool, progress_callback=None):
+    """
+    Render one page for crawl_web_page, over HTTP or with a pooled crawler.
+
+    Returns:
+        (CrawlResult, "browser" or "HTTP")
+    """
+    result = None
+    fetched = None
+    if render != "browser":
+        result, reason, fetched = await _crawl_over_http(
+            url, render, bool(instruction or save_screenshot or save_pdf),
+            generate_markdown, progress_callback
+        )
+        if result is None:
+            await _notify_progress(progress_callback, f"Using the browser: {reason}")
+
+    if result is None:
+        await _notify_progress(progress_callback, "Acquiring crawler...")
+
+        # Check out a warm crawler from the pool instead of launching a new browser
+        async with get_crawler_pool().crawler() as crawler:
+            await _notify_progress(progress_callback, "Crawling page...")
+
+            result = await crawler.arun(url=url, config=crawl_config(
+                instruction,
+                save_screenshot,
+                save_pdf,
+                generate_markdown
+            ))
+        rendered_by = "browser"
+
+        # Compare the fetched document with the rendered one so the host's renderer is learned
+        if fetched is not None and fetched.is_html and result.success and result.html:
+            await learn_render(url, fetched.html, result.html)
+    else:
+        rendered_by = "HTTP"
+
+    return result, rendered_by
+
+
+def _unique_output_dir(path: str) -> str:
+    """A new output directory under `path`: the time of the crawl plus a random suffix, so calls never share one."""
+    return f"{path}/{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
 
 
 async def crawl_web_page(
@@ -99,7 +313,9 @@ async def crawl_web_page(
     save_screenshot: bool = False,
     save_pdf: bool = False,
     generate_markdown: bool = False,
-    progress_callback=None
+    progress_callback=None,
+    render: str = None,
+    use_cache: bool = True
 ) -> str:
     """
     Crawl a web page and save content in multiple formats (HTML, JSON, PDF, screenshot) with downloaded files.
@@ -108,6 +324,11 @@ async def crawl_web_page(
         url: The URL of the web page to crawl
         save_path: The base file path to save the crawled content and downloaded files
         progress_callback: Optional callback function to report progress
+        render: "browser" crawls with crawl4ai, "http" fetches and saves the page without a browser,
+            "auto" uses HTTP unless the page looks like it needs JavaScript, its host was learned
+            to, or a screenshot, PDF or LLM extraction is requested. Default MCP_DEFAULT_RENDER
+        use_cache: Serve a repeat crawl with the same options from the crawl cache (see crawl_cache)
+            and cache this one
 
     Returns:
         str: Success message or error message
@@ -119,211 +340,172 @@ async def crawl_web_page(
         return "Save path is required for saving content"
 
     try:
-        # Send progress update
-        if progress_callback:
-            if asyncio.iscoroutinefunction(progress_callback):
-                await progress_callback("Launching browser...")
-            else:
-                # If it's not a coroutine function, we need to handle it differently
-                try:
-                    result = progress_callback("Launching browser...")
-                    if asyncio.iscoroutine(result):
-                        await result
-                except:
-                    # If callback raises an error, just ignore it to maintain compatibility
-                    pass
-
-        # Configure browser and crawler
-        browser_config = BrowserConfig(headless=True, java_script_enabled=True)
-
-        # Use crawl4ai to crawl the web page
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Crawling page...")
-                else:
-                    try:
-                        result = progress_callback("Crawling page...")
-                        if asyncio.iscoroutine(result):
-                            await result
-                    except:
-                        pass
+        render = validate_render_mode(render)
 
-            result = await crawler.arun(url=url, config=crawl_config(
-                instruction,
-                save_screenshot,
-                save_pdf,
-                generate_markdown
-            ))
-
-            if result.success:
-                # Send progress update
-                if progress_callback:
-                    if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback("Crawl completed, starting to process content...")
-                    else:
-                        try:
-                            result = progress_callback("Crawl completed, starting to process content...")
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except:
-                            pass
-
-                # Create directories
-                path = f"{path}/{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-                os.makedirs(path, exist_ok=True)
-                files_dir = os.path.join(path, 'files')
-                os.makedirs(files_dir, exist_ok=True)
-
-                saved_files = []
-
-                # 1. Save HTML file
-                if result.html:
-                    if progress_callback:
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback("Saving HTML file...")
-                        else:
-                            try:
-                                result = progress_callback("Saving HTML file...")
-                                if asyncio.iscoroutine(result):
-                                    await result
-                            except:
-                                pass
-                    save(path, 'output.html', result.html, lambda s: saved_files.append(s))
-
-                # 2. Save JSON file (extracted_content or full result)
-                json_content = None
-                json_filename = 'output.json'
-
-                # Try to save LLM extracted content as JSON if available
-                if hasattr(result, 'extracted_content') and result.extracted_content:
-                    json_content = result.extracted_content
-                # Otherwise save the full crawl result as JSON
-                else:
-                    # Create a dictionary representation of the crawl result
-                    crawl_result_dict = {
-                        'success': result.success,
-                        'url': result.url,
-                        'html': result.html[:1000] + "..." if result.html and len(result.html) > 1000 else result.html,  # Truncate long HTML
-                        'screenshot': bool(result.screenshot),
-                        'pdf': bool(result.pdf),
-                        'markdown': {
-                            'raw_markdown': result.markdown.raw_markdown[:1000] + "..." if result.markdown and result.markdown.raw_markdown and len(result.markdown.raw_markdown) > 1000 else (result.markdown.raw_markdown if result.markdown else None),
-                            'links': getattr(result.markdown, 'links', []) if result.markdown else [],
-                            'metadata': getattr(result.markdown, 'metadata', {}) if result.markdown else {}
-                        } if result.markdown else None,
-                        'error_message': result.error_message,
-                        'extra_info': result.extra_info if hasattr(result, 'extra_info') else {}
-                    }
-                    json_content = crawl_result_dict
-
-                if json_content:
-                    if progress_callback:
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback("Generating JSON content...")
-                        else:
-                            try:
-                                result = progress_callback("Generating JSON content...")
-                                if asyncio.iscoroutine(result):
-                                    await result
-                            except:
-                                pass
-                    import logging
-                    logging.info(f"Output JSON: {json_content}")
-                    save(path, json_filename, json.dumps(json_content, ensure_ascii=False, indent=2), lambda s: saved_files.append(s))
-
-                # 3. Save screenshot file
-                if save_screenshot and result.screenshot:
-                    if progress_callback:
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback("Generating screenshot...")
-                        else:
-                            try:
-                                result = progress_callback("Generating screenshot...")
-                                if asyncio.iscoroutine(result):
-                                    await result
-                            except:
-                                pass
-                    save(path, 'output.png', result.screenshot, lambda s: saved_files.append(s))
-
-                # 4. Save PDF file
-                if save_pdf and result.pdf:
-                    if progress_callback:
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback("Generating PDF...")
-                        else:
-                            try:
-                                result = progress_callback("Generating PDF...")
-                                if asyncio.iscoroutine(result):
-                                    await result
-                            except:
-                                pass
-                    save(path, 'output.pdf', result.pdf, lambda s: saved_files.append(s))
-
-                # 5. Save Markdown file
-                if generate_markdown and hasattr(result, 'markdown') and result.markdown:
-                    if progress_callback:
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback("Generating Markdown...")
-                        else:
-                            try:
-                                result = progress_callback("Generating Markdown...")
-                                if asyncio.iscoroutine(result):
-                                    await result
-                            except:
-                                pass
-                    save(path, 'raw_markdown.md', result.markdown.raw_markdown, lambda s: saved_files.append(s))
-
-                # 6. Save downloaded files as JSON
-                if progress_callback:
-                    if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback("Processing downloaded files...")
-                    else:
-                        try:
-                            result = progress_callback("Processing downloaded files...")
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except:
-                            pass
-                await save_download_files_json(path, result, lambda s: saved_files.append(s))
-
-                if progress_callback:
-                    if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback(f"Final result JSON output...")
-                    else:
-                        try:
-                            result = progress_callback(f"Final result JSON output...")
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except:
-                            pass
-
-                return f"Successfully crawled {url} and saved {len(saved_files)} files to {path}"
-            else:
-                if progress_callback:
-                    if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback(f"Crawl failed: {result.error_message}")
-                    else:
-                        try:
-                            result = progress_callback(f"Crawl failed: {result.error_message}")
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except:
-                            pass
-                import logging
-                logging.error(f"Crawl error: {result.error_message}")
-                return f"Failed to crawl URL: {result.error_message}"
+        # A repeat crawl with the same options is copied from the cache instead of rendered again
+        cache = get_crawl_cache() if use_cache else None
+        key = cache_key(
+            url, instruction=instruction, save_screenshot=save_screenshot, save_pdf=save_pdf,
+            generate_markdown=generate_markdown, render=render
+        )
+        if cache is not None:
+            output_path = _unique_output_dir(path)
+            cached = await cache.restore(key, url, output_path)
+            if cached is not None:
+                files, meta, status = cached
+                await _notify_progress(progress_callback, f"Crawl cache {status}, copied cached outputs...")
+                return (
+                    f"Successfully crawled {url} ({meta['rendered_by']}, cache {status}) "
+                    f"and saved {len(files)} files to {output_path}"
+                )
+
+        # A crawl identical to one already rendering waits for that render, then saves its own copy
+        if _crawl_flights.in_flight(key):
+            await _notify_progress(progress_callback, "Waiting for an identical crawl already in progress...")
+        (result, rendered_by), joined = await _crawl_flights.run(key, lambda: _render_for_crawl(
+            url, render, instruction, save_screenshot, save_pdf, generate_markdown, progress_callback
+        ))
+
+        if result.success:
+            await _notify_progress(progress_callback, "Crawl completed, starting to process content...")
+
+            # Create directories; callers that shared this render each save into their own
+            path = _unique_output_dir(path)
+            saved_files = await save_crawl_result(
+                path, result, save_screenshot, save_pdf, generate_markdown,
+                progress_callback=progress_callback
+            )
+            if cache is not None and not joined:
+                await cache.store(key, url, path, saved_files, result.response_headers, rendered_by)
+
+            await _notify_progress(progress_callback, f"Final result JSON output...")
+
+            return f"Successfully crawled {url} ({rendered_by}) and saved {len(saved_files)} files to {path}"
+        else:
+            await _notify_progress(progress_callback, f"Crawl failed: {result.error_message}")
+            logging.error(f"Crawl error: {result.error_message}")
+            return f"Failed to crawl URL: {result.error_message}"
     except Exception as e:
-        if progress_callback:
-            if asyncio.iscoroutinefunction(progress_callback):
-                await progress_callback(f"An error occurred: {str(e)}")
-            else:
-                try:
-                    result = progress_callback(f"An error occurred: {str(e)}")
-                    if asyncio.iscoroutine(result):
-                        await result
-                except:
-                    pass
+        await _notify_progress(progress_callback, f"An error occurred: {str(e)}")
         return f"Error crawling URL or saving files: {str(e)}"
 
 
+def get_crawl_flight_stats() -> Dict[str, Any]:
+    """Get statistics of crawl_web_page renders shared by identical concurrent calls."""
+    return _crawl_flights.stats()
+
+
+def _batch_entry_dir(index: int, url: str) -> str:
+    """Build a readable, filesystem-safe directory name for one URL of a batch."""
+    parsed = urllib.parse.urlparse(url)
+    slug = re.sub(r'[^A-Za-z0-9._-]+', '_', f"{parsed.netloc}{parsed.path}").strip('_')
+    return f"{index:04d}-{slug[:80] or 'page'}"
+
+
+async def crawl_web_pages(
+    urls: List[str],
+    path: str,
+    instruction: str = "",
+    save_screenshot: bool = False,
+    save_pdf: bool = False,
+    generate_markdown: bool = False,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    progress_callback=None
+) -> Dict[str, Any]:
+    """
+    Crawl many web pages with bounded concurrency and save each one like crawl_web_page.
+
+    Results are streamed: every page is saved and reported through
+    progress_callback as soon as it finishes, not after the whole batch.
+
+    Args:
+        urls: The URLs of the web pages to crawl (duplicates are crawled once)
+        path: The base file path to save the crawled content into
+        instruction: The instruction to use for the LLM
+        save_screenshot: Whether to save a screenshot of each page
+        save_pdf: Whether to save a PDF of each page
+        generate_markdown: Whether to generate Markdown for each page
+        max_concurrency: Maximum number of pages crawled at the same time
+        progress_callback: Optional callback function to report progress
+
+    Returns:
+        The batch manifest, also saved as manifest.json in the batch directory
+    """
+    # Keep the first occurrence of every URL, preserving order
+    unique_urls = list(dict.fromkeys(urls))
+    batch_path = _unique_output_dir(path)
+    os.makedirs(batch_path, exist_ok=True)
+
+    indexes = {url: index for index, url in enumerate(unique_urls)}
+    # Results under a URL that was not submitted (e.g. rewritten by the crawler) are numbered after the rest
+    next_unknown_index = len(unique_urls)
+    entries: List[Dict[str, Any]] = []
+    started = time.monotonic()
+
+    await _notify_progress(progress_callback, f"Crawling {len(unique_urls)} pages with concurrency {max_concurrency}...")
+
+    config = crawl_config(instruction, save_screenshot, save_pdf, generate_markdown)
+    config.stream = True
+    dispatcher = SemaphoreDispatcher(semaphore_count=max_concurrency, max_session_permit=max_concurrency)
+
+    # A crawler failing partway keeps the pages finished so far; the rest are reported as failed
+    crawl_error = None
+    try:
+        async with get_crawler_pool().crawler() as crawler:
+            async for result in await crawler.arun_many(unique_urls, config=config, dispatcher=dispatcher):
+                index = indexes.get(result.url)
+                if index is None:
+                    index = next_unknown_index
+                    next_unknown_index += 1
+                entry = {
+                    "index": index,
+                    "url": result.url,
+                    "success": bool(result.success),
+                    "output_dir": None,
+                    "files": [],
+                    "error": None,
+                }
+                if result.success:
+                    try:
+                        output_dir = os.path.join(batch_path, _batch_entry_dir(index, result.url))
+                        entry["files"] = await save_crawl_result(
+                            output_dir, result, save_screenshot, save_pdf, generate_markdown
+                        )
+                        entry["output_dir"] = output_dir
+                    except Exception as e:
+                        entry["success"] = False
+                        entry["error"] = f"Error saving files: {str(e)}"
+                else:
+                    entry["error"] = result.error_message
+                entries.append(entry)
+
+                await _notify_progress(progress_callback, json.dumps({
+                    "completed": len(entries),
+                    "total": len(unique_urls),
+                    **{k: entry[k] for k in ("url", "success", "output_dir", "error")}
+                }, ensure_ascii=False))
+    except Exception as e:
+        crawl_error = f"Crawl failed: {str(e)}"
+        logging.error(f"Batch crawl stopped after {len(entries)} of {len(unique_urls)} pages: {str(e)}")
+        await _notify_progress(progress_callback, crawl_error)
+
+    # Pages the dispatcher never yielded (dropped, or the crawler failed first) are reported as failures
+    seen = {entry["url"] for entry in entries}
+    for url in unique_urls:
+        if url not in seen:
+            entries.append({
+                "index": indexes[url], "url": url, "success": False,
+                "output_dir": None, "files": [], "error": crawl_error or "No result returned for URL"
+            })
+
+    entries.sort(key=lambda entry: entry["index"])
+    manifest = {
+        "output_dir": batch_path,
+        "total": len(unique_urls),
+        "succeeded": sum(1 for entry in entries if entry["success"]),
+        "failed": sum(1 for entry in entries if not entry["success"]),
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        "pages": entries,
+    }
+    await save_async(batch_path, 'manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2), lambda s: None)
+    return manifest
@@ -0,0 +1,298 @@
+"""
+On-disk cache of crawl_web_page outputs.
+
+Entries are keyed by a hash of the normalized URL and every option that
+changes what a crawl saves (instruction, screenshot, PDF, Markdown, render
+mode). Each entry is a directory holding a copy of the saved files plus a
+meta.json with the response validators (ETag, Last-Modified) of the page.
+
+A repeat crawl within MCP_CRAWL_CACHE_TTL is served from the cache without
+any network request. After that, an entry with validators is revalidated
+with one conditional GET: a 304 serves the cached files again, anything else
+crawls afresh. The total size is bounded and the least recently used
+entries are removed first.
+
+The cache is off unless MCP_CRAWL_CACHE_DIR is set, since it serves crawls
+up to MCP_CRAWL_CACHE_TTL old without asking the site.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import urllib.parse
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from mcp_server.http_render import get_http_client
+from mcp_server.utils import get_io_executor
+
+
+class CrawlCacheConfig:
+    """Configuration for the crawl cache."""
+
+    # Directory the cache is kept in; empty disables the cache
+    DIR = os.getenv("MCP_CRAWL_CACHE_DIR", "")
+
+    # Seconds a cached crawl is served without revalidation
+    TTL = float(os.getenv("MCP_CRAWL_CACHE_TTL", "3600"))
+
+    # Total bytes kept for all cached crawls
+    MAX_BYTES = int(os.getenv("MCP_CRAWL_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Lower-case scheme and host, drop default ports and the fragment, sort the query."""
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_key(url: str, **options: Any) -> str:
+    """Content address of a crawl: a hash of the normalized URL and the crawl options."""
+    request = json.dumps({"url": normalize_url(url), **options}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+def _validators(headers: Optional[Dict[str, str]]) -> Dict[str, Optional[str]]:
+    lowered = {str(k).lower(): v for k, v in (headers or {}).items()}
+    return {"etag": lowered.get("etag"), "last_modified": lowered.get("last-modified")}
+
+
+def _write_entry(entry_dir: str, output_dir: str, files: List[str], meta: Dict[str, Any],
+                 max_bytes: int) -> Optional[int]:
+    """Copy saved files into a new entry directory; returns its size, or None if it exceeds max_bytes."""
+    size = sum(os.path.getsize(file) for file in files)
+    if size > max_bytes:
+        return None
+    # Build the entry beside the old one and swap it in, so a reader never sees half an entry
+    temp = f"{entry_dir}.{uuid.uuid4().hex}.tmp"
+    try:
+        for file in files:
+            target = os.path.join(temp, "outputs", os.path.relpath(file, output_dir))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(file, target)
+        meta = {**meta, "bytes": size}
+        with open(os.path.join(temp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(temp, entry_dir)
+    finally:
+        shutil.rmtree(temp, ignore_errors=True)
+    return size
+
+
+def _copy_entry(entry_dir: str, path: str, files: List[str]) -> List[str]:
+    restored = []
+    for relative in files:
+        target = os.path.join(path, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(os.path.join(entry_dir, "outputs", relative), target)
+        restored.append(target)
+    return restored
+
+
+def _read_entries(directory: str) -> List[Dict[str, Any]]:
+    """Metadata of the valid entries in `directory`, least recently used first."""
+    try:
+        names = os.listdir(directory) if os.path.isdir(directory) else []
+    except OSError as e:
+        logging.warning(f"Could not read crawl cache directory {directory}: {str(e)}")
+        return []
+    entries = []
+    for name in names:
+        entry_dir = os.path.join(directory, name)
+        if name.endswith(".tmp"):
+            # Left behind by a store that was interrupted
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            continue
+        try:
+            with open(os.path.join(entry_dir, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["key"] == name:
+                entries.append(meta)
+        except (OSError, ValueError, KeyError, TypeError):
+            logging.warning(f"Ignoring unreadable crawl cache entry {entry_dir}")
+    return sorted(entries, key=lambda meta: meta.get("last_used", 0))
+
+
+def _write_meta(entry_dir: str, meta: Dict[str, Any]):
+    with open(os.path.join(entry_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+class CrawlCache:
+    """A size-bounded, LRU-evicted directory of cached crawl outputs with HTTP revalidation."""
+
+    def __init__(self, directory: str, ttl: float = None, max_bytes: int = None,
+                 clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self._ttl = ttl if ttl is not None else CrawlCacheConfig.TTL
+        self._max_bytes = max_bytes if max_bytes is not None else CrawlCacheConfig.MAX_BYTES
+        self._clock = clock
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self):
+        """Read the entries already on disk, once; restore and store call this before first use."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            for meta in await self._run(_read_entries, self.directory):
+                self._entries[meta["key"]] = meta
+                self._bytes += meta.get("bytes", 0)
+            self._loaded = True
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(get_io_executor(), func, *args)
+
+    async def _remove(self, key: str):
+        meta = self._entries.pop(key, None)
+        if meta is not None:
+            self._bytes -= meta.get("bytes", 0)
+        await self._run(shutil.rmtree, self._entry_dir(key), True)
+
+    async def _revalidate(self, url: str, meta: Dict[str, Any]) -> bool:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        if not headers:
+            return False
+        try:
+            # The body is never read: anything but 304 means the page is crawled again
+            async with get_http_client().stream("GET", url, headers=headers) as response:
+                return response.status_code == 304
+        except httpx.HTTPError as e:
+            logging.info(f"Crawl cache revalidation failed for {url}: {str(e)}")
+            return False
+
+    async def restore(self, key: str, url: str, path: str) -> Optional[Tuple[List[str], Dict[str, Any], str]]:
+        """
+        Copy a cached crawl into `path` if it is fresh or still valid.
+
+        Returns:
+            (restored files, entry metadata, "hit" or "revalidated"), or None on a miss
+        """
+        await self.load()
+        meta = self._entries.get(key)
+        if meta is None:
+            self._misses += 1
+            return None
+
+        now = self._clock()
+        if meta["created"] + self._ttl > now:
+            status = "hit"
+        elif await self._revalidate(url, meta):
+            status = "revalidated"
+            meta["created"] = now
+        else:
+            await self._remove(key)
+            self._misses += 1
+            return None
+
+        try:
+            files = await self._run(_copy_entry, self._entry_dir(key), path, meta["files"])
+        except OSError as e:
+            logging.warning(f"Dropping damaged crawl cache entry {key}: {str(e)}")
+            await self._remove(key)
+            self._misses += 1
+            return None
+
+        if status == "hit":
+            self._hits += 1
+        else:
+            self._revalidations += 1
+        meta["last_used"] = now
+        self._entries.move_to_end(key)
+        try:
+            await self._run(_write_meta, self._entry_dir(key), dict(meta))
+        except OSError:
+            pass
+        return files, meta, status
+
+    async def store(self, key: str, url: str, output_dir: str, files: List[str],
+                    headers: Optional[Dict[str, str]] = None, rendered_by: str = None):
+        """Cache the files a crawl saved under `output_dir`, with the page's response validators."""
+        await self.load()
+        now = self._clock()
+        meta = {
+            "key": key,
+            "url": url,
+            "rendered_by": rendered_by,
+            **_validators(headers),
+            "files": [os.path.relpath(file, output_dir) for file in files],
+            "created": now,
+            "last_used": now,
+        }
+        try:
+            size = await self._run(_write_entry, self._entry_dir(key), output_dir, files, meta, self._max_bytes)
+        except OSError as e:
+            logging.warning(f"Could not cache crawl of {url}: {str(e)}")
+            return
+        if size is None:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.get("bytes", 0)
+        meta["bytes"] = size
+        self._entries[key] = meta
+        self._bytes += size
+        self._stores += 1
+
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            await self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache usage and hit/miss counts."""
+        return {
+            "directory": self.directory,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "revalidations": self._revalidations,
+            "misses": self._misses,
+            "stores": self._stores,
+            "evictions": self._evictions,
+        }
+
+
+# Global crawl cache instance
+_crawl_cache: Optional[CrawlCache] = None
+
+
+def get_crawl_cache() -> Optional[CrawlCache]:
+    """Get the crawl cache instance, or None if MCP_CRAWL_CACHE_DIR is empty"""
+    global _crawl_cache
+    if _crawl_cache is None and CrawlCacheConfig.DIR:
+        _crawl_cache = CrawlCache(CrawlCacheConfig.DIR)
+    return _crawl_cache
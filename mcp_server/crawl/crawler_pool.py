@@ -0,0 +1,190 @@
+"""
+Crawler pool for spider MCP server.
+
+Keeps a fixed number of warm AsyncWebCrawler instances alive for the lifetime
+of the server so that individual crawls do not pay a browser launch each time.
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from mcp_server.browser_cache import browser_cache_enabled, profile_dir, disk_cache_args
+
+
+class CrawlerPoolConfig:
+    """Configuration for the crawler pool."""
+
+    # Number of warm crawler instances kept by the pool
+    POOL_SIZE = int(os.getenv("MCP_CRAWLER_POOL_SIZE", "2"))
+
+    # Maximum time to wait for a free crawler before giving up
+    ACQUIRE_TIMEOUT = float(os.getenv("MCP_CRAWLER_ACQUIRE_TIMEOUT", "120"))  # seconds
+
+
+def default_browser_config(profile: int = 0) -> BrowserConfig:
+    """
+    Browser configuration used for pooled crawlers.
+
+    With MCP_BROWSER_CACHE_DIR set, crawler number `profile` runs in its own
+    persistent profile so its HTTP disk cache is kept across restarts.
+    """
+    if not browser_cache_enabled():
+        return BrowserConfig(headless=True, java_script_enabled=True)
+    return BrowserConfig(
+        headless=True,
+        java_script_enabled=True,
+        use_persistent_context=True,
+        user_data_dir=profile_dir(f"crawler-{profile}"),
+        extra_args=disk_cache_args(),
+    )
+
+
+class CrawlerPool:
+    """
+    A fixed-size pool of started AsyncWebCrawler instances.
+
+    Crawlers are checked out with `async with pool.crawler() as crawler:` and
+    returned automatically. A slot whose crawler failed is relaunched lazily on
+    its next checkout, so one crashed browser does not shrink the pool.
+    """
+
+    def __init__(self, size: Optional[int] = None,
+                 browser_config_factory: Callable[[int], BrowserConfig] = default_browser_config):
+        self._size = max(1, size if size is not None else CrawlerPoolConfig.POOL_SIZE)
+        self._browser_config_factory = browser_config_factory
+        # Each slot holds a started crawler, or None when it still has to be launched
+        self._slots: asyncio.Queue = asyncio.Queue()
+        self._crawlers: List[AsyncWebCrawler] = []
+        # Profile number of each live crawler; a profile is reused only once its browser closed
+        self._profiles: Dict[AsyncWebCrawler, int] = {}
+        self._in_use = 0
+        self._closed = False
+        for _ in range(self._size):
+            self._slots.put_nowait(None)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def _launch(self) -> AsyncWebCrawler:
+        """Create and start a new crawler instance."""
+        taken = set(self._profiles.values())
+        profile = next(n for n in range(len(taken) + 1) if n not in taken)
+        crawler = AsyncWebCrawler(config=self._browser_config_factory(profile))
+        self._profiles[crawler] = profile
+        try:
+            await crawler.start()
+        except BaseException:
+            del self._profiles[crawler]
+            raise
+        self._crawlers.append(crawler)
+        return crawler
+
+    async def _discard(self, crawler: AsyncWebCrawler):
+        """Close a crawler and forget about it."""
+        if crawler in self._crawlers:
+            self._crawlers.remove(crawler)
+        try:
+            await crawler.close()
+        except Exception as e:
+            logging.warning(f"Error closing crawler: {e}")
+        finally:
+            self._profiles.pop(crawler, None)
+
+    async def start(self):
+        """Launch every idle slot so the first crawls do not pay the browser start-up."""
+        warm = []
+        while not self._slots.empty():
+            warm.append(self._slots.get_nowait())
+
+        async def warm_slot(crawler: Optional[AsyncWebCrawler]) -> Optional[AsyncWebCrawler]:
+            if crawler is not None:
+                return crawler
+            try:
+                return await self._launch()
+            except Exception as e:
+                logging.error(f"Failed to launch pooled crawler: {e}")
+                return None
+
+        for crawler in await asyncio.gather(*(warm_slot(c) for c in warm)):
+            self._slots.put_nowait(crawler)
+        logging.info(f"Crawler pool started with {len(self._crawlers)}/{self._size} warm crawlers")
+
+    async def close(self):
+        """Close all crawlers owned by the pool."""
+        self._closed = True
+        crawlers = list(self._crawlers)
+        self._crawlers.clear()
+        for crawler in crawlers:
+            try:
+                await crawler.close()
+            except Exception as e:
+                logging.warning(f"Error closing crawler: {e}")
+        self._profiles.clear()
+
+    @asynccontextmanager
+    async def crawler(self) -> AsyncIterator[AsyncWebCrawler]:
+        """Check out a crawler for the duration of the `async with` block."""
+        if self._closed:
+            raise RuntimeError("Crawler pool is closed")
+
+        try:
+            crawler = await asyncio.wait_for(self._slots.get(), timeout=CrawlerPoolConfig.ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"No crawler became available within {CrawlerPoolConfig.ACQUIRE_TIMEOUT} seconds"
+            )
+
+        self._in_use += 1
+        healthy = False
+        try:
+            if crawler is None:
+                crawler = await self._launch()
+            yield crawler
+            healthy = True
+        finally:
+            self._in_use -= 1
+            if healthy or crawler is None:
+                self._slots.put_nowait(crawler)
+            else:
+                # The crawler may be left in an unknown state; relaunch it on next checkout
+                self._slots.put_nowait(None)
+                asyncio.ensure_future(self._discard(crawler))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current pool usage."""
+        return {
+            "size": self._size,
+            "warm": len(self._crawlers),
+            "in_use": self._in_use,
+            "idle": self._slots.qsize(),
+        }
+
+
+# Global crawler pool instance
+_crawler_pool: Optional[CrawlerPool] = None
+
+
+def get_crawler_pool() -> CrawlerPool:
+    """Get the crawler pool instance, creating an unstarted one if needed."""
+    global _crawler_pool
+    if _crawler_pool is None:
+        _crawler_pool = CrawlerPool()
+    return _crawler_pool
+
+
+async def start_crawler_pool():
+    """Create and warm up the global crawler pool."""
+    await get_crawler_pool().start()
+
+
+async def close_crawler_pool():
+    """Close the global crawler pool."""
+    global _crawler_pool
+    if _crawler_pool is not None:
+        await _crawler_pool.close()
+        _crawler_pool = None
@@ -0,0 +1,167 @@
+"""
+Concurrent file downloader for crawled pages.
+
+Files are fetched over one shared, pooled aiohttp session with a bounded
+number of parallel downloads, and streamed to disk in chunks with a per-file
+size cap instead of being read into memory whole. Disk writes run on the
+shared I/O thread pool so they never block the event loop.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+from mcp_server.utils import AsyncFileWriter, get_io_executor
+
+
+class DownloadConfig:
+    """Configuration for file downloads."""
+
+    # Number of files downloaded at the same time
+    CONCURRENCY = int(os.getenv("MCP_DOWNLOAD_CONCURRENCY", "8"))
+
+    # Files larger than this are aborted and removed
+    MAX_FILE_BYTES = int(os.getenv("MCP_DOWNLOAD_MAX_BYTES", str(100 * 1024 * 1024)))
+
+    # Total time allowed for a single file
+    TIMEOUT = float(os.getenv("MCP_DOWNLOAD_TIMEOUT", "120"))  # seconds
+
+    # Size of the chunks streamed to disk
+    CHUNK_SIZE = 64 * 1024
+
+
+# Shared download session, created lazily on the running event loop
+_download_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_download_session() -> aiohttp.ClientSession:
+    """Get the shared download session, creating it if needed."""
+    global _download_session
+    if _download_session is None or _download_session.closed:
+        connector = aiohttp.TCPConnector(limit=max(1, DownloadConfig.CONCURRENCY))
+        _download_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=DownloadConfig.TIMEOUT)
+        )
+    return _download_session
+
+
+async def close_download_session():
+    """Close the shared download session."""
+    global _download_session
+    if _download_session is not None:
+        await _download_session.close()
+        _download_session = None
+
+
+async def _run(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(get_io_executor(), func, *args)
+
+
+def _discard(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def download_file(session: aiohttp.ClientSession, url: str, file_path: str,
+                        max_bytes: int = None) -> Dict[str, Any]:
+    """
+    Stream one file to `file_path`.
+
+    The body is written to a temporary `.part` file that is renamed on success,
+    so an aborted, cancelled or oversized download never leaves a partial file
+    behind.
+
+    Returns:
+        A report with url, path, status, bytes, elapsed_ms and error (None on success)
+    """
+    max_bytes = max_bytes if max_bytes is not None else DownloadConfig.MAX_FILE_BYTES
+    report: Dict[str, Any] = {
+        "url": url,
+        "path": None,
+        "status": None,
+        "bytes": 0,
+        "elapsed_ms": 0.0,
+        "error": None,
+    }
+    started = time.monotonic()
+    part_path = file_path + ".part"
+    completed = False
+    try:
+        async with session.get(url) as response:
+            report["status"] = response.status
+            if response.status != 200:
+                report["error"] = f"HTTP {response.status}"
+                return report
+            if response.content_length is not None and response.content_length > max_bytes:
+                report["error"] = f"File exceeds maximum size of {max_bytes} bytes"
+                return report
+
+            async with AsyncFileWriter(part_path) as writer:
+                async for chunk in response.content.iter_chunked(DownloadConfig.CHUNK_SIZE):
+                    report["bytes"] += len(chunk)
+                    if report["bytes"] > max_bytes:
+                        raise ValueError(f"File exceeds maximum size of {max_bytes} bytes")
+                    await writer.write(chunk)
+
+        await _run(os.replace, part_path, file_path)
+        report["path"] = file_path
+        completed = True
+    except Exception as e:
+        report["error"] = str(e) or type(e).__name__
+        logging.error(f"Failed to download {url}: {report['error']}")
+    finally:
+        report["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+        # Also reached when the download is cancelled, which `except Exception` does not catch
+        if not completed:
+            await _run(_discard, part_path)
+    return report
+
+
+async def download_files(files: List[Dict[str, str]], files_dir: str, call: Callable[[str], None],
+                         concurrency: int = None) -> List[Dict[str, Any]]:
+    """
+    Download `{"url", "filename"}` entries into `files_dir` in parallel.
+
+    Args:
+        files: Entries with the file URL and the name to save it under
+        files_dir: Directory to save the files into
+        call: Called with the path of every file saved
+        concurrency: Maximum parallel downloads, default MCP_DOWNLOAD_CONCURRENCY
+
+    Entries sharing a filename are saved as `name-1.ext`, `name-2.ext`, ... so
+    parallel downloads never write the same file.
+
+    Returns:
+        One report per entry, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or DownloadConfig.CONCURRENCY))
+    session = get_download_session()
+
+    taken = set()
+
+    def unique_name(file_info: Dict[str, str]) -> str:
+        # Never let a filename escape files_dir
+        filename = os.path.basename(file_info['filename']) or 'download'
+        stem, ext = os.path.splitext(filename)
+        suffix = 0
+        while filename in taken:
+            suffix += 1
+            filename = f"{stem}-{suffix}{ext}"
+        taken.add(filename)
+        return filename
+
+    async def fetch(file_info: Dict[str, str], filename: str) -> Dict[str, Any]:
+        async with semaphore:
+            report = await download_file(session, file_info['url'], os.path.join(files_dir, filename))
+        report["filename"] = filename
+        if report["path"]:
+            call(report["path"])
+        return report
+
+    return list(await asyncio.gather(*(fetch(file_info, unique_name(file_info)) for file_info in files)))
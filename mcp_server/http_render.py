@@ -0,0 +1,292 @@
+"""
+HTTP-only fast path for static pages.
+
+Pages that do not need JavaScript are fetched with one pooled httpx client
+and parsed with BeautifulSoup (lxml), skipping Chromium entirely. The content
+has the same shape as the browser's extraction, so get_page_content and
+crawl_web_page can return it unchanged. In "auto" mode needs_browser()
+inspects the fetched document and falls back to the browser when the page
+looks like it renders its content with JavaScript; render_table learns per
+host which of the two a site actually needs. Documents can be megabytes
+long, so callers parse them on the shared I/O thread pool (parse_off_loop)
+rather than on the event loop.
+"""
+
+import asyncio
+import functools
+import os
+import re
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import httpx
+from bs4 import BeautifulSoup, UnicodeDammit
+
+from mcp_server.utils import get_io_executor
+
+
+class HttpRenderConfig:
+    """Configuration for the HTTP fast path."""
+
+    # Render mode used when a call does not choose one
+    DEFAULT_RENDER = os.getenv("MCP_DEFAULT_RENDER", "browser")
+
+    # Maximum number of connections kept by the shared HTTP client
+    MAX_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "20"))
+
+    # Total time allowed for fetching one page
+    TIMEOUT = float(os.getenv("MCP_HTTP_TIMEOUT", "30"))  # seconds
+
+    # Documents larger than this are not fetched over HTTP
+    MAX_BYTES = int(os.getenv("MCP_HTTP_MAX_BYTES", str(10 * 1024 * 1024)))
+
+    # A page with scripts and less visible text than this is assumed to render with JavaScript
+    MIN_TEXT_CHARS = int(os.getenv("MCP_HTTP_MIN_TEXT_CHARS", "200"))
+
+    USER_AGENT = os.getenv(
+        "MCP_HTTP_USER_AGENT",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+
+RENDER_MODES = ("auto", "browser", "http")
+
+# Element ids single-page app frameworks mount into
+APP_ROOT_IDS = ("root", "app", "__next", "__nuxt", "___gatsby", "svelte", "main-app")
+
+# Content types served as-is, for which a browser adds nothing
+_HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+T = TypeVar("T")
+
+_NOSCRIPT_HINT = re.compile(r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(required|disabled)", re.I)
+
+
+def validate_render_mode(render: Optional[str]) -> str:
+    """Return the render mode, defaulting to MCP_DEFAULT_RENDER; raises ValueError if unknown."""
+    if render is None:
+        render = HttpRenderConfig.DEFAULT_RENDER
+    if render not in RENDER_MODES:
+        raise ValueError(f"render must be one of: {', '.join(RENDER_MODES)}")
+    return render
+
+
+# Shared HTTP client, created lazily on the running event loop
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if needed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        connections = max(1, HttpRenderConfig.MAX_CONNECTIONS)
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=httpx.Timeout(HttpRenderConfig.TIMEOUT),
+            limits=httpx.Limits(max_connections=connections, max_keepalive_connections=connections),
+            headers={
+                "User-Agent": HttpRenderConfig.USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            },
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class FetchedPage:
+    """A document fetched over HTTP and decoded."""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], html: str):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        self.html = html
+        self._soup: Optional[BeautifulSoup] = None
+
+    @property
+    def is_html(self) -> bool:
+        return not self.content_type or self.content_type in _HTML_TYPES
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+
+def _decode(body: bytes, charset: Optional[str]) -> str:
+    return UnicodeDammit(body, [charset] if charset else [], is_html=True).unicode_markup or ""
+
+
+async def fetch_page(url: str, max_bytes: Optional[int] = None) -> FetchedPage:
+    """
+    Fetch and decode one document, following redirects.
+
+    The charset comes from the Content-Type header, else from the document's
+    own <meta charset>, else it is detected.
+
+    Raises:
+        ValueError: If the document is larger than max_bytes
+        httpx.HTTPError: If the request fails
+    """
+    max_bytes = HttpRenderConfig.MAX_BYTES if max_bytes is None else max_bytes
+    async with get_http_client().stream("GET", url) as response:
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ValueError(f"Document of {declared} bytes exceeds {max_bytes} bytes")
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"Document exceeds {max_bytes} bytes")
+            chunks.append(chunk)
+        body = b"".join(chunks)
+        charset = response.charset_encoding
+        headers = dict(response.headers)
+        final_url = str(response.url)
+        status = response.status_code
+
+    # Charset detection reads the whole body
+    html = await parse_off_loop(_decode, body, charset)
+    return FetchedPage(final_url, status, headers, html)
+
+
+async def parse_off_loop(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a parsing function such as needs_browser or extract_static_content on the I/O thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        get_io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def missing_selector(page: FetchedPage, wait_for_selector: Optional[str] = None) -> Optional[str]:
+    """
+    Check that the element a call waits for is already in the fetched document.
+
+    Returns:
+        The reason the browser is needed, or None if the selector is present or not given
+    """
+    if not wait_for_selector or not page.is_html:
+        return None
+    try:
+        if page.soup.select_one(wait_for_selector) is None:
+            return f"selector {wait_for_selector!r} not in static HTML"
+    except Exception:
+        return f"selector {wait_for_selector!r} not supported by the static parser"
+    return None
+
+
+def needs_browser(page: FetchedPage, wait_for_selector: Optional[str] = None) -> Optional[str]:
+    """
+    Decide whether a fetched document needs a real browser to show its content.
+
+    Returns:
+        The reason the browser is needed, or None if the HTTP result is good enough
+    """
+    if not page.is_html:
+        return None
+    soup = page.soup
+
+    reason = missing_selector(page, wait_for_selector)
+    if reason is not None:
+        return reason
+
+    for noscript in soup.find_all("noscript"):
+        if _NOSCRIPT_HINT.search(noscript.get_text(" ")):
+            return "page asks for JavaScript in <noscript>"
+
+    for element_id in APP_ROOT_IDS:
+        root = soup.find(id=element_id)
+        if root is not None and not root.get_text(strip=True):
+            return f"empty application root #{element_id}"
+
+    scripts = soup.find_all("script")
+    body = soup.body
+    text = body.get_text(" ", strip=True) if body else ""
+    if scripts and len(text) < HttpRenderConfig.MIN_TEXT_CHARS:
+        return f"only {len(text)} characters of text next to {len(scripts)} scripts"
+    return None
+
+
+def _clip(truncated: Dict[str, int], name: str, value: Optional[str], limit: Optional[int]) -> Optional[str]:
+    if value is not None and limit is not None and len(value) > limit:
+        truncated[name] = len(value)
+        return value[:limit]
+    return value
+
+
+def _collect(truncated: Dict[str, int], name: str, elements: list, limit: Optional[int]) -> list:
+    if limit is not None and len(elements) > limit:
+        truncated[name] = len(elements)
+        return elements[:limit]
+    return elements
+
+
+def extract_static_content(page: FetchedPage, fields: Optional[List[str]] = None,
+                           max_links: Optional[int] = None, max_images: Optional[int] = None,
+                           max_text_chars: Optional[int] = None,
+                           max_html_chars: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Extract get_page_content fields from a fetched document.
+
+    Mirrors the browser's extraction: the same field names, limits and
+    `truncated` entry, with link and image URLs resolved against the page
+    (or its <base href>). Non-HTML documents return their body as text.
+    """
+    want = set(fields) if fields else {"title", "html", "text", "meta", "links", "images"}
+    result: Dict[str, Any] = {}
+    truncated: Dict[str, int] = {}
+
+    if not page.is_html:
+        if "title" in want:
+            result["title"] = ""
+        if "html" in want:
+            result["html"] = _clip(truncated, "html", page.html, max_html_chars)
+        if "text" in want:
+            result["text"] = _clip(truncated, "text", page.html, max_text_chars)
+        for name in ("meta", "links", "images"):
+            if name in want:
+                result[name] = []
+        if truncated:
+            result["truncated"] = truncated
+        return result
+
+    soup = page.soup
+    base = soup.find("base", href=True)
+    base_url = urllib.parse.urljoin(page.url, base["href"]) if base else page.url
+
+    def absolute(value: Optional[str]) -> str:
+        return urllib.parse.urljoin(base_url, value.strip()) if value else ""
+
+    if "title" in want:
+        result["title"] = soup.title.get_text().strip() if soup.title else ""
+    if "html" in want:
+        result["html"] = _clip(truncated, "html", page.html, max_html_chars)
+    if "text" in want:
+        result["text"] = _clip(truncated, "text", soup.body.get_text() if soup.body else None, max_text_chars)
+    if "meta" in want:
+        result["meta"] = [
+            {"name": el.get("name") or el.get("property"), "content": el.get("content", "")}
+            for el in soup.find_all("meta")
+        ]
+    if "links" in want:
+        result["links"] = [
+            {"text": el.get_text(" ", strip=True), "href": absolute(el.get("href"))}
+            for el in _collect(truncated, "links", soup.find_all("a"), max_links)
+        ]
+    if "images" in want:
+        result["images"] = [
+            {"src": absolute(el.get("src")), "alt": el.get("alt", "")}
+            for el in _collect(truncated, "images", soup.find_all("img"), max_images)
+        ]
+    if truncated:
+        result["truncated"] = truncated
+    return result
@@ -0,0 +1,250 @@
+"""
+Per-host memory of which renderer a site needs.
+
+In "auto" render mode every page used to be fetched over HTTP and judged by
+the needs_browser() heuristics. This table remembers, per host, whether the
+HTTP result actually matched what the browser rendered: whenever a page was
+rendered in the browser after an HTTP fetch, the two documents are compared
+(body text length and content structure) and the verdict is recorded. Later
+calls for a host learned as "http" skip the heuristics, and calls for a host
+learned as "browser" skip the HTTP fetch. A small fraction of calls is still
+rendered both ways so verdicts keep up with site changes.
+
+The table is kept in a small JSON file so it survives restarts; entries
+expire after a TTL and the least recently used hosts are dropped first.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+import urllib.parse
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from mcp_server.http_render import FetchedPage, fetch_page, needs_browser, missing_selector, parse_off_loop
+from mcp_server.utils import get_io_executor
+
+
+class RenderTableConfig:
+    """Configuration for the learned render table."""
+
+    # JSON file the table is kept in; empty to keep it in memory only
+    PATH = os.getenv(
+        "MCP_RENDER_TABLE_PATH",
+        os.path.join(os.path.expanduser("~"), ".cache", "dev-tool-mcp", "render_table.json")
+    )
+
+    # Seconds a learned verdict is trusted
+    TTL = float(os.getenv("MCP_RENDER_TABLE_TTL", str(7 * 24 * 3600)))
+
+    # Maximum number of hosts remembered
+    MAX_HOSTS = int(os.getenv("MCP_RENDER_TABLE_MAX_HOSTS", "10000"))
+
+    # Fraction of "auto" calls rendered both ways to check the verdict
+    SAMPLE_RATE = float(os.getenv("MCP_RENDER_SAMPLE_RATE", "0.05"))
+
+    # Similarity from which the HTTP result counts as equivalent to the browser's
+    SIMILARITY = float(os.getenv("MCP_RENDER_SIMILARITY", "0.8"))
+
+
+# Elements that carry a page's content, compared between the two documents
+CONTENT_TAGS = (
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "dt", "dd", "a", "img", "table", "tr",
+    "td", "th", "pre", "blockquote", "figure", "article", "section", "form", "input",
+)
+
+
+def _content_signature(html: str) -> Tuple[int, Counter]:
+    soup = BeautifulSoup(html, "lxml")
+    body = soup.body
+    if body is None:
+        return 0, Counter()
+    text = body.get_text(" ", strip=True)
+    return len(text), Counter(el.name for el in body.find_all(CONTENT_TAGS))
+
+
+def content_similarity(static_html: str, rendered_html: str) -> float:
+    """
+    How closely a statically fetched document matches the rendered DOM, from 0 to 1.
+
+    The lower of the body text length ratio and the weighted overlap of
+    content element counts (headings, paragraphs, links, images...), so
+    wrapper markup added by scripts does not count but missing content does.
+    """
+    static_chars, static_tags = _content_signature(static_html)
+    rendered_chars, rendered_tags = _content_signature(rendered_html)
+
+    longest = max(static_chars, rendered_chars)
+    text_ratio = min(static_chars, rendered_chars) / longest if longest else 1.0
+
+    tags = static_tags.keys() | rendered_tags.keys()
+    union = sum(max(static_tags[t], rendered_tags[t]) for t in tags)
+    overlap = sum(min(static_tags[t], rendered_tags[t]) for t in tags)
+    structure = overlap / union if union else 1.0
+
+    return round(min(text_ratio, structure), 3)
+
+
+def render_host(url: str) -> str:
+    """The table key for a URL: its host and port."""
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+class RenderTable:
+    """Learned renderer per host, with TTL expiry, LRU eviction and a JSON file behind it."""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = None, max_hosts: int = None,
+                 sample_rate: float = None, similarity: float = None,
+                 clock: Callable[[], float] = time.time, rng: Callable[[], float] = random.random):
+        self.path = path
+        self._ttl = ttl if ttl is not None else RenderTableConfig.TTL
+        self._max_hosts = max(1, max_hosts if max_hosts is not None else RenderTableConfig.MAX_HOSTS)
+        self._sample_rate = sample_rate if sample_rate is not None else RenderTableConfig.SAMPLE_RATE
+        self._similarity = similarity if similarity is not None else RenderTableConfig.SIMILARITY
+        self._clock = clock
+        self._rng = rng
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Saves run one at a time, so an older snapshot never replaces a newer one
+        self._save_lock = asyncio.Lock()
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                hosts = json.load(f).get("hosts", {})
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"Ignoring unreadable render table {self.path}: {str(e)}")
+            return
+        now = self._clock()
+        # Oldest first, so the most recently updated hosts survive eviction
+        for host, entry in sorted(hosts.items(), key=lambda item: item[1].get("updated", 0)):
+            if entry.get("mode") in ("http", "browser") and entry.get("updated", 0) + self._ttl > now:
+                self._entries[host] = entry
+        while len(self._entries) > self._max_hosts:
+            self._entries.popitem(last=False)
+
+    def lookup(self, host: str) -> Optional[Dict[str, Any]]:
+        """The learned entry for a host, or None if unknown or expired."""
+        entry = self._entries.get(host)
+        if entry is None:
+            return None
+        if entry["updated"] + self._ttl <= self._clock():
+            del self._entries[host]
+            return None
+        self._entries.move_to_end(host)
+        return entry
+
+    def plan(self, host: str) -> Tuple[Optional[str], bool]:
+        """
+        Returns:
+            (learned mode or None, whether this call should render both ways to check it)
+        """
+        entry = self.lookup(host)
+        return (entry["mode"] if entry else None), self._rng() < self._sample_rate
+
+    async def record(self, host: str, similarity: float) -> str:
+        """Record a comparison for a host and persist the table; returns the learned mode."""
+        previous = self._entries.pop(host, None)
+        mode = "http" if similarity >= self._similarity else "browser"
+        self._entries[host] = {
+            "mode": mode,
+            "similarity": similarity,
+            "samples": (previous["samples"] if previous else 0) + 1,
+            "updated": self._clock(),
+        }
+        while len(self._entries) > self._max_hosts:
+            self._entries.popitem(last=False)
+        if self.path:
+            try:
+                async with self._save_lock:
+                    # Entries are replaced rather than modified, so a shallow copy is a stable snapshot
+                    hosts = dict(self._entries)
+                    await asyncio.get_running_loop().run_in_executor(get_io_executor(), self._write, hosts)
+            except OSError as e:
+                logging.warning(f"Could not save render table {self.path}: {str(e)}")
+        return mode
+
+    def _write(self, hosts: Dict[str, Dict[str, Any]]):
+        text = json.dumps({"version": 1, "hosts": hosts}, ensure_ascii=False)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write a private temporary file and swap it in, so readers never see a partial table
+        temp = f"{self.path}.{os.getpid()}.{id(text)}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp, self.path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of hosts learned per mode."""
+        modes = Counter(entry["mode"] for entry in self._entries.values())
+        return {"hosts": len(self._entries), "http": modes["http"], "browser": modes["browser"]}
+
+
+# Global render table instance
+_render_table: Optional[RenderTable] = None
+
+
+def get_render_table() -> RenderTable:
+    """Get the render table instance, loading it from MCP_RENDER_TABLE_PATH on first use"""
+    global _render_table
+    if _render_table is None:
+        _render_table = RenderTable(RenderTableConfig.PATH or None)
+    return _render_table
+
+
+async def fetch_for_render(url: str, render: str,
+                           wait_for_selector: Optional[str] = None) -> Tuple[Optional[FetchedPage], Optional[str]]:
+    """
+    The HTTP side of render "http" and "auto".
+
+    Returns:
+        (fetched page, None) if the HTTP result should be used, else (fetched page or None,
+        reason the browser is needed). When a page was fetched and the browser is used
+        anyway, pass both documents to learn_render().
+
+    Raises:
+        Exception: If the fetch fails in "http" mode
+    """
+    learned, verify = None, False
+    if render == "auto":
+        learned, verify = get_render_table().plan(render_host(url))
+        if learned == "browser" and not verify:
+            return None, "learned for this host"
+
+    try:
+        fetched = await fetch_page(url)
+    except Exception as e:
+        if render == "http":
+            raise
+        return None, f"HTTP fetch failed: {str(e)}"
+    if render == "http":
+        return fetched, None
+
+    # A host whose HTTP pages matched the browser skips the heuristics, but not the call's selector
+    if learned == "http":
+        reason = await parse_off_loop(missing_selector, fetched, wait_for_selector)
+    else:
+        reason = await parse_off_loop(needs_browser, fetched, wait_for_selector)
+    if reason is None and verify and fetched.is_html:
+        reason = "sampled to check the learned renderer for this host"
+    return fetched, reason
+
+
+async def learn_render(url: str, static_html: str, rendered_html: str) -> Dict[str, Any]:
+    """
+    Compare an HTTP-fetched document with the browser's DOM for the same URL and record the verdict.
+
+    Returns:
+        The similarity and the mode now learned for the host
+    """
+    similarity = await parse_off_loop(content_similarity, static_html, rendered_html)
+    learned = await get_render_table().record(render_host(url), similarity)
+    return {"similarity": similarity, "learned": learned}
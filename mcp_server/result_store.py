@@ -0,0 +1,188 @@
+"""
+Server-side store for large tool results, handed out as cursor-addressed chunks.
+
+Tool results above MCP_RESULT_INLINE_LIMIT characters are not returned in a
+single TextContent. Instead the first chunk is returned together with a cursor
+that the client passes to the get_result_chunk tool to read the rest. Stored
+results expire after a TTL and the oldest are evicted once the total byte
+budget is exceeded.
+"""
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+
+class ResultStoreConfig:
+    """Configuration for the result store."""
+
+    # Results longer than this many characters are paged instead of returned inline
+    INLINE_LIMIT = int(os.getenv("MCP_RESULT_INLINE_LIMIT", "100000"))
+
+    # Size of each chunk in bytes (UTF-8)
+    CHUNK_SIZE = int(os.getenv("MCP_RESULT_CHUNK_SIZE", "65536"))
+
+    # Seconds a stored result stays readable
+    TTL = float(os.getenv("MCP_RESULT_TTL", "600"))
+
+    # Total bytes kept for all stored results
+    MAX_BYTES = int(os.getenv("MCP_RESULT_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class _StoredResult:
+    __slots__ = ("data", "offsets", "expires_at")
+
+    def __init__(self, data: bytes, offsets: List[int], expires_at: float):
+        self.data = data
+        self.offsets = offsets
+        self.expires_at = expires_at
+
+
+def _chunk_offsets(data: bytes, chunk_size: int) -> List[int]:
+    """Split points for `data` that never cut a multi-byte UTF-8 sequence."""
+    offsets = [0]
+    while offsets[-1] < len(data):
+        end = min(offsets[-1] + chunk_size, len(data))
+        # Back off while the byte at the cut is a UTF-8 continuation byte
+        while end < len(data) and end > offsets[-1] + 1 and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        offsets.append(end)
+    return offsets
+
+
+class ResultStore:
+    """A bounded, TTL-limited store of chunked results, evicting least recently read first."""
+
+    def __init__(self, chunk_size: int = None, ttl: float = None, max_bytes: int = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._chunk_size = max(16, chunk_size or ResultStoreConfig.CHUNK_SIZE)
+        self._ttl = ttl if ttl is not None else ResultStoreConfig.TTL
+        self._max_bytes = max_bytes if max_bytes is not None else ResultStoreConfig.MAX_BYTES
+        self._clock = clock
+        self._results: "OrderedDict[str, _StoredResult]" = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+
+    def _remove(self, result_id: str):
+        stored = self._results.pop(result_id)
+        self._bytes -= len(stored.data)
+
+    def _evict_expired(self):
+        now = self._clock()
+        for result_id in [rid for rid, stored in self._results.items() if stored.expires_at <= now]:
+            self._remove(result_id)
+            self._evictions += 1
+
+    def put(self, text: str) -> Tuple[str, int]:
+        """
+        Store a result and return its id and number of chunks.
+
+        Raises:
+            ValueError: If the result alone exceeds the store's byte budget
+        """
+        data = text.encode("utf-8")
+        if len(data) > self._max_bytes:
+            raise ValueError(
+                f"Result of {len(data)} bytes exceeds the result store budget of {self._max_bytes} bytes; "
+                "request fewer fields or lower limits"
+            )
+
+        self._evict_expired()
+        while self._results and self._bytes + len(data) > self._max_bytes:
+            self._remove(next(iter(self._results)))
+            self._evictions += 1
+
+        result_id = uuid.uuid4().hex
+        offsets = _chunk_offsets(data, self._chunk_size)
+        self._results[result_id] = _StoredResult(data, offsets, self._clock() + self._ttl)
+        self._bytes += len(data)
+        return result_id, len(offsets) - 1
+
+    def get_chunk(self, result_id: str, index: int) -> Tuple[str, int]:
+        """
+        Return chunk `index` of a stored result and the total number of chunks.
+
+        Raises:
+            KeyError: If the result is unknown or has expired
+            IndexError: If the chunk index is out of range
+        """
+        self._evict_expired()
+        stored = self._results.get(result_id)
+        if stored is None:
+            raise KeyError(f"Unknown or expired result: {result_id}")
+        total = len(stored.offsets) - 1
+        if index < 0 or index >= total:
+            raise IndexError(f"Chunk {index} out of range, result has {total} chunks")
+        self._results.move_to_end(result_id)
+        chunk = stored.data[stored.offsets[index]:stored.offsets[index + 1]].decode("utf-8")
+        return chunk, total
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current store usage."""
+        return {
+            "results": len(self._results),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+        }
+
+
+def make_cursor(result_id: str, index: int) -> str:
+    """Build the opaque cursor for a chunk."""
+    return f"{result_id}:{index}"
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a cursor into result id and chunk index, raising ValueError if malformed."""
+    result_id, sep, index = cursor.rpartition(":")
+    if not sep or not result_id or not index.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return result_id, int(index)
+
+
+def chunk_response(store: "ResultStore", result_id: str, index: int) -> List[TextContent]:
+    """Build the tool output for one chunk: the chunk text followed by paging metadata."""
+    chunk, total = store.get_chunk(result_id, index)
+    next_index = index + 1
+    page_info = {
+        "result_id": result_id,
+        "chunk": index,
+        "total_chunks": total,
+        "next_cursor": make_cursor(result_id, next_index) if next_index < total else None,
+    }
+    return [
+        TextContent(type="text", text=chunk),
+        TextContent(type="text", text=json.dumps({"pagination": page_info}, ensure_ascii=False)),
+    ]
+
+
+def paginate_text(text: str, inline_limit: Optional[int] = None) -> List[TextContent]:
+    """
+    Return `text` inline if it is small, otherwise store it and return its first chunk.
+
+    The first chunk is followed by a pagination entry whose `next_cursor` is passed
+    to get_result_chunk to read the next chunk.
+    """
+    limit = inline_limit if inline_limit is not None else ResultStoreConfig.INLINE_LIMIT
+    if len(text) <= limit:
+        return [TextContent(type="text", text=text)]
+
+    store = get_result_store()
+    result_id, _ = store.put(text)
+    return chunk_response(store, result_id, 0)
+
+
+# Global result store instance
+_result_store: Optional[ResultStore] = None
+
+
+def get_result_store() -> ResultStore:
+    """Get the result store instance"""
+    global _result_store
+    if _result_store is None:
+        _result_store = ResultStore()
+    return _result_store
@@ -17,6 +17,12 @@ from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource, Progres
 
 from mcp_server.tool_loader import get_all_mcp_tools
 from mcp_server.mcp_tool import MCPTool
+from mcp_server.crawl.crawler_pool import start_crawler_pool, close_crawler_pool
+from mcp_server.crawl.crawl_cache import get_crawl_cache
+from mcp_server.crawl.downloader import close_download_session
+from mcp_server.http_render import close_http_client
+from mcp_server.utils import shutdown_io_executor
+from mcp_server.browser.browser_service import close_browser_service
 
 
 # Define type alias to simplify complex type annotations
@@ -190,13 +196,50 @@ async def startup():
     # Initialize tools
     await initialize_tools()
 
+    # Warm up the crawler pool; crawlers are launched lazily if this fails
+    try:
+        await start_crawler_pool()
+    except Exception as e:
+        logging.error(f"Failed to start crawler pool: {e}")
+
+    # Read the crawl cache index now rather than during the first crawl; if this fails, the first crawl retries it
+    try:
+        crawl_cache = get_crawl_cache()
+        if crawl_cache is not None:
+            await crawl_cache.load()
+    except Exception as e:
+        logging.warning(f"Failed to load crawl cache: {e}")
+
     logging.info("MCP Server startup completed")
 
 
 async def shutdown():
     """Cleanup resources at shutdown."""
     logging.info("MCP Server shutting down...")
-    # Add any cleanup logic here if needed
+
+    try:
+        await close_crawler_pool()
+    except Exception as e:
+        logging.error(f"Failed to close crawler pool: {e}")
+
+    try:
+        await close_download_session()
+    except Exception as e:
+        logging.error(f"Failed to close download session: {e}")
+
+    try:
+        await close_http_client()
+    except Exception as e:
+        logging.error(f"Failed to close HTTP client: {e}")
+
+    try:
+        await close_browser_service()
+    except Exception as e:
+        logging.error(f"Failed to close browser service: {e}")
+
+    # Wait for pending file writes before exiting
+    shutdown_io_executor()
+
     logging.info("MCP Server shutdown completed")
 
 
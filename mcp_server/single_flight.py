@@ -0,0 +1,85 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When a call arrives while an identical one (same key) is still running, it
+waits for that call's result instead of starting its own navigation or
+crawl. The shared work runs in its own task, so one waiter being cancelled
+does not cancel it for the others; it is only cancelled once every waiter
+has gone. Errors reach every waiter, and nothing is remembered once the
+call finishes, so the next call starts afresh.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome with concurrent callers."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._started = 0
+        self._joined = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call with this key is running."""
+        return key in self._flights
+
+    def _done(self, key: Hashable, flight: _Flight, task: asyncio.Future):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the error as retrieved even if every waiter left before it was raised
+        if not task.cancelled():
+            task.exception()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run `func()` unless a call with the same key is running, in which case wait for that one.
+
+        Returns:
+            (result, whether it was shared from a call that was already running). Callers
+            that joined receive the same result object as the caller that started the call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        flight = self._flights.get(key)
+        joined = flight is not None
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self._done, key, flight))
+            self._started += 1
+        else:
+            self._joined += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), joined
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled: stop the work, and let a new caller start afresh
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of running calls and how many callers shared one."""
+        return {
+            "in_flight": len(self._flights),
+            "started": self._started,
+            "joined": self._joined,
+        }
@@ -7,6 +7,7 @@ from typing import Callable, Awaitable
 from mcp.types import Tool, TextContent
 from mcp_server.mcp_tool import MCPTool
 from mcp_server.crawl.crawl import crawl_web_page, DEFAULT_INSTRUCTION
+from mcp_server.http_render import validate_render_mode, RENDER_MODES
 
 
 class StreamingContext:
@@ -54,6 +55,16 @@ def create_crawl_web_page_tool() -> MCPTool:
                     "type": "boolean",
                     "description": "Generate a Markdown representation of the page",
                     "default": False
+                },
+                "render": {
+                    "type": "string",
+                    "enum": list(RENDER_MODES),
+                    "description": "\"browser\" crawls with a browser; \"http\" fetches and saves the page without one, which is much cheaper for static pages; \"auto\" uses HTTP unless the page looks like it needs JavaScript or an instruction, screenshot or PDF is requested. Default MCP_DEFAULT_RENDER"
+                },
+                "use_cache": {
+                    "type": "boolean",
+                    "description": "Serve a repeat crawl of the same URL with the same options from the on-disk crawl cache (when MCP_CRAWL_CACHE_DIR is set), revalidating it with the site once MCP_CRAWL_CACHE_TTL has passed; false always crawls afresh",
+                    "default": True
                 }
             },
             "required": ["url", "save_path"]
@@ -73,6 +84,8 @@ def create_crawl_web_page_tool() -> MCPTool:
             save_screenshot = arguments.get("save_screenshot", False)
             save_pdf = arguments.get("save_pdf", False)
             generate_markdown = arguments.get("generate_markdown", False)
+            render = arguments.get("render")
+            use_cache = arguments.get("use_cache", True)
             
             # 验证必需参数
             if not url:
@@ -95,10 +108,15 @@ def create_crawl_web_page_tool() -> MCPTool:
                 raise ValueError("save_pdf must be a boolean")
             if not isinstance(generate_markdown, bool):
                 raise ValueError("generate_markdown must be a boolean")
+            if not isinstance(use_cache, bool):
+                raise ValueError("use_cache must be a boolean")
             
             # 验证 instruction 格式
             if not isinstance(instruction, str):
                 raise ValueError("instruction must be a string")
+
+            # 验证渲染方式参数
+            validate_render_mode(render)
             
             # 验证 URL 和 save_path 长度限制
             if len(url) > 2048:  # URL 长度限制
@@ -116,7 +134,9 @@ def create_crawl_web_page_tool() -> MCPTool:
             # 执行业务逻辑
             result = await crawl_web_page(
                 url, save_path, instruction, save_screenshot,
-                save_pdf, generate_markdown, progress_callback=wrapped_progress_callback
+                save_pdf, generate_markdown, progress_callback=wrapped_progress_callback,
+                render=render,
+                use_cache=use_cache
             )
             
             # 添加最终结果到输出
@@ -0,0 +1,157 @@
+"""
+Crawl Web Pages Tool - 批量爬取网页工具
+"""
+import os
+import json
+from typing import Callable, Awaitable
+
+from mcp.types import Tool, TextContent
+from mcp_server.mcp_tool import MCPTool
+from mcp_server.crawl.crawl import crawl_web_pages, DEFAULT_INSTRUCTION, DEFAULT_BATCH_CONCURRENCY, MAX_BATCH_URLS
+
+
+class StreamingContext:
+    """Streaming context for sending progress updates."""
+
+    def __init__(self):
+        self.outputs = []
+
+    async def send_output(self, content):
+        """Send output to the client."""
+        self.outputs.extend(content)
+
+
+def create_crawl_web_pages_tool() -> MCPTool:
+    """创建 CrawlWebPagesTool 实例"""
+    tool = Tool(
+        name="crawl_web_pages",
+        description="Crawl many web pages concurrently and save each one in multiple formats (HTML, JSON, PDF, screenshots), streaming per-URL results as they finish and writing a summary manifest",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": f"The URLs of the web pages to crawl (at most {MAX_BATCH_URLS})"
+                },
+                "save_path": {
+                    "type": "string",
+                    "description": "The base file path to save the crawled content and downloaded files"
+                },
+                "instruction": {
+                    "type": "string",
+                    "description": "The instruction to use for the LLM"
+                },
+                "save_screenshot": {
+                    "type": "boolean",
+                    "description": "Save a screenshot of each page",
+                    "default": False
+                },
+                "save_pdf": {
+                    "type": "boolean",
+                    "description": "Save a PDF of each page",
+                    "default": False
+                },
+                "generate_markdown": {
+                    "type": "boolean",
+                    "description": "Generate a Markdown representation of each page",
+                    "default": False
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": f"Maximum number of pages crawled at the same time, default {DEFAULT_BATCH_CONCURRENCY}",
+                    "default": DEFAULT_BATCH_CONCURRENCY
+                }
+            },
+            "required": ["urls", "save_path"]
+        }
+    )
+
+    async def handler(arguments: dict, progress_callback: Callable[[str], Awaitable[None]]) -> list:
+        try:
+            # 验证输入参数
+            if not isinstance(arguments, dict):
+                raise TypeError("Arguments must be a dictionary")
+
+            # 从参数中提取并验证字段
+            urls = arguments.get("urls", [])
+            save_path = arguments.get("save_path", "")
+            instruction = arguments.get("instruction", DEFAULT_INSTRUCTION)
+            save_screenshot = arguments.get("save_screenshot", False)
+            save_pdf = arguments.get("save_pdf", False)
+            generate_markdown = arguments.get("generate_markdown", False)
+            max_concurrency = arguments.get("max_concurrency", DEFAULT_BATCH_CONCURRENCY)
+
+            # 验证必需参数
+            if not urls:
+                raise ValueError("URLs are required")
+            if not save_path:
+                raise ValueError("Save path is required")
+
+            # 验证 URL 列表格式
+            if not isinstance(urls, list):
+                raise ValueError("urls must be a list of strings")
+            if len(urls) > MAX_BATCH_URLS:
+                raise ValueError(f"urls exceeds maximum of {MAX_BATCH_URLS} entries")
+            for url in urls:
+                if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+                    raise ValueError(f"Invalid URL format: {url}")
+                if len(url) > 2048:  # URL 长度限制
+                    raise ValueError("URL exceeds maximum length of 2048 characters")
+
+            # 验证 save_path 格式
+            if not isinstance(save_path, str) or len(save_path) == 0:
+                raise ValueError("Invalid save path format")
+            if len(save_path) > 4096:  # 路径长度限制
+                raise ValueError("Save path exceeds maximum length of 4096 characters")
+
+            # 验证布尔参数
+            if not isinstance(save_screenshot, bool):
+                raise ValueError("save_screenshot must be a boolean")
+            if not isinstance(save_pdf, bool):
+                raise ValueError("save_pdf must be a boolean")
+            if not isinstance(generate_markdown, bool):
+                raise ValueError("generate_markdown must be a boolean")
+
+            # 验证 instruction 格式
+            if not isinstance(instruction, str):
+                raise ValueError("instruction must be a string")
+
+            # 验证并发数
+            if not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool):
+                raise ValueError("max_concurrency must be an integer")
+            if max_concurrency < 1 or max_concurrency > 50:
+                raise ValueError("max_concurrency must be between 1 and 50")
+
+            # 创建流式上下文
+            ctx = StreamingContext()
+
+            # 执行业务逻辑；每个 URL 完成后立即通过服务器的进度回调流式输出其结果
+            manifest = await crawl_web_pages(
+                urls, save_path, instruction, save_screenshot,
+                save_pdf, generate_markdown, max_concurrency,
+                progress_callback=progress_callback
+            )
+
+            # 添加最终汇总到输出（逐页详情见 manifest.json）
+            summary = {k: v for k, v in manifest.items() if k != "pages"}
+            summary["manifest"] = os.path.join(manifest["output_dir"], "manifest.json")
+            await ctx.send_output([TextContent(type="text", text=json.dumps(summary, ensure_ascii=False, indent=2))])
+
+            # 返回所有在执行过程中收集的输出
+            return ctx.outputs
+
+        except ValueError as e:
+            # 处理值错误
+            error_msg = f"Value Error in crawl_web_pages tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except TypeError as e:
+            # 处理类型错误
+            error_msg = f"Type Error in crawl_web_pages tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except Exception as e:
+            # 处理其他异常
+            error_msg = f"Unexpected error in crawl_web_pages tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+
+    return MCPTool(tool=tool, handler=handler)
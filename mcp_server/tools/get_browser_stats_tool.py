@@ -0,0 +1,49 @@
+"""
+Get Browser Stats Tool - 获取浏览器服务统计信息工具
+"""
+import json
+from typing import Callable, Awaitable
+
+from mcp.types import Tool, TextContent
+from mcp_server.mcp_tool import MCPTool
+from mcp_server.browser.browser_service import get_browser_service_stats
+from mcp_server.crawl.crawl_cache import get_crawl_cache
+from mcp_server.crawl.crawl import get_crawl_flight_stats
+
+
+def create_get_browser_stats_tool() -> MCPTool:
+    """创建 GetBrowserStatsTool 实例"""
+    tool = Tool(
+        name="get_browser_stats",
+        description="Report browser service statistics such as open pages, queued calls and browser context pool usage, page, subresource and crawl cache hit and miss counts, and how many calls shared an identical call already in progress",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+
+    async def handler(arguments: dict, progress_callback: Callable[[str], Awaitable[None]]) -> list:
+        try:
+            # 验证输入参数
+            if not isinstance(arguments, dict):
+                raise TypeError("Arguments must be a dictionary")
+
+            # 执行业务逻辑（不会为了统计而启动浏览器）
+            result = get_browser_service_stats()
+            crawl_cache = get_crawl_cache()
+            result["crawl_cache"] = crawl_cache.stats() if crawl_cache is not None else None
+            result["crawl_single_flight"] = get_crawl_flight_stats()
+
+            return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+        except TypeError as e:
+            # 处理类型错误
+            error_msg = f"Type Error in get_browser_stats tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except Exception as e:
+            # 处理其他异常
+            error_msg = f"Unexpected error in get_browser_stats tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+
+    return MCPTool(tool=tool, handler=handler)
@@ -6,6 +6,11 @@ from typing import Callable, Awaitable
 
 from mcp.types import Tool, TextContent
 from mcp_server.mcp_tool import MCPTool
+from mcp_server.result_store import paginate_text
+from mcp_server.browser.settle import validate_settle_options
+from mcp_server.browser.resource_blocking import validate_block_resources, BLOCK_RESOURCES_SCHEMA
+from mcp_server.browser.emulation import validate_emulation, EMULATION_SCHEMA
+from mcp_server.browser.console_capture import validate_console_options, CONSOLE_TYPES
 from mcp_server.browser.browser_service import get_browser_service
 
 
@@ -24,7 +29,7 @@ def create_get_console_messages_tool() -> MCPTool:
     """创建 GetConsoleMessagesTool 实例"""
     tool = Tool(
         name="get_console_messages",
-        description="Capture console output information from specified URL webpage (including logs, warnings, errors, etc.)",
+        description="Capture console output information from specified URL webpage (including logs, warnings, errors and uncaught page errors), optionally filtered by type, with identical messages collapsed and the number of messages capped",
         inputSchema={
             "type": "object",
             "properties": {
@@ -40,6 +45,30 @@ def create_get_console_messages_tool() -> MCPTool:
                     "type": "integer",
                     "description": "Wait timeout in milliseconds, default 30000",
                     "default": 30000
+                },
+                "block_resources": BLOCK_RESOURCES_SCHEMA,
+                "emulation": EMULATION_SCHEMA,
+                "levels": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(CONSOLE_TYPES)},
+                    "description": "Console message types to keep, e.g. [\"error\", \"warning\", \"pageerror\"]; \"pageerror\" is an uncaught exception. Defaults to all"
+                },
+                "max_messages": {
+                    "type": "integer",
+                    "description": "Maximum number of distinct console messages returned; later ones are only counted. Default MCP_CONSOLE_MAX_MESSAGES"
+                },
+                "dedupe": {
+                    "type": "boolean",
+                    "description": "Collapse identical console messages into one record with a repeat count",
+                    "default": True
+                },
+                "settle_quiet_ms": {
+                    "type": "integer",
+                    "description": "Stop capturing once the page has made no requests and logged nothing for this many milliseconds, default 500"
+                },
+                "settle_max_ms": {
+                    "type": "integer",
+                    "description": "Upper bound in milliseconds for waiting for the page to go quiet, default 3000"
                 }
             },
             "required": ["url"]
@@ -56,6 +85,13 @@ def create_get_console_messages_tool() -> MCPTool:
             url = arguments.get("url", "")
             wait_for_selector = arguments.get("wait_for_selector")
             wait_timeout = arguments.get("wait_timeout", 30000)
+            block_resources = arguments.get("block_resources")
+            emulation = arguments.get("emulation")
+            levels = arguments.get("levels")
+            max_messages = arguments.get("max_messages")
+            dedupe = arguments.get("dedupe", True)
+            settle_quiet_ms = arguments.get("settle_quiet_ms")
+            settle_max_ms = arguments.get("settle_max_ms")
             
             # 验证必需参数
             if not url:
@@ -75,6 +111,18 @@ def create_get_console_messages_tool() -> MCPTool:
             if wait_timeout < 0 or wait_timeout > 300000:  # 最大限制5分钟
                 raise ValueError("wait_timeout must be between 0 and 300000 milliseconds")
             
+            # 验证等待页面空闲的参数
+            validate_settle_options(settle_quiet_ms, settle_max_ms)
+
+            # 验证资源屏蔽参数
+            validate_block_resources(block_resources)
+
+            # 验证设备和网络模拟参数
+            validate_emulation(emulation)
+
+            # 验证控制台消息过滤和上限参数
+            validate_console_options(levels, max_messages, dedupe)
+
             # 验证 URL 长度限制
             if len(url) > 2048:  # URL 长度限制
                 raise ValueError("URL exceeds maximum length of 2048 characters")
@@ -91,15 +139,22 @@ def create_get_console_messages_tool() -> MCPTool:
             # 执行业务逻辑
             result = await browser_service.get_console_messages(
                 url, wait_for_selector, wait_timeout,
-                progress_callback=wrapped_progress_callback
+                progress_callback=wrapped_progress_callback,
+                settle_quiet_ms=settle_quiet_ms,
+                settle_max_ms=settle_max_ms,
+                block_resources=block_resources,
+                emulation=emulation,
+                levels=levels,
+                max_messages=max_messages,
+                dedupe=dedupe
             )
             
             # 验证结果格式
             if not isinstance(result, (dict, list, str)):
                 raise ValueError("Result from get_console_messages is not in expected format")
             
-            # 添加最终结果到输出
-            await ctx.send_output([TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))])
+            # 添加最终结果到输出；超大结果只返回第一块和用于 get_result_chunk 的游标
+            await ctx.send_output(paginate_text(json.dumps(result, ensure_ascii=False, indent=2)))
             
             # 返回所有在执行过程中收集的输出
             return ctx.outputs
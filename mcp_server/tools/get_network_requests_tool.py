@@ -6,6 +6,12 @@ from typing import Callable, Awaitable
 
 from mcp.types import Tool, TextContent
 from mcp_server.mcp_tool import MCPTool
+from mcp_server.result_store import paginate_text
+from mcp_server.browser.settle import validate_settle_options
+from mcp_server.browser.network_capture import validate_capture_mode, validate_network_options, CAPTURE_MODES
+from mcp_server.browser.har_writer import validate_export_options, EXPORT_FORMATS
+from mcp_server.browser.resource_blocking import validate_block_resources, BLOCK_RESOURCES_SCHEMA
+from mcp_server.browser.emulation import validate_emulation, EMULATION_SCHEMA
 from mcp_server.browser.browser_service import get_browser_service
 
 
@@ -40,6 +46,60 @@ def create_get_network_requests_tool() -> MCPTool:
                     "type": "integer",
                     "description": "Wait timeout in milliseconds, default 30000",
                     "default": 30000
+                },
+                "block_resources": BLOCK_RESOURCES_SCHEMA,
+                "emulation": EMULATION_SCHEMA,
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum number of request records returned; the oldest are dropped first. Default MCP_NETWORK_MAX_RECORDS"
+                },
+                "include_headers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Request and response headers kept in records; [\"*\"] keeps all, [] none. Default MCP_NETWORK_HEADERS"
+                },
+                "summary_only": {
+                    "type": "boolean",
+                    "description": "Return only request counts and bytes per domain, resource type and status instead of individual records",
+                    "default": False
+                },
+                "export_path": {
+                    "type": "string",
+                    "description": "Stream captured traffic to this file instead of returning it; the result then only holds the file path and a summary"
+                },
+                "export_format": {
+                    "type": "string",
+                    "enum": list(EXPORT_FORMATS),
+                    "description": "Format of the export file: har (default) or ndjson (one HAR entry per line)",
+                    "default": "har"
+                },
+                "include_bodies": {
+                    "type": "boolean",
+                    "description": "Include response bodies in the export",
+                    "default": False
+                },
+                "max_body_bytes": {
+                    "type": "integer",
+                    "description": "Response bodies larger than this are left out of the export. Default MCP_HAR_MAX_BODY_BYTES"
+                },
+                "body_content_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Content type prefixes whose bodies are exported, default text/, application/json, application/javascript, application/xml"
+                },
+                "capture_mode": {
+                    "type": "string",
+                    "enum": list(CAPTURE_MODES),
+                    "description": "passive (default) records requests from browser events without slowing the page; intercept routes every request through the server before it is sent",
+                    "default": "passive"
+                },
+                "settle_quiet_ms": {
+                    "type": "integer",
+                    "description": "Stop capturing once the page has made no requests and logged nothing for this many milliseconds, default 500"
+                },
+                "settle_max_ms": {
+                    "type": "integer",
+                    "description": "Upper bound in milliseconds for waiting for the page to go quiet, default 3000"
                 }
             },
             "required": ["url"]
@@ -56,6 +116,19 @@ def create_get_network_requests_tool() -> MCPTool:
             url = arguments.get("url", "")
             wait_for_selector = arguments.get("wait_for_selector")
             wait_timeout = arguments.get("wait_timeout", 30000)
+            block_resources = arguments.get("block_resources")
+            emulation = arguments.get("emulation")
+            max_records = arguments.get("max_records")
+            include_headers = arguments.get("include_headers")
+            summary_only = arguments.get("summary_only", False)
+            export_path = arguments.get("export_path")
+            export_format = arguments.get("export_format")
+            include_bodies = arguments.get("include_bodies", False)
+            max_body_bytes = arguments.get("max_body_bytes")
+            body_content_types = arguments.get("body_content_types")
+            capture_mode = arguments.get("capture_mode", "passive")
+            settle_quiet_ms = arguments.get("settle_quiet_ms")
+            settle_max_ms = arguments.get("settle_max_ms")
             
             # 验证必需参数
             if not url:
@@ -75,6 +148,24 @@ def create_get_network_requests_tool() -> MCPTool:
             if wait_timeout < 0 or wait_timeout > 300000:  # 最大限制5分钟
                 raise ValueError("wait_timeout must be between 0 and 300000 milliseconds")
             
+            # 验证等待页面空闲的参数
+            validate_settle_options(settle_quiet_ms, settle_max_ms)
+
+            # 验证资源屏蔽参数
+            validate_block_resources(block_resources)
+
+            # 验证设备和网络模拟参数
+            validate_emulation(emulation)
+
+            # 验证网络捕获模式
+            validate_capture_mode(capture_mode)
+
+            # 验证网络记录上限和请求头选择
+            validate_network_options(max_records, include_headers, summary_only)
+
+            # 验证流量导出参数
+            validate_export_options(export_path, export_format, include_bodies, max_body_bytes, body_content_types)
+
             # 验证 URL 长度限制
             if len(url) > 2048:  # URL 长度限制
                 raise ValueError("URL exceeds maximum length of 2048 characters")
@@ -91,15 +182,28 @@ def create_get_network_requests_tool() -> MCPTool:
             # 执行业务逻辑
             result = await browser_service.get_network_requests(
                 url, wait_for_selector, wait_timeout,
-                progress_callback=wrapped_progress_callback
+                progress_callback=wrapped_progress_callback,
+                settle_quiet_ms=settle_quiet_ms,
+                settle_max_ms=settle_max_ms,
+                block_resources=block_resources,
+                emulation=emulation,
+                max_records=max_records,
+                include_headers=include_headers,
+                summary_only=summary_only,
+                export_path=export_path,
+                export_format=export_format,
+                include_bodies=include_bodies,
+                max_body_bytes=max_body_bytes,
+                body_content_types=body_content_types,
+                capture_mode=capture_mode
             )
             
             # 验证结果格式
             if not isinstance(result, (dict, list, str)):
                 raise ValueError("Result from get_network_requests is not in expected format")
             
-            # 添加最终结果到输出
-            await ctx.send_output([TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))])
+            # 添加最终结果到输出；超大结果只返回第一块和用于 get_result_chunk 的游标
+            await ctx.send_output(paginate_text(json.dumps(result, ensure_ascii=False, indent=2)))
             
             # 返回所有在执行过程中收集的输出
             return ctx.outputs
@@ -6,7 +6,12 @@ from typing import Callable, Awaitable
 
 from mcp.types import Tool, TextContent
 from mcp_server.mcp_tool import MCPTool
-from mcp_server.browser.browser_service import get_browser_service
+from mcp_server.result_store import paginate_text
+from mcp_server.browser.resource_blocking import validate_block_resources, BLOCK_RESOURCES_SCHEMA
+from mcp_server.browser.emulation import validate_emulation, EMULATION_SCHEMA
+from mcp_server.browser.page_cache import validate_cache_options
+from mcp_server.http_render import validate_render_mode, RENDER_MODES
+from mcp_server.browser.browser_service import get_browser_service, validate_content_options, CONTENT_FIELDS
 
 
 class StreamingContext:
@@ -40,6 +45,43 @@ def create_get_page_content_tool() -> MCPTool:
                     "type": "integer",
                     "description": "Wait timeout in milliseconds, default 30000",
                     "default": 30000
+                },
+                "block_resources": BLOCK_RESOURCES_SCHEMA,
+                "emulation": EMULATION_SCHEMA,
+                "render": {
+                    "type": "string",
+                    "enum": list(RENDER_MODES),
+                    "description": "\"browser\" loads the page in Chromium; \"http\" fetches and parses it without a browser, which is much cheaper for static pages; \"auto\" fetches over HTTP and falls back to the browser when the page looks like it needs JavaScript. Default MCP_DEFAULT_RENDER"
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(CONTENT_FIELDS)},
+                    "description": "Content fields to return; fields not listed are never extracted. Defaults to all"
+                },
+                "max_links": {
+                    "type": "integer",
+                    "description": "Maximum number of links to return"
+                },
+                "max_images": {
+                    "type": "integer",
+                    "description": "Maximum number of images to return"
+                },
+                "max_text_chars": {
+                    "type": "integer",
+                    "description": "Maximum number of text characters to return"
+                },
+                "max_html_chars": {
+                    "type": "integer",
+                    "description": "Maximum number of HTML characters to return"
+                },
+                "max_age": {
+                    "type": "number",
+                    "description": "Only reuse a cached result of an identical call younger than this many seconds; results are cached for MCP_PAGE_CACHE_TTL when MCP_PAGE_CACHE_MAX_BYTES is set"
+                },
+                "bypass_cache": {
+                    "type": "boolean",
+                    "description": "Load the page even if a cached result exists",
+                    "default": False
                 }
             },
             "required": ["url"]
@@ -56,6 +98,16 @@ def create_get_page_content_tool() -> MCPTool:
             url = arguments.get("url", "")
             wait_for_selector = arguments.get("wait_for_selector")
             wait_timeout = arguments.get("wait_timeout", 30000)
+            block_resources = arguments.get("block_resources")
+            emulation = arguments.get("emulation")
+            render = arguments.get("render")
+            fields = arguments.get("fields")
+            max_links = arguments.get("max_links")
+            max_images = arguments.get("max_images")
+            max_text_chars = arguments.get("max_text_chars")
+            max_html_chars = arguments.get("max_html_chars")
+            max_age = arguments.get("max_age")
+            bypass_cache = arguments.get("bypass_cache", False)
             
             # 验证必需参数
             if not url:
@@ -75,6 +127,21 @@ def create_get_page_content_tool() -> MCPTool:
             if wait_timeout < 0 or wait_timeout > 300000:  # 最大限制5分钟
                 raise ValueError("wait_timeout must be between 0 and 300000 milliseconds")
             
+            # 验证字段选择和字段限制
+            validate_content_options(fields, max_links, max_images, max_text_chars, max_html_chars)
+
+            # 验证资源屏蔽参数
+            validate_block_resources(block_resources)
+
+            # 验证设备和网络模拟参数
+            validate_emulation(emulation)
+
+            # 验证渲染方式参数
+            validate_render_mode(render)
+
+            # 验证缓存参数
+            validate_cache_options(max_age, bypass_cache)
+
             # 验证 URL 长度限制
             if len(url) > 2048:  # URL 长度限制
                 raise ValueError("URL exceeds maximum length of 2048 characters")
@@ -91,15 +158,25 @@ def create_get_page_content_tool() -> MCPTool:
             # 执行业务逻辑
             result = await browser_service.get_page_content(
                 url, wait_for_selector, wait_timeout,
-                progress_callback=wrapped_progress_callback
+                progress_callback=wrapped_progress_callback,
+                fields=fields,
+                max_links=max_links,
+                max_images=max_images,
+                max_text_chars=max_text_chars,
+                max_html_chars=max_html_chars,
+                block_resources=block_resources,
+                emulation=emulation,
+                render=render,
+                max_age=max_age,
+                bypass_cache=bypass_cache
             )
             
             # 验证结果格式
             if not isinstance(result, (dict, list, str)):
                 raise ValueError("Result from get_page_content is not in expected format")
             
-            # 添加最终结果到输出
-            await ctx.send_output([TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))])
+            # 添加最终结果到输出；超大结果只返回第一块和用于 get_result_chunk 的游标
+            await ctx.send_output(paginate_text(json.dumps(result, ensure_ascii=False, indent=2)))
             
             # 返回所有在执行过程中收集的输出
             return ctx.outputs
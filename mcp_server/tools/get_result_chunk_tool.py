@@ -0,0 +1,63 @@
+"""
+Get Result Chunk Tool - 分页读取大结果工具
+"""
+from typing import Callable, Awaitable
+
+from mcp.types import Tool, TextContent
+from mcp_server.mcp_tool import MCPTool
+from mcp_server.result_store import get_result_store, parse_cursor, chunk_response
+
+
+def create_get_result_chunk_tool() -> MCPTool:
+    """创建 GetResultChunkTool 实例"""
+    tool = Tool(
+        name="get_result_chunk",
+        description="Read the next chunk of a large tool result using the next_cursor from its pagination entry",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cursor": {
+                    "type": "string",
+                    "description": "The next_cursor value returned with the previous chunk"
+                }
+            },
+            "required": ["cursor"]
+        }
+    )
+
+    async def handler(arguments: dict, progress_callback: Callable[[str], Awaitable[None]]) -> list:
+        try:
+            # 验证输入参数
+            if not isinstance(arguments, dict):
+                raise TypeError("Arguments must be a dictionary")
+
+            # 从参数中提取并验证字段
+            cursor = arguments.get("cursor", "")
+
+            # 验证 cursor 格式
+            if not cursor or not isinstance(cursor, str):
+                raise ValueError("cursor is required")
+            if len(cursor) > 256:
+                raise ValueError("cursor exceeds maximum length of 256 characters")
+            result_id, index = parse_cursor(cursor)
+
+            # 执行业务逻辑
+            try:
+                return chunk_response(get_result_store(), result_id, index)
+            except (KeyError, IndexError) as e:
+                raise ValueError(str(e).strip("'\""))
+
+        except ValueError as e:
+            # 处理值错误
+            error_msg = f"Value Error in get_result_chunk tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except TypeError as e:
+            # 处理类型错误
+            error_msg = f"Type Error in get_result_chunk tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except Exception as e:
+            # 处理其他异常
+            error_msg = f"Unexpected error in get_result_chunk tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+
+    return MCPTool(tool=tool, handler=handler)
@@ -0,0 +1,253 @@
+"""
+Inspect Page Tool - 单次加载检查页面工具
+"""
+import json
+from typing import Callable, Awaitable
+
+from mcp.types import Tool, TextContent
+from mcp_server.mcp_tool import MCPTool
+from mcp_server.result_store import paginate_text
+from mcp_server.browser.settle import validate_settle_options
+from mcp_server.browser.network_capture import validate_network_options
+from mcp_server.browser.console_capture import validate_console_options, CONSOLE_TYPES
+from mcp_server.browser.resource_blocking import validate_block_resources, BLOCK_RESOURCES_SCHEMA
+from mcp_server.browser.emulation import validate_emulation, EMULATION_SCHEMA
+from mcp_server.browser.browser_service import get_browser_service, validate_content_options, CONTENT_FIELDS
+
+
+INSPECT_PARTS = ("content", "console", "network")
+
+
+class StreamingContext:
+    """Streaming context for sending progress updates."""
+    
+    def __init__(self):
+        self.outputs = []
+
+    async def send_output(self, content):
+        """Send output to the client."""
+        self.outputs.extend(content)
+
+
+def create_inspect_page_tool() -> MCPTool:
+    """创建 InspectPageTool 实例"""
+    tool = Tool(
+        name="inspect_page",
+        description="Load a specified URL webpage once and return any combination of its content, console messages and network requests",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The URL of the web page to inspect"
+                },
+                "wait_for_selector": {
+                    "type": "string",
+                    "description": "Optional CSS selector to wait for before inspecting the page"
+                },
+                "wait_timeout": {
+                    "type": "integer",
+                    "description": "Wait timeout in milliseconds, default 30000",
+                    "default": 30000
+                },
+                "block_resources": BLOCK_RESOURCES_SCHEMA,
+                "emulation": EMULATION_SCHEMA,
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum number of request records returned; the oldest are dropped first. Default MCP_NETWORK_MAX_RECORDS"
+                },
+                "include_headers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Request and response headers kept in records; [\"*\"] keeps all, [] none. Default MCP_NETWORK_HEADERS"
+                },
+                "summary_only": {
+                    "type": "boolean",
+                    "description": "Return only request counts and bytes per domain, resource type and status instead of individual records",
+                    "default": False
+                },
+                "levels": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(CONSOLE_TYPES)},
+                    "description": "Console message types to keep, e.g. [\"error\", \"warning\", \"pageerror\"]; \"pageerror\" is an uncaught exception. Defaults to all"
+                },
+                "max_messages": {
+                    "type": "integer",
+                    "description": "Maximum number of distinct console messages returned; later ones are only counted. Default MCP_CONSOLE_MAX_MESSAGES"
+                },
+                "dedupe": {
+                    "type": "boolean",
+                    "description": "Collapse identical console messages into one record with a repeat count",
+                    "default": True
+                },
+                "settle_quiet_ms": {
+                    "type": "integer",
+                    "description": "Stop capturing once the page has made no requests and logged nothing for this many milliseconds, default 500"
+                },
+                "settle_max_ms": {
+                    "type": "integer",
+                    "description": "Upper bound in milliseconds for waiting for the page to go quiet, default 3000"
+                },
+                "include": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(INSPECT_PARTS)},
+                    "description": "Parts to capture: content, console and/or network. Defaults to all three",
+                    "default": list(INSPECT_PARTS)
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(CONTENT_FIELDS)},
+                    "description": "Content fields to return; fields not listed are never extracted. Defaults to all"
+                },
+                "max_links": {
+                    "type": "integer",
+                    "description": "Maximum number of links to return"
+                },
+                "max_images": {
+                    "type": "integer",
+                    "description": "Maximum number of images to return"
+                },
+                "max_text_chars": {
+                    "type": "integer",
+                    "description": "Maximum number of text characters to return"
+                },
+                "max_html_chars": {
+                    "type": "integer",
+                    "description": "Maximum number of HTML characters to return"
+                }
+            },
+            "required": ["url"]
+        }
+    )
+
+    async def handler(arguments: dict, progress_callback: Callable[[str], Awaitable[None]]) -> list:
+        try:
+            # 验证输入参数
+            if not isinstance(arguments, dict):
+                raise TypeError("Arguments must be a dictionary")
+            
+            # 从参数中提取并验证字段
+            url = arguments.get("url", "")
+            wait_for_selector = arguments.get("wait_for_selector")
+            wait_timeout = arguments.get("wait_timeout", 30000)
+            block_resources = arguments.get("block_resources")
+            emulation = arguments.get("emulation")
+            max_records = arguments.get("max_records")
+            include_headers = arguments.get("include_headers")
+            summary_only = arguments.get("summary_only", False)
+            levels = arguments.get("levels")
+            max_messages = arguments.get("max_messages")
+            dedupe = arguments.get("dedupe", True)
+            settle_quiet_ms = arguments.get("settle_quiet_ms")
+            settle_max_ms = arguments.get("settle_max_ms")
+            fields = arguments.get("fields")
+            max_links = arguments.get("max_links")
+            max_images = arguments.get("max_images")
+            max_text_chars = arguments.get("max_text_chars")
+            max_html_chars = arguments.get("max_html_chars")
+            include = arguments.get("include", list(INSPECT_PARTS))
+            
+            # 验证必需参数
+            if not url:
+                raise ValueError("URL is required")
+            
+            # 验证 URL 格式
+            if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+                raise ValueError("Invalid URL format")
+            
+            # 验证 wait_for_selector 格式
+            if wait_for_selector is not None and not isinstance(wait_for_selector, str):
+                raise ValueError("wait_for_selector must be a string or null")
+            
+            # 验证 wait_timeout 格式和范围
+            if not isinstance(wait_timeout, int):
+                raise ValueError("wait_timeout must be an integer")
+            if wait_timeout < 0 or wait_timeout > 300000:  # 最大限制5分钟
+                raise ValueError("wait_timeout must be between 0 and 300000 milliseconds")
+            
+            # 验证 include 格式
+            if not isinstance(include, list) or not include:
+                raise ValueError("include must be a non-empty list")
+            for part in include:
+                if part not in INSPECT_PARTS:
+                    raise ValueError(f"include entries must be one of {list(INSPECT_PARTS)}, got {part!r}")
+
+            # 验证字段选择和字段限制
+            validate_content_options(fields, max_links, max_images, max_text_chars, max_html_chars)
+
+            # 验证等待页面空闲的参数
+            validate_settle_options(settle_quiet_ms, settle_max_ms)
+
+            # 验证资源屏蔽参数
+            validate_block_resources(block_resources)
+
+            # 验证设备和网络模拟参数
+            validate_emulation(emulation)
+
+            # 验证网络记录上限和请求头选择
+            validate_network_options(max_records, include_headers, summary_only)
+
+            # 验证控制台消息过滤和上限参数
+            validate_console_options(levels, max_messages, dedupe)
+
+            # 验证 URL 长度限制
+            if len(url) > 2048:  # URL 长度限制
+                raise ValueError("URL exceeds maximum length of 2048 characters")
+            
+            # 创建流式上下文
+            ctx = StreamingContext()
+
+            # 定义进度回调函数
+            async def wrapped_progress_callback(msg: str):
+                await ctx.send_output([TextContent(type="text", text=f"PROGRESS: {msg}")])
+
+            browser_service = await get_browser_service()
+
+            # 执行业务逻辑
+            result = await browser_service.inspect_page(
+                url, wait_for_selector, wait_timeout,
+                include_content="content" in include,
+                include_console="console" in include,
+                include_network="network" in include,
+                progress_callback=wrapped_progress_callback,
+                fields=fields,
+                max_links=max_links,
+                max_images=max_images,
+                max_text_chars=max_text_chars,
+                max_html_chars=max_html_chars,
+                settle_quiet_ms=settle_quiet_ms,
+                settle_max_ms=settle_max_ms,
+                block_resources=block_resources,
+                emulation=emulation,
+                max_records=max_records,
+                include_headers=include_headers,
+                summary_only=summary_only,
+                levels=levels,
+                max_messages=max_messages,
+                dedupe=dedupe
+            )
+            
+            # 验证结果格式
+            if not isinstance(result, (dict, list, str)):
+                raise ValueError("Result from inspect_page is not in expected format")
+            
+            # 添加最终结果到输出；超大结果只返回第一块和用于 get_result_chunk 的游标
+            await ctx.send_output(paginate_text(json.dumps(result, ensure_ascii=False, indent=2)))
+            
+            # 返回所有在执行过程中收集的输出
+            return ctx.outputs
+        
+        except ValueError as e:
+            # 处理值错误
+            error_msg = f"Value Error in inspect_page tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except TypeError as e:
+            # 处理类型错误
+            error_msg = f"Type Error in inspect_page tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+        except Exception as e:
+            # 处理其他异常
+            error_msg = f"Unexpected error in inspect_page tool: {str(e)}"
+            return [TextContent(type="text", text=error_msg)]
+
+    return MCPTool(tool=tool, handler=handler)
\ No newline at end of file
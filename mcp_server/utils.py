@@ -2,10 +2,21 @@
 工具函数和日志配置模块
 """
 import os
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
+
+
+# 文件写入线程池的线程数，限制同时进行的磁盘写入
+IO_WORKERS = int(os.getenv("MCP_IO_WORKERS", "4"))
+
+# 写入大块数据时每次写入的字节数
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+_io_executor: Optional[ThreadPoolExecutor] = None
 
 
 def setup_logging(log_level: str = "INFO", log_file: str = None):
@@ -61,5 +72,79 @@ def save(path: str, name: str, s: str | bytes | bytearray | None, call: Callable
     call(file)
 
 
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    获取用于文件写入的有界线程池（按需创建）
+    """
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(max_workers=max(1, IO_WORKERS), thread_name_prefix="mcp-io")
+    return _io_executor
+
+
+def shutdown_io_executor():
+    """
+    等待未完成的写入结束并关闭文件写入线程池
+    """
+    global _io_executor
+    if _io_executor is not None:
+        _io_executor.shutdown(wait=True)
+        _io_executor = None
+
+
+def _write_file(file: str, s: str | bytes | bytearray):
+    """
+    在工作线程中写入文件；按块写入，使编码和写入之间让出 GIL，字节内容不复制整个缓冲区
+    """
+    if isinstance(s, str):
+        with open(file, 'w', encoding='utf-8') as f:
+            for offset in range(0, len(s), WRITE_CHUNK_SIZE):
+                _ = f.write(s[offset:offset + WRITE_CHUNK_SIZE])
+    else:
+        view = memoryview(s)
+        with open(file, 'wb') as f:
+            for offset in range(0, len(view), WRITE_CHUNK_SIZE):
+                _ = f.write(view[offset:offset + WRITE_CHUNK_SIZE])
+
+
+async def save_async(path: str, name: str, s: str | bytes | bytearray | None, call: Callable[[str], None]):
+    """
+    异步保存文件内容到指定路径
+    与 save 相同，但磁盘写入在有界线程池中执行，不会阻塞事件循环
+    """
+    logging.info(f"Saving: {path}, {name}, {type(s).__name__ if s is not None else 'None'}")
+
+    if s is None:
+        return
+
+    file: str = os.path.join(path, name)
+    await asyncio.get_running_loop().run_in_executor(get_io_executor(), _write_file, file, s)
+
+    call(file)
+
+
+class AsyncFileWriter:
+    """
+    以流的方式异步写入二进制文件：每个数据块都在文件写入线程池中写入
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        self._f = None
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(get_io_executor(), func, *args)
+
+    async def __aenter__(self) -> "AsyncFileWriter":
+        self._f = await self._run(open, self.file, 'wb')
+        return self
+
+    async def write(self, chunk: bytes):
+        await self._run(self._f.write, chunk)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._run(self._f.close)
+
+
 # 设置默认日志记录
 setup_logging()
\ No newline at end of file
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures: a local aiohttp server factory, and isolation from the
+render table and crawl cache kept on disk.
+"""
+
+from typing import Awaitable, Callable, Dict
+
+import pytest
+from aiohttp import web
+
+from mcp_server import http_render, render_table
+from mcp_server.crawl import crawl_cache, downloader
+
+
+@pytest.fixture
+async def local_server():
+    """
+    Serve GET routes from a local HTTP server on a free port.
+
+    Usage: `base_url = await local_server({"/path": handler, ...})`. The shared
+    HTTP clients are closed and the servers stopped after the test.
+    """
+    runners = []
+
+    async def start(routes: Dict[str, Callable[[web.Request], Awaitable[web.StreamResponse]]]) -> str:
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    yield start
+    await http_render.close_http_client()
+    await downloader.close_download_session()
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def render_table_in_memory(monkeypatch):
+    # Nothing learned, nothing written to disk and no sampling, so "auto" follows the heuristics alone
+    monkeypatch.setattr(render_table, "_render_table", render_table.RenderTable(sample_rate=0))
+
+
+@pytest.fixture(autouse=True)
+def no_crawl_cache(monkeypatch):
+    monkeypatch.setattr(crawl_cache.CrawlCacheConfig, "DIR", "")
+    monkeypatch.setattr(crawl_cache, "_crawl_cache", None)
@@ -45,6 +45,36 @@ async def test_browser_functions():
     except Exception as e:
         print(f"   Error: {str(e)}")
 
+    print(f"\n4. Testing inspect_page for {test_url}")
+    try:
+        inspect_result = await browser_service.inspect_page(test_url)
+        print(f"   Status: {inspect_result.get('status')}")
+        print(f"   Title: {inspect_result.get('content', {}).get('title', '')[:50]}...")
+        print(f"   Console messages count: {len(inspect_result.get('console_messages', []))}")
+        print(f"   Requests count: {inspect_result.get('total_requests')}")
+    except Exception as e:
+        print(f"   Error: {str(e)}")
+
+    print(f"\n5. Testing get_page_performance for {test_url}")
+    try:
+        performance_result = await browser_service.get_page_performance(test_url)
+        print(f"   Status: {performance_result.get('status')}")
+        print(f"   Load: {(performance_result.get('navigation') or {}).get('load')} ms")
+        print(f"   LCP: {performance_result.get('paint', {}).get('largest_contentful_paint')} ms")
+        print(f"   Resources count: {performance_result.get('resources', {}).get('count')}")
+    except Exception as e:
+        print(f"   Error: {str(e)}")
+
+    print(f"\n6. Testing get_code_coverage for {test_url}")
+    try:
+        coverage_result = await browser_service.get_code_coverage(test_url)
+        print(f"   Status: {coverage_result.get('status')}")
+        print(f"   Unused JS: {coverage_result.get('js', {}).get('unused_bytes')} bytes")
+        print(f"   Unused CSS: {coverage_result.get('css', {}).get('unused_bytes')} bytes")
+        print(f"   Entries count: {coverage_result.get('total_entries')}")
+    except Exception as e:
+        print(f"   Error: {str(e)}")
+
 
 def run_tests():
     """Run the browser tests."""
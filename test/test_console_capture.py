@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for console capture: type filters, deduplication, caps and page errors.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server.browser.console_capture import ConsoleCapture, validate_console_options
+
+
+class FakeMessage:
+    def __init__(self, type, text, url="https://example.com/app.js", line=1, column=0):
+        self.type = type
+        self.text = text
+        self.location = {"url": url, "lineNumber": line, "columnNumber": column}
+        self.page = None
+
+
+class FakeError:
+    def __init__(self, message, name="TypeError", stack="TypeError: boom\n    at app.js:3:7"):
+        self.message = message
+        self.name = name
+        self.stack = stack
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, event, value):
+        self.handlers[event](value)
+
+
+def _capture(**kwargs):
+    async def create():
+        capture = ConsoleCapture(**kwargs)
+        page = FakePage()
+        capture.attach(page)
+        return capture, page
+    return asyncio.run(create())
+
+
+def test_identical_messages_are_collapsed_with_counts():
+    capture, page = _capture()
+    for _ in range(1000):
+        page.emit("console", FakeMessage("log", "tick"))
+    page.emit("console", FakeMessage("log", "tick", line=2))
+    page.emit("console", FakeMessage("warning", "tick"))
+
+    result = capture.result()
+    messages = result["console_messages"]
+    assert [(m["type"], m["location"]["line_number"], m["count"]) for m in messages] == [
+        ("log", 1, 1000), ("log", 2, 1), ("warning", 1, 1),
+    ]
+    assert result["console_summary"] == {
+        "total": 1002, "by_type": {"log": 1001, "warning": 1}, "records": 3, "dropped": 0, "truncated": False,
+    }
+
+
+def test_dedupe_disabled_keeps_every_message():
+    capture, page = _capture(dedupe=False)
+    for _ in range(3):
+        page.emit("console", FakeMessage("log", "tick"))
+
+    messages = capture.result()["console_messages"]
+    assert len(messages) == 3
+    assert "count" not in messages[0]
+
+
+def test_levels_filter_keeps_counts_for_everything():
+    capture, page = _capture(levels=["error", "warning"])
+    page.emit("console", FakeMessage("log", "noise"))
+    page.emit("console", FakeMessage("error", "failed"))
+    page.emit("console", FakeMessage("warning", "careful"))
+    page.emit("pageerror", FakeError("boom"))
+
+    result = capture.result()
+    assert [m["type"] for m in result["console_messages"]] == ["error", "warning"]
+    assert result["console_summary"]["by_type"] == {"log": 1, "error": 1, "warning": 1, "pageerror": 1}
+
+
+def test_max_messages_caps_distinct_records():
+    capture, page = _capture(max_messages=2)
+    for i in range(5):
+        page.emit("console", FakeMessage("log", f"message {i}"))
+    # Repeats of a kept message are still counted
+    page.emit("console", FakeMessage("log", "message 0"))
+
+    result = capture.result()
+    assert [m["text"] for m in result["console_messages"]] == ["message 0", "message 1"]
+    assert result["console_messages"][0]["count"] == 2
+    assert result["console_summary"]["dropped"] == 3
+    assert result["console_summary"]["truncated"] is True
+
+
+def test_page_errors_are_captured_with_stack():
+    capture, page = _capture()
+    page.emit("pageerror", FakeError("x is undefined"))
+
+    message = capture.result()["console_messages"][0]
+    assert message["type"] == "pageerror"
+    assert message["text"] == "TypeError: x is undefined"
+    assert message["stack"].startswith("TypeError: boom")
+
+
+def test_long_text_is_clipped():
+    capture, page = _capture(max_text_chars=10)
+    page.emit("console", FakeMessage("log", "x" * 100))
+
+    assert capture.result()["console_messages"][0]["text"] == "x" * 10 + "... [90 more characters]"
+
+
+
+def test_long_messages_are_deduplicated_without_keeping_their_text():
+    capture, page = _capture(max_text_chars=10)
+    for _ in range(3):
+        page.emit("console", FakeMessage("log", "x" * 100_000 + "a"))
+    page.emit("console", FakeMessage("log", "x" * 100_000 + "b"))
+
+    assert [m["count"] for m in capture.result()["console_messages"]] == [3, 1]
+    assert all(len(repr(key)) < 200 for key in capture._seen)
+
+@pytest.mark.parametrize("levels, max_messages, dedupe", [
+    (["fatal"], None, None),
+    ("error", None, None),
+    (None, -1, None),
+    (None, True, None),
+    (None, None, "yes"),
+])
+def test_validate_rejects_bad_options(levels, max_messages, dedupe):
+    with pytest.raises(ValueError):
+        validate_console_options(levels, max_messages, dedupe)
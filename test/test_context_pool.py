@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for the browser context pool and page concurrency limits of BrowserService.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server.browser import browser_service
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server import browser_cache
+from mcp_server.browser.context_pool import ContextPool, SharedContextPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        if self in self.context.pages:
+            self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.cookie_clears = 0
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookie_clears += 1
+
+    async def clear_permissions(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+@pytest.mark.asyncio
+async def test_contexts_are_reset_and_reused():
+    browser = FakeBrowser()
+    pool = ContextPool(browser, size=2)
+    await pool.start()
+    assert pool.stats()["idle"] == 2
+
+    context = await pool.acquire()
+    await context.new_page()
+    assert pool.stats()["in_use"] == 1
+    await pool.release(context)
+
+    assert context.pages == []
+    assert context.cookie_clears == 1
+    assert len(browser.contexts) == 2
+    assert pool.stats() == {"size": 2, "in_use": 0, "idle": 2, "created": 2, "recycled": 0}
+
+
+@pytest.mark.asyncio
+async def test_worn_out_and_surplus_contexts_are_closed():
+    browser = FakeBrowser()
+    pool = ContextPool(browser, size=1, max_uses=2)
+    await pool.start()
+
+    first = await pool.acquire()
+    extra = await pool.acquire()  # pool exhausted, temporary context
+    await pool.release(first)
+    await pool.release(extra)
+    assert extra.closed and not first.closed
+
+    again = await pool.acquire()
+    assert again is first
+    await pool.release(again)  # second use, recycled
+    assert first.closed
+    assert pool.stats()["recycled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_page_slots_bound_concurrency(monkeypatch):
+    monkeypatch.setattr(browser_service.BrowserServiceConfig, "MAX_CONCURRENT_PAGES", 2)
+    service = BrowserService()
+    service._browser = FakeBrowser()
+    service._context_pool = ContextPool(service._browser, size=2)
+
+    peak = 0
+
+    async def visit():
+        nonlocal peak
+        page = await service._create_page_with_context()
+        try:
+            peak = max(peak, service.get_stats()["active_pages"])
+            await asyncio.sleep(0.01)
+        finally:
+            await service._release_page(page)
+
+    tasks = [asyncio.ensure_future(visit()) for _ in range(6)]
+    await asyncio.sleep(0.001)
+    assert service.get_stats()["waiters"] == 4
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    stats = service.get_stats()
+    assert stats["active_pages"] == 0 and stats["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_service(monkeypatch):
+    launches = 0
+
+    async def fake_initialize(self):
+        nonlocal launches
+        launches += 1
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(BrowserService, "initialize", fake_initialize)
+    monkeypatch.setattr(browser_service, "_browser_service", None)
+    monkeypatch.setattr(browser_service, "_browser_service_lock", asyncio.Lock())
+
+    services = await asyncio.gather(*(browser_service.get_browser_service() for _ in range(5)))
+    assert launches == 1
+    assert all(s is services[0] for s in services)
+
+
+@pytest.mark.asyncio
+async def test_shared_context_pool_clears_cookies_once_idle():
+    context = FakeContext()
+    pool = SharedContextPool(context)
+    await pool.start()
+    assert context.cookie_clears == 1
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    assert first is second is context
+    assert pool.stats()["in_use"] == 2
+
+    await pool.release(first)
+    assert context.cookie_clears == 1
+    await pool.release(second)
+    assert context.cookie_clears == 2
+    assert pool.stats()["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_browser_cache_dir_launches_a_persistent_profile(monkeypatch, tmp_path):
+    launches = []
+
+    class FakeChromium:
+        async def launch_persistent_context(self, user_data_dir, **kwargs):
+            launches.append((user_data_dir, kwargs))
+            return FakeContext()
+
+        async def launch(self, **kwargs):
+            raise AssertionError("expected a persistent profile")
+
+    class FakePlaywright:
+        chromium = FakeChromium()
+
+        async def stop(self):
+            pass
+
+    class FakeStarter:
+        async def start(self):
+            return FakePlaywright()
+
+    monkeypatch.setattr(browser_service, "async_playwright", FakeStarter)
+    monkeypatch.setattr(browser_cache.BrowserCacheConfig, "DIR", str(tmp_path))
+    monkeypatch.setattr(browser_cache.BrowserCacheConfig, "MAX_BYTES", 1000)
+
+    service = BrowserService()
+    await service.initialize()
+
+    user_data_dir, kwargs = launches[0]
+    assert user_data_dir == str(tmp_path / "browser-service")
+    assert "--disk-cache-size=1000" in kwargs["args"]
+    assert service.get_stats()["contexts"]["persistent"] is True
+
+    page = await service._create_page_with_context()
+    await service._release_page(page)
+    await service.close()
+    assert service.get_stats()["initialized"] is False
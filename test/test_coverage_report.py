@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for turning CDP coverage data into the get_code_coverage report.
+"""
+
+import asyncio
+
+from mcp_server.browser.coverage import CoverageCollector, build_coverage_report, js_used_ranges
+
+
+def _range(start, end, count):
+    return {"startOffset": start, "endOffset": end, "count": count}
+
+
+def test_js_used_ranges_inner_ranges_override_outer():
+    functions = [
+        # Top-level script ran once, except a branch that never ran
+        {"functionName": "", "ranges": [_range(0, 100, 1), _range(40, 60, 0)]},
+        # A function that was never called
+        {"functionName": "unused", "ranges": [_range(70, 90, 0)]},
+        # A called function with an untaken branch inside the unused region's parent
+        {"functionName": "used", "ranges": [_range(45, 55, 1), _range(50, 52, 0)]},
+    ]
+
+    assert js_used_ranges(functions) == [(0, 40), (45, 50), (52, 55), (60, 70), (90, 100)]
+
+
+def test_js_used_ranges_nothing_executed():
+    assert js_used_ranges([{"ranges": [_range(0, 10, 0)]}]) == []
+    assert js_used_ranges([]) == []
+
+
+def test_report_groups_and_ranks_by_unused_bytes():
+    scripts = [
+        {"url": "https://cdn.example.com/vendor.js", "type": "js", "inline": False, "total_bytes": 1000, "used_bytes": 100},
+        {"url": "https://example.com/app.js", "type": "js", "inline": False, "total_bytes": 500, "used_bytes": 450},
+        {"url": "https://example.com/", "type": "js", "inline": True, "total_bytes": 50, "used_bytes": 0},
+        {"url": "https://example.com/", "type": "js", "inline": True, "total_bytes": 30, "used_bytes": 30},
+    ]
+    stylesheets = [
+        {"url": "https://example.com/site.css", "type": "css", "inline": False, "total_bytes": 2000, "used_bytes": 200},
+    ]
+
+    report = build_coverage_report(scripts, stylesheets, max_entries=3)
+
+    assert report["js"] == {"files": 3, "total_bytes": 1580, "used_bytes": 580, "unused_bytes": 1000, "unused_percent": 63.3}
+    assert report["css"]["unused_bytes"] == 1800
+    assert report["total_entries"] == 4
+    assert [e["url"] for e in report["worst_offenders"]] == [
+        "https://example.com/site.css", "https://cdn.example.com/vendor.js", "https://example.com/app.js",
+    ]
+    assert report["worst_offenders"][1]["unused_percent"] == 90.0
+
+
+def test_report_inline_blocks_of_one_document_are_merged():
+    scripts = [
+        {"url": "https://example.com/", "type": "js", "inline": True, "total_bytes": 50, "used_bytes": 0},
+        {"url": "https://example.com/", "type": "js", "inline": True, "total_bytes": 30, "used_bytes": 30},
+    ]
+    entry = build_coverage_report(scripts, [])["worst_offenders"][0]
+
+    assert entry["count"] == 2
+    assert (entry["total_bytes"], entry["used_bytes"], entry["unused_bytes"]) == (80, 30, 50)
+
+
+def test_report_empty():
+    report = build_coverage_report([], [])
+
+    assert report["js"]["unused_percent"] == 0.0
+    assert report["worst_offenders"] == []
+
+
+class FakeCDPSession:
+    """Replays canned CDP events and responses."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.handlers = {}
+        self.sent = []
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, event, params):
+        self.handlers[event](params)
+
+    async def send(self, method, params=None):
+        self.sent.append(method)
+        return self.responses.get(method, {})
+
+
+def test_collector_counts_used_bytes_per_script_and_stylesheet():
+    cdp = FakeCDPSession({
+        "Profiler.takePreciseCoverage": {"result": [
+            {"scriptId": "1", "functions": [{"ranges": [_range(0, 200, 1), _range(100, 200, 0)]}]},
+            {"scriptId": "2", "functions": [{"ranges": [_range(0, 50, 1)]}]},
+        ]},
+        "Debugger.getScriptSource": {"scriptSource": "x" * 80},
+        "CSS.stopRuleUsageTracking": {"ruleUsage": [
+            {"styleSheetId": "s1", "startOffset": 0, "endOffset": 40, "used": True},
+            {"styleSheetId": "s1", "startOffset": 30, "endOffset": 60, "used": True},
+            {"styleSheetId": "s1", "startOffset": 60, "endOffset": 300, "used": False},
+        ]},
+    })
+    collector = CoverageCollector(cdp)
+
+    async def run():
+        await collector.start()
+        cdp.emit("Debugger.scriptParsed", {"scriptId": "1", "url": "https://example.com/app.js", "length": 200})
+        cdp.emit("Debugger.scriptParsed", {"scriptId": "2", "url": "https://example.com/", "startLine": 12})
+        # Evaluated snippets have no URL and are ignored
+        cdp.emit("Debugger.scriptParsed", {"scriptId": "3", "url": "", "length": 10})
+        cdp.emit("CSS.styleSheetAdded", {"header": {"styleSheetId": "s1", "sourceURL": "https://example.com/site.css", "length": 300}})
+        cdp.emit("CSS.styleSheetAdded", {"header": {"styleSheetId": "s2", "sourceURL": "https://example.com/", "length": 40, "isInline": True}})
+        return await collector.stop()
+
+    scripts, stylesheets = asyncio.run(run())
+
+    assert "Profiler.startPreciseCoverage" in cdp.sent and "CSS.startRuleUsageTracking" in cdp.sent
+    assert scripts == [
+        {"url": "https://example.com/app.js", "type": "js", "inline": False, "total_bytes": 200, "used_bytes": 100},
+        {"url": "https://example.com/", "type": "js", "inline": True, "total_bytes": 80, "used_bytes": 50},
+    ]
+    assert stylesheets == [
+        {"url": "https://example.com/site.css", "type": "css", "inline": False, "total_bytes": 300, "used_bytes": 60},
+        {"url": "https://example.com/", "type": "css", "inline": True, "total_bytes": 40, "used_bytes": 0},
+    ]
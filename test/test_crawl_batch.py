@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for batch crawling with crawl_web_pages.
+"""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server.crawl import crawl, crawler_pool
+from mcp_server.crawl.crawler_pool import CrawlerPool
+
+
+def make_result(url, success=True):
+    return SimpleNamespace(
+        url=url,
+        success=success,
+        html=f"<html><body>{url}</body></html>" if success else None,
+        extracted_content=None,
+        screenshot=None,
+        pdf=None,
+        markdown=None,
+        error_message=None if success else "boom",
+        extra_info={},
+        downloaded_files=None,
+    )
+
+
+class FakeBatchCrawler:
+    """Stand-in for AsyncWebCrawler that streams canned results in reverse order."""
+
+    def __init__(self, config=None):
+        self.calls = []
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def arun_many(self, urls, config=None, dispatcher=None):
+        self.calls.append((list(urls), config, dispatcher))
+
+        async def stream():
+            for url in reversed(urls):
+                if "crash" in url:
+                    raise RuntimeError("browser closed")
+                if "redirect" in url:
+                    url += "/landed"
+                yield make_result(url, success="fail" not in url)
+        return stream()
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(crawler_pool, "AsyncWebCrawler", FakeBatchCrawler)
+    pool = CrawlerPool(size=1)
+    monkeypatch.setattr(crawl, "get_crawler_pool", lambda: pool)
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_crawl_web_pages_streams_and_writes_manifest(pool, tmp_path):
+    progress = []
+
+    async def on_progress(msg):
+        progress.append(json.loads(msg) if msg.startswith("{") else msg)
+
+    urls = ["https://a.example/one", "https://b.example/fail", "https://a.example/one"]
+    manifest = await crawl.crawl_web_pages(
+        urls, str(tmp_path), max_concurrency=3, progress_callback=on_progress
+    )
+
+    assert manifest["total"] == 2
+    assert manifest["succeeded"] == 1
+    assert manifest["failed"] == 1
+    assert [page["url"] for page in manifest["pages"]] == urls[:2]
+
+    # One progress entry per URL, in completion order
+    per_url = [p for p in progress if isinstance(p, dict)]
+    assert [p["url"] for p in per_url] == ["https://b.example/fail", "https://a.example/one"]
+    assert per_url[-1]["completed"] == 2
+
+    ok = manifest["pages"][0]
+    assert os.path.basename(ok["output_dir"]) == "0000-a.example_one"
+    assert os.path.exists(os.path.join(ok["output_dir"], "output.html"))
+    assert manifest["pages"][1]["error"] == "boom"
+
+    with open(os.path.join(manifest["output_dir"], "manifest.json"), encoding="utf-8") as f:
+        assert json.load(f)["succeeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_crawl_web_pages_uses_streaming_bounded_dispatcher(pool, tmp_path):
+    await crawl.crawl_web_pages(["https://a.example/"], str(tmp_path), max_concurrency=4)
+
+    async with pool.crawler() as crawler:
+        _, config, dispatcher = crawler.calls[0]
+    assert config.stream is True
+    assert dispatcher.semaphore_count == 4
+
+
+@pytest.mark.asyncio
+async def test_crawler_failure_keeps_finished_pages_and_writes_manifest(pool, tmp_path):
+    # Results stream in reverse order: two.html finishes, then the crawler fails
+    urls = ["https://a.example/one", "https://c.example/crash", "https://b.example/two"]
+    manifest = await crawl.crawl_web_pages(urls, str(tmp_path))
+
+    assert [page["url"] for page in manifest["pages"]] == urls
+    assert manifest["succeeded"] == 1
+    assert manifest["pages"][2]["success"] is True
+    assert os.path.exists(os.path.join(manifest["pages"][2]["output_dir"], "output.html"))
+    for page in manifest["pages"][:2]:
+        assert page["success"] is False
+        assert page["error"] == "Crawl failed: browser closed"
+
+    with open(os.path.join(manifest["output_dir"], "manifest.json"), encoding="utf-8") as f:
+        assert json.load(f)["failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_results_under_unknown_urls_get_their_own_index_and_batches_their_own_directory(pool, tmp_path):
+    urls = ["https://a.example/one", "https://b.example/redirect", "https://c.example/two"]
+    manifest = await crawl.crawl_web_pages(urls, str(tmp_path))
+
+    indexes = [page["index"] for page in manifest["pages"]]
+    assert indexes == [0, 1, 2, 3]
+    assert manifest["pages"][3]["url"] == "https://b.example/redirect/landed"
+    assert manifest["pages"][3]["success"] is True
+    assert manifest["pages"][1]["error"] == "No result returned for URL"
+    assert len({page["output_dir"] for page in manifest["pages"] if page["success"]}) == 3
+
+    again = await crawl.crawl_web_pages(urls, str(tmp_path))
+    assert again["output_dir"] != manifest["output_dir"]
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk crawl cache: keys, hits, conditional revalidation,
+TTL, LRU eviction and reloading, with crawls served by a local HTTP server.
+"""
+
+import os
+
+import pytest
+from aiohttp import web
+
+from mcp_server.crawl import crawl_cache
+from mcp_server.crawl.crawl import crawl_web_page
+from mcp_server.crawl.crawl_cache import CrawlCache, cache_key, normalize_url
+
+
+PAGE = "<html><head><title>Cached</title></head><body><h1>Cached</h1><p>Static text.</p></body></html>"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.COM:443/a?b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("http://example.com:8080/x") == "http://example.com:8080/x"
+
+
+def test_cache_key_covers_url_and_options():
+    key = cache_key("https://example.com/?b=1&a=2", save_pdf=False, render="http")
+    assert key == cache_key("https://EXAMPLE.com/?a=2&b=1#x", render="http", save_pdf=False)
+    assert key != cache_key("https://example.com/?b=1&a=2", save_pdf=True, render="http")
+    assert key != cache_key("https://example.com/other", save_pdf=False, render="http")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock, monkeypatch):
+    cache = CrawlCache(str(tmp_path / "cache"), ttl=60, clock=clock)
+    monkeypatch.setattr(crawl_cache, "_crawl_cache", cache)
+    return cache
+
+
+@pytest.fixture
+async def site(local_server):
+    state = {"etag": '"v1"', "requests": []}
+
+    async def page(request):
+        conditional = request.headers.get("If-None-Match")
+        state["requests"].append(("page", conditional))
+        if conditional == state["etag"]:
+            return web.Response(status=304)
+        return web.Response(text=PAGE, content_type="text/html", headers={"ETag": state["etag"]})
+
+    async def plain(request):
+        state["requests"].append(("plain", request.headers.get("If-None-Match")))
+        return web.Response(text=PAGE, content_type="text/html")
+
+    return await local_server({"/page": page, "/plain": plain}), state
+
+
+def _output_dir(message: str) -> str:
+    return message.rsplit(" to ", 1)[1]
+
+
+async def test_repeat_crawl_is_a_cache_hit(site, cache, tmp_path):
+    url, state = site
+
+    first = await crawl_web_page(f"{url}/page", str(tmp_path / "one"), generate_markdown=True, render="http")
+    assert first.startswith(f"Successfully crawled {url}/page (HTTP) and saved 3 files")
+
+    second = await crawl_web_page(f"{url}/page#top", str(tmp_path / "two"), generate_markdown=True, render="http")
+    assert second.startswith(f"Successfully crawled {url}/page#top (HTTP, cache hit) and saved 3 files")
+    assert state["requests"] == [("page", None)]
+
+    assert sorted(os.listdir(_output_dir(second))) == ["output.html", "output.json", "raw_markdown.md"]
+    with open(os.path.join(_output_dir(second), "output.html"), encoding="utf-8") as f:
+        assert f.read() == PAGE
+
+    # Different options are a different entry
+    third = await crawl_web_page(f"{url}/page", str(tmp_path / "three"), render="http")
+    assert "(HTTP) and saved" in third
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["stores"] == 2
+
+
+async def test_stale_entry_is_revalidated(site, cache, clock, tmp_path):
+    url, state = site
+    await crawl_web_page(f"{url}/page", str(tmp_path / "one"), render="http")
+
+    clock.now += 61
+    message = await crawl_web_page(f"{url}/page", str(tmp_path / "two"), render="http")
+    assert "(HTTP, cache revalidated)" in message
+    assert state["requests"] == [("page", None), ("page", '"v1"')]
+
+    # Revalidation restarts the TTL
+    clock.now += 30
+    assert "cache hit" in await crawl_web_page(f"{url}/page", str(tmp_path / "three"), render="http")
+
+    # A changed page is crawled again
+    state["etag"] = '"v2"'
+    clock.now += 61
+    message = await crawl_web_page(f"{url}/page", str(tmp_path / "four"), render="http")
+    assert "(HTTP) and saved" in message
+    assert state["requests"][-2:] == [("page", '"v1"'), ("page", None)]
+    assert cache.stats()["revalidations"] == 1
+
+
+async def test_stale_entry_without_validators_is_crawled_again(site, cache, clock, tmp_path):
+    url, state = site
+    await crawl_web_page(f"{url}/plain", str(tmp_path / "one"), render="http")
+
+    clock.now += 61
+    message = await crawl_web_page(f"{url}/plain", str(tmp_path / "two"), render="http")
+    assert "(HTTP) and saved" in message
+    assert state["requests"] == [("plain", None), ("plain", None)]
+
+
+async def test_use_cache_false_always_crawls(site, cache, tmp_path):
+    url, state = site
+    await crawl_web_page(f"{url}/page", str(tmp_path / "one"), render="http", use_cache=False)
+    await crawl_web_page(f"{url}/page", str(tmp_path / "two"), render="http", use_cache=False)
+
+    assert len(state["requests"]) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def _saved(directory, name: str, size: int) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    return path
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = CrawlCache(str(tmp_path / "cache"), ttl=60, max_bytes=250, clock=clock)
+    out = str(tmp_path / "out")
+    for name in ("a", "b"):
+        await cache.store(name, f"https://{name}.test/", out, [_saved(out, f"{name}.html", 100)], rendered_by="HTTP")
+
+    clock.now += 1
+    assert await cache.restore("a", "https://a.test/", str(tmp_path / "restored"))
+    await cache.store("c", "https://c.test/", out, [_saved(out, "c.html", 100)], rendered_by="HTTP")
+
+    assert not os.path.exists(tmp_path / "cache" / "b")
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 200
+    assert cache.stats()["evictions"] == 1
+
+    # An entry larger than the whole cache is not stored
+    await cache.store("d", "https://d.test/", out, [_saved(out, "d.html", 300)], rendered_by="HTTP")
+    assert cache.stats()["entries"] == 2
+
+
+async def test_cache_is_reloaded_and_damaged_entries_are_dropped(tmp_path, clock):
+    directory = str(tmp_path / "cache")
+    out = str(tmp_path / "out")
+    cache = CrawlCache(directory, ttl=60, clock=clock)
+    await cache.store("a", "https://a.test/", out, [_saved(out, "a.html", 10), _saved(os.path.join(out, "files"), "f.bin", 5)],
+                      headers={"ETag": '"1"'}, rendered_by="browser")
+    os.makedirs(os.path.join(directory, "b.123.tmp"))
+
+    reloaded = CrawlCache(directory, ttl=60, clock=clock)
+    # Nothing is read from disk until the cache is loaded
+    assert reloaded.stats()["entries"] == 0
+    await reloaded.load()
+    assert reloaded.stats()["entries"] == 1
+    assert not os.path.exists(os.path.join(directory, "b.123.tmp"))
+    files, meta, status = await reloaded.restore("a", "https://a.test/", str(tmp_path / "restored"))
+    assert status == "hit"
+    assert meta["etag"] == '"1"' and meta["rendered_by"] == "browser"
+    assert sorted(os.path.relpath(f, tmp_path / "restored") for f in files) == ["a.html", os.path.join("files", "f.bin")]
+
+    os.remove(os.path.join(directory, "a", "outputs", "a.html"))
+    assert await reloaded.restore("a", "https://a.test/", str(tmp_path / "again")) is None
+    assert reloaded.stats()["entries"] == 0
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the crawler pool checkout/return semantics.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server import browser_cache
+from mcp_server.crawl import crawler_pool
+from mcp_server.crawl.crawler_pool import CrawlerPool
+
+
+class FakeCrawler:
+    """Stand-in for AsyncWebCrawler that records start/close calls."""
+
+    instances = []
+
+    def __init__(self, config=None):
+        self.config = config
+        self.started = False
+        self.closed = False
+        FakeCrawler.instances.append(self)
+
+    async def start(self):
+        self.started = True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_crawler(monkeypatch):
+    FakeCrawler.instances = []
+    monkeypatch.setattr(crawler_pool, "AsyncWebCrawler", FakeCrawler)
+    return FakeCrawler
+
+
+@pytest.mark.asyncio
+async def test_start_warms_all_slots():
+    pool = CrawlerPool(size=3)
+    await pool.start()
+
+    assert len(FakeCrawler.instances) == 3
+    assert all(c.started for c in FakeCrawler.instances)
+    assert pool.stats() == {"size": 3, "warm": 3, "in_use": 0, "idle": 3}
+
+    await pool.close()
+    assert all(c.closed for c in FakeCrawler.instances)
+
+
+@pytest.mark.asyncio
+async def test_crawlers_are_reused_between_checkouts():
+    pool = CrawlerPool(size=1)
+    await pool.start()
+
+    async with pool.crawler() as first:
+        assert pool.stats()["in_use"] == 1
+    async with pool.crawler() as second:
+        pass
+
+    assert first is second
+    assert len(FakeCrawler.instances) == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_checkout_waits_for_a_free_crawler():
+    pool = CrawlerPool(size=1)
+    await pool.start()
+    order = []
+
+    async def use(name, delay):
+        async with pool.crawler():
+            order.append(f"{name}-start")
+            await asyncio.sleep(delay)
+            order.append(f"{name}-end")
+
+    await asyncio.gather(use("a", 0.05), use("b", 0))
+    assert order == ["a-start", "a-end", "b-start", "b-end"]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_crawler_is_replaced_on_next_checkout():
+    pool = CrawlerPool(size=1)
+    await pool.start()
+
+    with pytest.raises(RuntimeError):
+        async with pool.crawler() as broken:
+            raise RuntimeError("browser crashed")
+    await asyncio.sleep(0)
+
+    assert broken.closed
+    async with pool.crawler() as replacement:
+        assert replacement is not broken
+        assert replacement.started
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_cache_dir_gives_each_crawler_its_own_profile(monkeypatch, tmp_path):
+    monkeypatch.setattr(browser_cache.BrowserCacheConfig, "DIR", str(tmp_path))
+    pool = CrawlerPool(size=2)
+    await pool.start()
+
+    configs = [c.config for c in FakeCrawler.instances]
+    assert sorted(config.user_data_dir for config in configs) == [
+        str(tmp_path / "crawler-0"), str(tmp_path / "crawler-1")
+    ]
+    assert all(config.use_persistent_context for config in configs)
+    assert all(any(arg.startswith("--disk-cache-size=") for arg in config.extra_args) for config in configs)
+
+    await pool.close()
+
+    # A replacement crawler takes over the profile of the crawler it replaces once that one closed
+    pool = CrawlerPool(size=1)
+    await pool.start()
+    with pytest.raises(RuntimeError):
+        async with pool.crawler() as broken:
+            raise RuntimeError("browser crashed")
+    await asyncio.sleep(0)
+    async with pool.crawler() as replacement:
+        assert replacement is not broken
+        assert replacement.config.user_data_dir == str(tmp_path / "crawler-0")
+    await pool.close()
+
+
+def test_without_browser_cache_dir_crawlers_have_no_profile():
+    config = crawler_pool.default_browser_config(3)
+    assert not config.use_persistent_context
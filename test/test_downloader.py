@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent, streamed file downloads against a local HTTP server.
+"""
+
+import asyncio
+import os
+
+import pytest
+from aiohttp import web
+
+from mcp_server.crawl import downloader
+from mcp_server.crawl.downloader import download_file, download_files
+
+
+@pytest.fixture
+async def file_server(local_server):
+    state = {"active": 0, "peak": 0, "release": asyncio.Event()}
+
+    async def serve(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(0.02)
+            size = int(request.match_info["size"])
+            return web.Response(body=b"x" * size)
+        finally:
+            state["active"] -= 1
+
+    async def stall(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"z" * 1024)
+        await state["release"].wait()
+        return response
+
+    async def stream_unknown_length(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(10):
+            await response.write(b"y" * 1024)
+        return response
+
+    return await local_server({"/file/{size}": serve, "/stream": stream_unknown_length,
+                               "/stall": stall}), state
+
+
+@pytest.mark.asyncio
+async def test_downloads_run_in_parallel_up_to_the_limit(file_server, tmp_path):
+    base, state = file_server
+    saved = []
+    files = [{"url": f"{base}/file/{100 + i}", "filename": f"f{i}.bin"} for i in range(6)]
+
+    reports = await download_files(files, str(tmp_path), saved.append, concurrency=3)
+
+    assert state["peak"] == 3
+    assert [r["filename"] for r in reports] == [f"f{i}.bin" for i in range(6)]
+    assert all(r["error"] is None and r["status"] == 200 for r in reports)
+    assert [r["bytes"] for r in reports] == [100 + i for i in range(6)]
+    assert all(r["elapsed_ms"] > 0 for r in reports)
+    assert sorted(saved) == sorted(str(tmp_path / f"f{i}.bin") for i in range(6))
+    assert os.path.getsize(tmp_path / "f5.bin") == 105
+
+
+@pytest.mark.asyncio
+async def test_oversized_and_failed_downloads_leave_no_files(file_server, tmp_path, monkeypatch):
+    base, _ = file_server
+    monkeypatch.setattr(downloader.DownloadConfig, "MAX_FILE_BYTES", 4096)
+    files = [
+        {"url": f"{base}/file/5000", "filename": "declared.bin"},
+        {"url": f"{base}/stream", "filename": "streamed.bin"},
+        {"url": f"{base}/missing", "filename": "missing.bin"},
+    ]
+
+    reports = await download_files(files, str(tmp_path), lambda path: None)
+
+    assert "exceeds maximum size" in reports[0]["error"]
+    assert "exceeds maximum size" in reports[1]["error"]
+    assert reports[2]["error"] == "HTTP 404"
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_downloads_leave_no_partial_file(file_server, tmp_path):
+    base, state = file_server
+    file_path = str(tmp_path / "stalled.bin")
+    task = asyncio.create_task(download_file(downloader.get_download_session(), f"{base}/stall", file_path))
+
+    for _ in range(200):
+        if os.path.exists(file_path + ".part"):
+            break
+        await asyncio.sleep(0.01)
+    assert os.path.exists(file_path + ".part")
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    state["release"].set()
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.asyncio
+async def test_filenames_cannot_escape_the_files_directory(file_server, tmp_path):
+    base, _ = file_server
+    files_dir = tmp_path / "files"
+    files_dir.mkdir()
+
+    reports = await download_files(
+        [{"url": f"{base}/file/10", "filename": "../../escape.bin"}], str(files_dir), lambda path: None
+    )
+
+    assert reports[0]["path"] == str(files_dir / "escape.bin")
+    assert not (tmp_path / "escape.bin").exists()
+
+
+@pytest.mark.asyncio
+async def test_entries_sharing_a_filename_are_saved_separately(file_server, tmp_path):
+    base, _ = file_server
+    saved = []
+    files = [{"url": f"{base}/file/{size}", "filename": "logo.png"} for size in (100, 200, 300)]
+
+    reports = await download_files(files, str(tmp_path), saved.append)
+
+    assert [r["filename"] for r in reports] == ["logo.png", "logo-1.png", "logo-2.png"]
+    assert sorted(saved) == sorted(r["path"] for r in reports)
+    assert [os.path.getsize(tmp_path / r["filename"]) for r in reports] == [100, 200, 300]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for emulation profiles: option validation, the CDP commands they send,
+and throttled page loads against a local fixture server.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.browser.emulation import EMULATION_PROFILES, apply_emulation, validate_emulation
+
+
+def test_validate_profile_name_and_list():
+    assert validate_emulation(None) is None
+    assert validate_emulation([]) is None
+
+    settings = validate_emulation("slow-3g")
+    assert settings == {"latency_ms": 2000, "download_kbps": 400, "upload_kbps": 400, "profiles": ["slow-3g"]}
+
+    combined = validate_emulation(["mobile", "slow-3g", "cpu-4x"])
+    assert combined["cpu_slowdown"] == 4
+    assert combined["viewport"] == {"width": 412, "height": 823}
+    assert combined["latency_ms"] == 2000
+
+
+def test_validate_overrides_profile_settings():
+    settings = validate_emulation({"profiles": ["lighthouse-mobile"], "cpu_slowdown": 2, "latency_ms": 0})
+
+    assert settings["cpu_slowdown"] == 2
+    assert settings["latency_ms"] == 0
+    assert settings["download_kbps"] == EMULATION_PROFILES["lighthouse-mobile"]["download_kbps"]
+
+
+@pytest.mark.parametrize("emulation", [
+    "edge-5g",
+    42,
+    {"profiles": "mobile"},
+    {"cpu": 4},
+    {"cpu_slowdown": 0.5},
+    {"cpu_slowdown": True},
+    {"latency_ms": -1},
+    {"viewport": {"width": 412}},
+    {"viewport": {"width": 412, "height": 0}},
+    {"user_agent": 1},
+])
+def test_validate_rejects_bad_options(emulation):
+    with pytest.raises(ValueError):
+        validate_emulation(emulation)
+
+
+class FakeCDPSession:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params))
+        return {}
+
+
+class FakeContext:
+    def __init__(self, session):
+        self.session = session
+
+    async def new_cdp_session(self, page):
+        return self.session
+
+
+class FakePage:
+    viewport_size = {"width": 1280, "height": 720}
+
+    def __init__(self):
+        self.context = FakeContext(FakeCDPSession())
+
+
+def test_apply_emulation_sends_cdp_commands():
+    page = FakePage()
+    settings = asyncio.run(apply_emulation(page, ["slow-3g", "cpu-4x", "mobile"]))
+
+    sent = dict(page.context.session.sent)
+    assert settings["profiles"] == ["slow-3g", "cpu-4x", "mobile"]
+    assert sent["Network.emulateNetworkConditions"] == {
+        "offline": False, "latency": 2000, "downloadThroughput": 50000.0, "uploadThroughput": 50000.0,
+    }
+    assert sent["Emulation.setCPUThrottlingRate"] == {"rate": 4}
+    assert sent["Emulation.setDeviceMetricsOverride"] == {
+        "width": 412, "height": 823, "deviceScaleFactor": 1.75, "mobile": True,
+    }
+    assert sent["Emulation.setTouchEmulationEnabled"] == {"enabled": True}
+    assert "Network.setUserAgentOverride" in sent
+
+
+def test_apply_emulation_only_sends_what_is_set():
+    page = FakePage()
+    asyncio.run(apply_emulation(page, {"cpu_slowdown": 6}))
+    assert page.context.session.sent == [("Emulation.setCPUThrottlingRate", {"rate": 6})]
+
+    page = FakePage()
+    assert asyncio.run(apply_emulation(page, None)) is None
+    assert page.context.session.sent == []
+
+
+FIXTURE_PAGE = """<!doctype html>
+<html><head><meta name="viewport" content="width=device-width"><title>fixture</title></head>
+<body><p id="width"></p>
+<script>document.getElementById('width').textContent = 'width=' + window.innerWidth;</script>
+</body></html>"""
+
+
+@pytest.fixture
+async def fixture_server(local_server):
+    async def page(request):
+        return web.Response(text=FIXTURE_PAGE, content_type="text/html")
+
+    return await local_server({"/": page}) + "/"
+
+
+@pytest.fixture
+async def browser_service():
+    service = BrowserService()
+    try:
+        await service.initialize()
+    except Exception as e:
+        pytest.skip(f"Chromium is not available: {e}")
+    yield service
+    await service.close()
+
+
+async def test_throttled_load_against_fixture_server(fixture_server, browser_service):
+    started = time.perf_counter()
+    plain = await browser_service.get_page_content(fixture_server, fields=["text"])
+    plain_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    throttled = await browser_service.get_page_content(fixture_server, fields=["text"], emulation=["slow-3g", "mobile"])
+    throttled_seconds = time.perf_counter() - started
+
+    assert "error" not in plain and "error" not in throttled
+    assert "width=412" in throttled["text"]
+    assert throttled["emulation"]["profiles"] == ["slow-3g", "mobile"]
+    # Slow 3G adds two seconds of round-trip latency to the document request
+    assert throttled_seconds >= 2.0 > plain_seconds
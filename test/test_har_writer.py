@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming HAR/NDJSON traffic export, using fake Playwright objects.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from mcp_server.browser import har_writer
+from mcp_server.browser.har_writer import TrafficExporter, validate_export_options
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.status_text = "OK"
+        self.headers = headers
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, url, response=None, failure=None, post_data=None, resource_type="fetch"):
+        self.url = url
+        self.method = "POST" if post_data else "GET"
+        self.headers = {"accept": "*/*"}
+        self.resource_type = resource_type
+        self.post_data = post_data
+        self.failure = failure
+        self.timing = {"startTime": 1700000000000.0, "domainLookupStart": 1.0, "domainLookupEnd": 2.0,
+                       "connectStart": 2.0, "secureConnectionStart": -1, "connectEnd": 4.0,
+                       "requestStart": 4.5, "responseStart": 10.0, "responseEnd": 12.5}
+        self._response = response
+
+    async def response(self):
+        return self._response
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def emit(self, event, payload):
+        for callback in self.listeners.get(event, []):
+            callback(payload)
+
+
+def sample_requests():
+    json_body = b'{"ok": true}'
+    return [
+        ("requestfinished", FakeRequest(
+            "https://example.com/api?q=1&empty=",
+            FakeResponse(200, {"content-type": "application/json", "content-length": str(len(json_body))}, json_body),
+            post_data='{"a": 1}')),
+        ("requestfinished", FakeRequest(
+            "https://example.com/logo.png",
+            FakeResponse(200, {"content-type": "image/png"}, b"\x89PNG"), resource_type="image")),
+        ("requestfinished", FakeRequest(
+            "https://example.com/big.txt",
+            FakeResponse(200, {"content-type": "text/plain"}, b"x" * 5000), resource_type="document")),
+        ("requestfailed", FakeRequest("https://example.com/gone.js", failure="net::ERR_FAILED")),
+    ]
+
+
+async def test_har_export_streams_entries(tmp_path):
+    page = FakePage()
+    exporter = TrafficExporter(str(tmp_path / "out" / "traffic.har"), include_bodies=True, max_body_bytes=1000)
+    await exporter.open()
+    exporter.attach(page)
+    for event, request in sample_requests():
+        page.emit(event, request)
+        await asyncio.sleep(0)
+
+    report = await exporter.close("Example")
+
+    har = json.loads((tmp_path / "out" / "traffic.har").read_text(encoding="utf-8"))
+    entries = har["log"]["entries"]
+    assert report["entries"] == 4 and report["bodies"] == 1
+    assert report["bytes_written"] == (tmp_path / "out" / "traffic.har").stat().st_size
+    assert har["log"]["version"] == "1.2"
+    assert har["log"]["pages"][0]["title"] == "Example"
+
+    api = entries[0]
+    assert api["request"]["queryString"] == [{"name": "q", "value": "1"}, {"name": "empty", "value": ""}]
+    assert api["request"]["postData"]["text"] == '{"a": 1}'
+    assert api["response"]["content"]["text"] == '{"ok": true}'
+    assert api["timings"]["dns"] == 1.0 and api["timings"]["wait"] == 5.5 and api["time"] == 12.5
+    # Image bodies are not in the default content types, oversized text bodies are left out
+    assert "text" not in entries[1]["response"]["content"]
+    assert "text" not in entries[2]["response"]["content"] and entries[2]["response"]["content"]["size"] == 5000
+    assert entries[3]["_failure"] == "net::ERR_FAILED" and entries[3]["response"]["status"] == 0
+
+
+async def test_ndjson_export_without_bodies(tmp_path):
+    page = FakePage()
+    path = tmp_path / "traffic.ndjson"
+    exporter = TrafficExporter(str(path), export_format="ndjson")
+    await exporter.open()
+    exporter.attach(page)
+    for event, request in sample_requests():
+        page.emit(event, request)
+
+    report = await exporter.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4 and report["bodies"] == 0
+    assert [json.loads(line)["request"]["url"] for line in lines][1] == "https://example.com/logo.png"
+    assert all("text" not in json.loads(line)["response"]["content"] for line in lines)
+
+
+def test_validate_export_options():
+    validate_export_options(None, "xml")  # ignored without a path
+    validate_export_options("out.har", "ndjson", True, 0, ["text/"])
+    with pytest.raises(ValueError):
+        validate_export_options("out.har", "xml")
+    with pytest.raises(ValueError):
+        validate_export_options("", None)
+    with pytest.raises(ValueError):
+        validate_export_options("out.har", max_body_bytes=-1)
+
+
+async def test_unwritable_export_path_fails_cleanly(tmp_path):
+    exporter = TrafficExporter(str(tmp_path))
+
+    with pytest.raises(OSError):
+        await exporter.open()
+    # The caller's cleanup must not fail on the file that was never opened
+    await exporter.abort()
+    assert exporter.report()["entries"] == 0
+
+
+async def test_full_queue_drops_and_counts_requests(tmp_path, monkeypatch):
+    monkeypatch.setattr(har_writer.HarExportConfig, "QUEUE_SIZE", 2)
+    page = FakePage()
+    exporter = TrafficExporter(str(tmp_path / "traffic.ndjson"), export_format="ndjson")
+    await exporter.open()
+    exporter.attach(page)
+
+    # No await between events, so the writer task cannot drain the queue in between
+    for i in range(5):
+        page.emit("requestfinished", FakeRequest(f"https://example.com/{i}", FakeResponse(200, {}, b"")))
+    report = await exporter.close()
+
+    assert report["entries"] == 2
+    assert report["dropped"] == 3
+    assert len((tmp_path / "traffic.ndjson").read_text(encoding="utf-8").splitlines()) == 2
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP fast path: fetching, the needs-JavaScript heuristics and
+static content extraction, against a local HTTP server.
+"""
+
+import os
+import threading
+
+import pytest
+from aiohttp import web
+
+from mcp_server import http_render, render_table
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.crawl.crawl import crawl_web_page
+from mcp_server.http_render import extract_static_content, fetch_page, needs_browser, validate_render_mode
+
+
+ARTICLE = """<!doctype html>
+<html><head><title> Static article </title>
+<meta name="description" content="An article"><meta property="og:title" content="OG title">
+<base href="/docs/"></head>
+<body><h1>Article</h1><p>""" + "Plain server-rendered text. " * 20 + """</p>
+<a href="intro.html">Intro</a> <a href="https://other.example/x">Other</a> <a>No href</a>
+<img src="a.png" alt="A"><img src="/b.png">
+<script src="/analytics.js"></script>
+</body></html>"""
+
+SPA = """<!doctype html><html><head><title>App</title></head>
+<body><div id="root"></div><script src="/bundle.js"></script></body></html>"""
+
+NOSCRIPT = """<!doctype html><html><head><title>App</title></head>
+<body><noscript>You need to enable JavaScript to run this app.</noscript>""" + "<p>Loading</p>" * 50 + """</body></html>"""
+
+LATIN1 = "<html><head><meta charset=\"iso-8859-1\"><title>Caf\xe9</title></head><body>Caf\xe9</body></html>"
+
+
+@pytest.fixture
+async def site(local_server):
+    async def html(body, **kwargs):
+        return web.Response(text=body, content_type="text/html", **kwargs)
+
+    async def article(request):
+        return await html(ARTICLE)
+
+    async def spa(request):
+        return await html(SPA)
+
+    async def noscript(request):
+        return await html(NOSCRIPT)
+
+    async def latin1(request):
+        return web.Response(body=LATIN1.encode("iso-8859-1"), headers={"Content-Type": "text/html"})
+
+    async def data(request):
+        return web.json_response({"ok": True})
+
+    async def big(request):
+        return web.Response(body=b"x" * 4096, content_type="text/html")
+
+    async def redirect(request):
+        raise web.HTTPFound("/article")
+
+    async def missing(request):
+        return web.Response(status=404, text="<html><body>Not found</body></html>", content_type="text/html")
+
+    return await local_server({
+        "/article": article, "/spa": spa, "/noscript": noscript, "/latin1": latin1,
+        "/data": data, "/big": big, "/redirect": redirect, "/missing": missing,
+    })
+
+
+def test_validate_render_mode():
+    assert validate_render_mode("http") == "http"
+    assert validate_render_mode(None) == http_render.HttpRenderConfig.DEFAULT_RENDER
+    with pytest.raises(ValueError):
+        validate_render_mode("fast")
+
+
+async def test_static_page_extraction_matches_browser_shape(site):
+    page = await fetch_page(f"{site}/redirect")
+
+    assert page.url == f"{site}/article"
+    assert needs_browser(page) is None
+
+    content = extract_static_content(page, max_links=2, max_text_chars=50)
+    assert content["title"] == "Static article"
+    assert content["html"] == ARTICLE
+    assert content["text"].startswith("Article")
+    assert {"name": "og:title", "content": "OG title"} in content["meta"]
+    assert content["links"] == [
+        {"text": "Intro", "href": f"{site}/docs/intro.html"},
+        {"text": "Other", "href": "https://other.example/x"},
+    ]
+    assert content["images"] == [{"src": f"{site}/docs/a.png", "alt": "A"}, {"src": f"{site}/b.png", "alt": ""}]
+    assert content["truncated"]["links"] == 3
+    assert content["truncated"]["text"] > 50
+
+
+async def test_field_selection(site):
+    page = await fetch_page(f"{site}/article")
+
+    assert set(extract_static_content(page, fields=["title", "links"])) == {"title", "links"}
+
+
+@pytest.mark.parametrize("path, reason", [
+    ("/spa", "empty application root #root"),
+    ("/noscript", "page asks for JavaScript in <noscript>"),
+])
+async def test_javascript_pages_need_the_browser(site, path, reason):
+    assert needs_browser(await fetch_page(site + path)) == reason
+
+
+async def test_missing_selector_needs_the_browser(site):
+    page = await fetch_page(f"{site}/article")
+
+    assert needs_browser(page, "h1") is None
+    assert "not in static HTML" in needs_browser(page, "#comments")
+
+
+async def test_charset_from_meta_and_non_html(site):
+    page = await fetch_page(f"{site}/latin1")
+    assert extract_static_content(page, fields=["title"])["title"] == "Caf\xe9"
+
+    data = await fetch_page(f"{site}/data")
+    assert needs_browser(data) is None
+    assert extract_static_content(data, fields=["text", "links"]) == {"text": '{"ok": true}', "links": []}
+
+
+async def test_oversized_documents_are_refused(site):
+    with pytest.raises(ValueError):
+        await fetch_page(f"{site}/big", max_bytes=1024)
+
+
+async def test_get_page_content_http_and_auto_skip_the_browser(site):
+    service = BrowserService()
+
+    result = await service.get_page_content(f"{site}/article", render="http", fields=["title"])
+    assert result["title"] == "Static article"
+    assert result["status"] == 200
+    assert result["render"] == {"mode": "http"}
+
+    result = await service.get_page_content(f"{site}/article", render="auto", fields=["title"])
+    assert result["render"] == {"mode": "http"}
+
+    result = await service.get_page_content(f"{site}/missing", render="http", fields=["text"])
+    assert result["status"] == 404
+
+    # The browser is never started for these calls
+    assert service._browser is None
+
+    result = await service.get_page_content(f"{site}/article", render="http", emulation="mobile")
+    assert "emulation" in result["error"]
+
+
+async def test_documents_are_parsed_off_the_event_loop(site, monkeypatch):
+    threads = []
+
+    def recording_needs_browser(*args):
+        threads.append(threading.get_ident())
+        return needs_browser(*args)
+
+    monkeypatch.setattr(render_table, "needs_browser", recording_needs_browser)
+    result = await BrowserService().get_page_content(f"{site}/article", render="auto", fields=["title"])
+
+    assert result["render"] == {"mode": "http"}
+    assert threads and threading.get_ident() not in threads
+
+
+async def test_crawl_web_page_over_http(site, tmp_path):
+    message = await crawl_web_page(f"{site}/article", str(tmp_path), generate_markdown=True, render="http")
+
+    assert message.startswith(f"Successfully crawled {site}/article (HTTP)")
+    output_dir = message.rsplit(" to ", 1)[1]
+    assert sorted(os.listdir(output_dir)) == ["files", "output.html", "output.json", "raw_markdown.md"]
+    with open(os.path.join(output_dir, "raw_markdown.md"), encoding="utf-8") as f:
+        assert "# Article" in f.read()
+
+
+async def test_crawl_web_page_http_refuses_browser_only_outputs(site, tmp_path):
+    message = await crawl_web_page(f"{site}/article", str(tmp_path), save_screenshot=True, render="http")
+
+    assert "require render" in message
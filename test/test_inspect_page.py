@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for inspect_page: content, console and network from a single load of a
+local page, content limits, and errors that still return a result. The tests
+that load the page need a Chromium that can launch.
+"""
+
+import pytest
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+
+PAGE = """<html><head><title>Inspected</title></head><body>
+<p>Some text that is longer than the limit used below.</p>
+<a href="/one">One</a><a href="/two">Two</a>
+<script>
+  console.log("hello from the page");
+  console.error("something broke");
+  fetch("/data.json");
+</script>
+</body></html>"""
+
+
+@pytest.fixture
+async def site(local_server):
+    async def page(request):
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def data(request):
+        return web.json_response({"ok": True})
+
+    return await local_server({"/page": page, "/data.json": data})
+
+
+@pytest.fixture
+async def service():
+    service = BrowserService()
+    await service.initialize()
+    yield service
+    await service.close()
+
+
+async def test_one_load_returns_content_console_and_network(site, service):
+    result = await service.inspect_page(f"{site}/page")
+
+    assert "error" not in result
+    assert result["status"] == 200
+    assert result["content"]["title"] == "Inspected"
+    assert [(m["type"], m["text"]) for m in result["console_messages"]] == [
+        ("log", "hello from the page"), ("error", "something broke"),
+    ]
+    requested = [request["url"] for request in result["requests"]]
+    assert requested[0] == f"{site}/page"
+    assert f"{site}/data.json" in requested
+    assert result["total_requests"] == len(requested)
+    assert "settle" in result
+
+
+async def test_parts_can_be_left_out_and_limited(site, service):
+    result = await service.inspect_page(
+        f"{site}/page", include_console=False, include_network=False,
+        fields=["text", "links"], max_text_chars=10, max_links=1,
+    )
+
+    assert "console_messages" not in result and "requests" not in result
+    assert set(result["content"]) == {"text", "links", "truncated"}
+    assert len(result["content"]["text"]) == 10
+    assert len(result["content"]["links"]) == 1
+    assert result["content"]["truncated"]["links"] == 2
+
+
+async def test_levels_filter_console_messages(site, service):
+    result = await service.inspect_page(f"{site}/page", include_content=False, levels=["error"])
+
+    assert "content" not in result
+    assert [m["text"] for m in result["console_messages"]] == ["something broke"]
+    assert result["console_summary"]["by_type"] == {"log": 1, "error": 1}
+
+
+async def test_load_errors_keep_the_partial_capture(service):
+    # Nothing listens on port 9 of the loopback interface
+    result = await service.inspect_page("http://127.0.0.1:9/", include_content=False)
+
+    assert "error" in result
+    assert result["total_requests"] >= 1
+    assert result["console_messages"] == []
+
+
+@pytest.mark.parametrize("options", [
+    {"settle_quiet_ms": -1},
+    {"max_records": -1},
+])
+async def test_invalid_options_return_an_error_without_a_page(options):
+    service = BrowserService()
+    result = await service.inspect_page("https://example.com/", **options)
+
+    assert "error" in result
+    assert "content" not in result
+    assert service.get_stats()["active_pages"] == 0
+
+
+async def test_invalid_url_returns_an_error():
+    result = await BrowserService().inspect_page("ftp://example.com/file")
+
+    assert result["url"] == "ftp://example.com/file"
+    assert "error" in result
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for passive and intercepting network capture, using a fake Playwright page.
+"""
+
+import pytest
+
+from mcp_server.browser.network_capture import NetworkCapture, validate_capture_mode, validate_network_options
+
+
+class FakeRequest:
+    def __init__(self, url, timing=None, failure=None, resource_type="script"):
+        self.url = url
+        self.method = "GET"
+        self.resource_type = resource_type
+        self.frame = None
+        self.headers = {"accept": "*/*", "referer": "https://example.com/", "user-agent": "test"}
+        self.timing = timing or {"startTime": 1.0, "requestStart": 2.0, "responseStart": 5.0, "responseEnd": 7.5}
+        self.failure = failure
+
+
+class FakeResponse:
+    def __init__(self, request, status=200):
+        self.url = request.url
+        self.request = request
+        self.status = status
+        self.status_text = "OK"
+        self.headers = {"content-type": "text/javascript", "content-length": "42", "server": "test", "etag": "x"}
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.continued = False
+
+    async def continue_(self):
+        self.continued = True
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = {}
+        self.routes = []
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    async def route(self, pattern, handler):
+        self.routes.append(handler)
+
+    def emit(self, event, payload):
+        for callback in self.listeners.get(event, []):
+            callback(payload)
+
+
+async def test_passive_capture_records_requests_with_timing():
+    page = FakePage()
+    capture = NetworkCapture("passive")
+    await capture.attach(page)
+
+    ok = FakeRequest("https://example.com/app.js")
+    failed = FakeRequest("https://example.com/missing.js", failure="net::ERR_FAILED")
+    page.emit("request", ok)
+    page.emit("request", failed)
+    page.emit("response", FakeResponse(ok))
+    page.emit("requestfinished", ok)
+    page.emit("requestfailed", failed)
+
+    assert page.routes == []
+    result = capture.result()
+    assert result["total_requests"] == 2
+    assert result["total_responses"] == 1
+    assert result["requests"][0]["url"] == "https://example.com/app.js"
+    assert result["requests"][0]["timing"]["duration_ms"] == 7.5
+    assert result["requests"][1]["failure"] == "net::ERR_FAILED"
+    assert result["responses"][0]["status"] == 200
+
+
+async def test_intercept_capture_routes_requests():
+    page = FakePage()
+    capture = NetworkCapture("intercept")
+    await capture.attach(page)
+
+    assert "request" not in page.listeners
+    route = FakeRoute(FakeRequest("https://example.com/"))
+    await page.routes[0](route)
+
+    assert route.continued
+    assert capture.result()["total_requests"] == 1
+
+
+async def test_records_keep_only_allowlisted_headers():
+    page = FakePage()
+    capture = NetworkCapture(include_headers=["Referer", "ETag"])
+    await capture.attach(page)
+
+    request = FakeRequest("https://example.com/app.js")
+    page.emit("request", request)
+    page.emit("response", FakeResponse(request))
+
+    result = capture.result()
+    assert result["requests"][0]["headers"] == {"referer": "https://example.com/"}
+    assert result["responses"][0]["headers"] == {"etag": "x"}
+    # Responses no longer repeat the request headers
+    assert "request_headers" not in result["responses"][0]
+
+    capture = NetworkCapture(include_headers=["*"])
+    await capture.attach(page)
+    page.emit("request", request)
+    assert capture.result()["requests"][0]["headers"] == request.headers
+
+
+async def test_ring_buffer_drops_oldest_but_summary_counts_all():
+    page = FakePage()
+    capture = NetworkCapture(max_records=3)
+    await capture.attach(page)
+
+    for i in range(10):
+        host = "cdn.example.com" if i % 2 else "example.com"
+        request = FakeRequest(f"https://{host}/{i}.png", resource_type="image")
+        page.emit("request", request)
+        page.emit("response", FakeResponse(request))
+        page.emit("requestfinished", request)
+
+    result = capture.result()
+    assert [r["url"] for r in result["requests"]] == [
+        "https://cdn.example.com/7.png", "https://example.com/8.png", "https://cdn.example.com/9.png"
+    ]
+    assert result["dropped_records"] == 7
+    assert result["total_requests"] == 10
+    summary = result["summary"]
+    assert summary["bytes"] == 420
+    assert summary["by_domain"]["example.com"] == {"requests": 5, "bytes": 210, "failed": 0}
+    assert summary["by_resource_type"]["image"]["requests"] == 10
+    assert summary["by_status"] == {"2xx": 10}
+
+
+async def test_summary_only_keeps_no_records():
+    page = FakePage()
+    capture = NetworkCapture(summary_only=True)
+    await capture.attach(page)
+
+    request = FakeRequest("https://example.com/missing.js", failure="net::ERR_FAILED")
+    page.emit("request", request)
+    page.emit("requestfailed", request)
+
+    result = capture.result()
+    assert "requests" not in result and "responses" not in result
+    assert len(capture.records) == 0
+    assert result["summary"]["failed"] == 1
+    assert result["summary"]["by_resource_type"]["script"]["failed"] == 1
+
+
+def test_validate_network_options():
+    validate_network_options(100, ["content-type"], True)
+    with pytest.raises(ValueError):
+        validate_network_options(-1)
+    with pytest.raises(ValueError):
+        validate_network_options(include_headers="content-type")
+    with pytest.raises(ValueError):
+        validate_network_options(summary_only="yes")
+
+
+def test_validate_capture_mode():
+    assert validate_capture_mode(None) == "passive"
+    assert validate_capture_mode("intercept") == "intercept"
+    with pytest.raises(ValueError):
+        validate_capture_mode("cdp")
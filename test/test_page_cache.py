@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the get_page_content result cache: TTL, max_age, the byte budget
+and LRU eviction, and cached calls against a local HTTP server.
+"""
+
+import pytest
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.browser.page_cache import PageCache, PageCacheConfig, page_cache_key, validate_cache_options
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_validate_cache_options():
+    validate_cache_options(None, None)
+    validate_cache_options(0, True)
+    validate_cache_options(2.5, False)
+    for max_age, bypass_cache in ((-1, False), ("10", False), (True, False), (10, "yes")):
+        with pytest.raises(ValueError):
+            validate_cache_options(max_age, bypass_cache)
+
+
+def test_page_cache_key():
+    assert page_cache_key("https://a.test/", fields=["text"], render="http") == \
+        page_cache_key("https://a.test/", render="http", fields=["text"])
+    assert page_cache_key("https://a.test/", fields=["text"]) != page_cache_key("https://a.test/", fields=["html"])
+
+
+async def test_get_returns_copies_until_the_ttl():
+    clock = FakeClock()
+    cache = PageCache(ttl=60, max_bytes=1024, clock=clock)
+    await cache.put("a", {"title": "A", "links": []})
+
+    result, age = await cache.get("a")
+    result["links"].append("mutated")
+    clock.now += 10
+    assert await cache.get("a") == ({"title": "A", "links": []}, 10)
+
+    clock.now += 50
+    assert await cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+async def test_max_age_misses_without_evicting():
+    clock = FakeClock()
+    cache = PageCache(ttl=60, max_bytes=1024, clock=clock)
+    await cache.put("a", {"title": "A"})
+    clock.now += 30
+
+    assert await cache.get("a", max_age=10) is None
+    assert await cache.get("a", max_age=30) is not None
+    assert await cache.get("a") is not None
+
+
+async def test_byte_budget_evicts_least_recently_used():
+    cache = PageCache(ttl=60, max_bytes=100)
+    for key in ("a", "b"):
+        await cache.put(key, {"text": key * 30})
+    await cache.get("a")
+    await cache.put("c", {"text": "c" * 30})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None and await cache.get("c") is not None
+    assert cache.stats()["bytes"] <= 100
+    assert cache.stats()["evictions"] == 1
+
+    # A result larger than the budget is not cached and replaces nothing
+    await cache.put("a", {"text": "x" * 200})
+    assert await cache.get("a") is None
+    assert await cache.get("c") is not None
+
+
+async def test_a_zero_budget_disables_the_cache():
+    cache = PageCache(ttl=60, max_bytes=0)
+    await cache.put("a", {"title": "A"})
+
+    assert not cache.enabled
+    assert await cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+async def site(local_server, monkeypatch):
+    monkeypatch.setattr(PageCacheConfig, "MAX_BYTES", 1024 * 1024)
+    requests = []
+
+    async def article(request):
+        requests.append(request.path)
+        return web.Response(text="<html><head><title>Article</title></head><body><p>Text</p></body></html>",
+                            content_type="text/html")
+
+    async def missing(request):
+        requests.append(request.path)
+        return web.Response(status=404, text="<html><body>Not found</body></html>", content_type="text/html")
+
+    return await local_server({"/article": article, "/missing": missing}), requests
+
+
+async def test_get_page_content_serves_repeat_calls_from_the_cache(site):
+    url, requests = site
+    service = BrowserService()
+
+    first = await service.get_page_content(f"{url}/article", render="http", fields=["title"])
+    assert "cache" not in first
+    second = await service.get_page_content(f"{url}/article", render="http", fields=["title"])
+    assert second["title"] == "Article"
+    assert second["cache"]["hit"] is True
+    assert requests == ["/article"]
+
+    # Different options, an older max_age or bypass_cache load the page again
+    await service.get_page_content(f"{url}/article", render="http", fields=["text"])
+    await service.get_page_content(f"{url}/article", render="http", fields=["title"], max_age=0)
+    refreshed = await service.get_page_content(f"{url}/article", render="http", fields=["title"], bypass_cache=True)
+    assert "cache" not in refreshed
+    assert len(requests) == 4
+
+    stats = service.get_stats()["page_cache"]
+    assert stats["hits"] == 1
+    assert stats["entries"] == 2
+
+
+async def test_error_responses_are_not_cached(site):
+    url, requests = site
+    service = BrowserService()
+
+    await service.get_page_content(f"{url}/missing", render="http")
+    result = await service.get_page_content(f"{url}/missing", render="http")
+
+    assert result["status"] == 404
+    assert "cache" not in result
+    assert requests == ["/missing", "/missing"]
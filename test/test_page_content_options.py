@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for get_page_content field selection and limit validation, and for
+the options that need the browser.
+"""
+
+import pytest
+from aiohttp import web
+
+from mcp_server.browser import browser_service
+from mcp_server.browser.browser_service import BrowserService, validate_content_options, CONTENT_FIELDS
+
+
+def test_defaults_are_valid():
+    validate_content_options()
+    validate_content_options(list(CONTENT_FIELDS), 10, 10, 1000, 0)
+
+
+@pytest.mark.parametrize("fields", [[], "title", ["title", "body"]])
+def test_invalid_fields_are_rejected(fields):
+    with pytest.raises(ValueError):
+        validate_content_options(fields)
+
+
+@pytest.mark.parametrize("limits", [
+    {"max_links": -1},
+    {"max_text_chars": "100"},
+    {"max_html_chars": True},
+    {"max_images": 1.5},
+])
+def test_invalid_limits_are_rejected(limits):
+    with pytest.raises(ValueError):
+        validate_content_options(["title"], **limits)
+
+
+async def test_block_resources_is_rejected_over_http():
+    result = await BrowserService().get_page_content(
+        "https://example.com/", render="http", block_resources={"resource_types": ["image"]}
+    )
+    assert result["error"] == 'block_resources requires render "browser" or "auto"'
+
+
+async def test_block_resources_uses_the_browser_in_auto_mode(local_server, monkeypatch):
+    requests = []
+
+    async def article(request):
+        requests.append(request.path)
+        return web.Response(text="<html><body><p>Static text</p></body></html>", content_type="text/html")
+
+    base = await local_server({"/article": article})
+
+    async def fetch_for_render(*args, **kwargs):
+        raise AssertionError("the page was fetched over HTTP")
+
+    async def create_page(self):
+        raise RuntimeError("browser page requested")
+
+    monkeypatch.setattr(browser_service, "fetch_for_render", fetch_for_render)
+    monkeypatch.setattr(BrowserService, "_create_page_with_context", create_page)
+
+    result = await BrowserService().get_page_content(
+        f"{base}/article", render="auto", block_resources={"trackers": True}
+    )
+    assert result["error"] == "browser page requested"
+    assert requests == []
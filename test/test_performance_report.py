@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for turning collected performance entries into the get_page_performance report.
+"""
+
+from mcp_server.browser.performance import build_performance_report, waterfall_summary
+
+
+RAW = {
+    "navigation": {
+        "type": "navigate", "nextHopProtocol": "h2", "startTime": 0,
+        "redirectStart": 0, "redirectEnd": 0,
+        "domainLookupStart": 5.0, "domainLookupEnd": 25.0,
+        "connectStart": 25.0, "secureConnectionStart": 40.0, "connectEnd": 80.0,
+        "requestStart": 81.0, "responseStart": 181.0, "responseEnd": 200.0,
+        "domInteractive": 400.0, "domContentLoadedEventEnd": 450.0, "loadEventEnd": 900.0,
+        "transferSize": 15000, "decodedBodySize": 60000,
+    },
+    "paints": [{"name": "first-paint", "startTime": 300.0}, {"name": "first-contentful-paint", "startTime": 310.0}],
+    "lcp": {"startTime": 820.0, "size": 120000, "url": "https://cdn.example.com/hero.jpg", "element": "img#hero"},
+    "cls": 0.123456,
+    "layoutShifts": 3,
+    "longTasks": [{"startTime": 350.0, "duration": 120.0}, {"startTime": 600.0, "duration": 55.0}],
+    "resources": [
+        {"name": "https://cdn.example.com/hero.jpg", "initiatorType": "img", "startTime": 420.0,
+         "duration": 380.0, "responseEnd": 800.0, "transferSize": 90000, "decodedBodySize": 90000},
+        {"name": "https://cdn.example.com/app.js", "initiatorType": "script", "startTime": 210.0,
+         "duration": 150.0, "responseEnd": 360.0, "transferSize": 40000, "decodedBodySize": 120000},
+        {"name": "https://example.com/api/data", "initiatorType": "fetch", "startTime": 500.0,
+         "duration": 90.0, "responseEnd": 590.0, "transferSize": 2000, "decodedBodySize": 8000},
+        {"name": "https://cdn.example.com/logo.png", "initiatorType": "img", "startTime": 430.0,
+         "duration": 20.0, "responseEnd": 450.0, "transferSize": 0, "decodedBodySize": 3000},
+    ],
+}
+
+
+def test_report_metrics():
+    report = build_performance_report(RAW, slowest=2)
+
+    navigation = report["navigation"]
+    assert navigation["redirect"] is None
+    assert navigation["dns"] == 20.0 and navigation["connect"] == 55.0 and navigation["tls"] == 40.0
+    assert navigation["ttfb"] == 181.0 and navigation["load"] == 900.0
+
+    assert report["paint"]["first_contentful_paint"] == 310.0
+    assert report["paint"]["largest_contentful_paint"] == 820.0
+    assert report["paint"]["lcp_element"] == "img#hero"
+    assert report["layout"] == {"cumulative_layout_shift": 0.1235, "layout_shifts": 3}
+    assert report["long_tasks"] == {"count": 2, "total_duration": 175.0, "total_blocking_time": 75.0, "longest": 120.0}
+
+    resources = report["resources"]
+    assert resources["count"] == 4 and resources["transfer_bytes"] == 132000
+    assert [r["url"] for r in resources["slowest"]] == [
+        "https://cdn.example.com/hero.jpg", "https://cdn.example.com/app.js"
+    ]
+
+
+def test_waterfall_groups():
+    by_domain = waterfall_summary(RAW["resources"], "domain")
+    assert list(by_domain) == ["cdn.example.com", "example.com"]
+    cdn = by_domain["cdn.example.com"]
+    assert cdn["requests"] == 3 and cdn["transfer_bytes"] == 130000
+    assert cdn["start"] == 210.0 and cdn["end"] == 800.0 and cdn["max_duration"] == 380.0
+
+    by_type = waterfall_summary(RAW["resources"], "type")
+    assert by_type["img"]["requests"] == 2 and by_type["img"]["total_duration"] == 400.0
+    assert by_type["fetch"]["decoded_bytes"] == 8000
+
+
+def test_empty_report():
+    report = build_performance_report({})
+    assert report["navigation"] is None
+    assert report["paint"]["largest_contentful_paint"] is None
+    assert report["long_tasks"]["count"] == 0
+    assert report["resources"]["by_domain"] == {}
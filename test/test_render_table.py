@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Tests for the learned per-host render table: the similarity check, TTL and
+LRU bookkeeping, persistence, and how "auto" rendering uses the verdicts.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from aiohttp import web
+
+from mcp_server import render_table
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.render_table import RenderTable, content_similarity, fetch_for_render, learn_render, render_host
+
+
+ARTICLE = """<html><head><title>Article</title></head><body><h1>Article</h1>
+<p>""" + "Server-rendered text. " * 20 + """</p><a href="/next">Next</a>
+<script src="/analytics.js"></script></body></html>"""
+
+SHELL = """<html><head><title>App</title></head><body><div id="root"></div>
+<script src="/bundle.js"></script></body></html>"""
+
+# ARTICLE as a browser would show it: same content, extra wrappers and injected scripts
+RENDERED_ARTICLE = """<html><head><title>Article</title></head><body><div class="wrap"><div>
+<h1>Article</h1><p>""" + "Server-rendered text. " * 20 + """</p><a href="/next">Next</a></div></div>
+<script src="/analytics.js"></script><script>window.x = 1</script></body></html>"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_content_similarity():
+    assert content_similarity(ARTICLE, ARTICLE) == 1.0
+    assert content_similarity(ARTICLE, RENDERED_ARTICLE) == 1.0
+    assert content_similarity(SHELL, RENDERED_ARTICLE) == 0.0
+    assert content_similarity("", "") == 1.0
+
+
+def test_render_host():
+    assert render_host("https://Example.com:8443/a?b=c") == "example.com:8443"
+
+
+async def test_record_and_plan():
+    table = RenderTable(sample_rate=0, similarity=0.8)
+    assert table.plan("a.test") == (None, False)
+
+    assert await table.record("a.test", 0.95) == "http"
+    assert await table.record("b.test", 0.2) == "browser"
+    assert await table.record("a.test", 0.9) == "http"
+
+    assert table.plan("a.test") == ("http", False)
+    assert table.plan("b.test") == ("browser", False)
+    assert table.lookup("a.test")["samples"] == 2
+    assert table.stats() == {"hosts": 2, "http": 1, "browser": 1}
+
+    assert RenderTable(sample_rate=0.5, rng=lambda: 0.4).plan("a.test") == (None, True)
+    assert RenderTable(sample_rate=0.5, rng=lambda: 0.6).plan("a.test") == (None, False)
+
+
+async def test_entries_expire():
+    clock = FakeClock()
+    table = RenderTable(ttl=60, sample_rate=0, clock=clock)
+    await table.record("a.test", 1.0)
+
+    clock.now += 59
+    assert table.plan("a.test") == ("http", False)
+    clock.now += 1
+    assert table.plan("a.test") == (None, False)
+    assert table.stats()["hosts"] == 0
+
+
+async def test_least_recently_used_hosts_are_evicted():
+    table = RenderTable(max_hosts=2, sample_rate=0)
+    await table.record("a.test", 1.0)
+    await table.record("b.test", 1.0)
+    table.lookup("a.test")
+    await table.record("c.test", 1.0)
+
+    assert table.lookup("b.test") is None
+    assert table.lookup("a.test") is not None
+    assert table.lookup("c.test") is not None
+
+
+async def test_table_persists_across_restarts(tmp_path):
+    path = str(tmp_path / "cache" / "render_table.json")
+    clock = FakeClock()
+    table = RenderTable(path, ttl=60, sample_rate=0, clock=clock)
+    await table.record("a.test", 1.0)
+    clock.now += 30
+    await table.record("b.test", 0.1)
+
+    with open(path, encoding="utf-8") as f:
+        assert set(json.load(f)["hosts"]) == {"a.test", "b.test"}
+
+    reloaded = RenderTable(path, ttl=60, sample_rate=0, clock=clock)
+    assert reloaded.plan("a.test") == ("http", False)
+    assert reloaded.plan("b.test") == ("browser", False)
+
+    # Entries that expired while the server was down are not loaded
+    clock.now += 40
+    assert RenderTable(path, ttl=60, sample_rate=0, clock=clock).stats()["hosts"] == 1
+
+
+async def test_saves_are_written_in_order(tmp_path):
+    path = str(tmp_path / "render_table.json")
+    table = RenderTable(path, sample_rate=0)
+    write = table._write
+
+    def slow_first_write(hosts):
+        # Without ordering, the snapshot holding only a.test would finish last and win
+        if "b.test" not in hosts:
+            time.sleep(0.1)
+        write(hosts)
+
+    table._write = slow_first_write
+    await asyncio.gather(table.record("a.test", 1.0), table.record("b.test", 0.1))
+
+    with open(path, encoding="utf-8") as f:
+        assert set(json.load(f)["hosts"]) == {"a.test", "b.test"}
+
+
+def test_unreadable_table_is_ignored(tmp_path):
+    path = tmp_path / "render_table.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert RenderTable(str(path)).stats()["hosts"] == 0
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = RenderTable(sample_rate=0)
+    monkeypatch.setattr(render_table, "_render_table", table)
+    return table
+
+
+@pytest.fixture
+async def site(local_server):
+    hits = []
+
+    async def article(request):
+        hits.append(request.path)
+        return web.Response(text=ARTICLE, content_type="text/html")
+
+    async def shell(request):
+        hits.append(request.path)
+        return web.Response(text=SHELL, content_type="text/html")
+
+    return await local_server({"/article": article, "/shell": shell}), hits
+
+
+async def test_unknown_host_follows_the_heuristics(site, table):
+    url, hits = site
+
+    fetched, reason = await fetch_for_render(f"{url}/article", "auto")
+    assert reason is None and fetched.status == 200
+
+    fetched, reason = await fetch_for_render(f"{url}/shell", "auto")
+    assert "empty application root" in reason
+    assert fetched is not None
+
+
+async def test_host_learned_as_browser_skips_the_fetch(site, table):
+    url, hits = site
+    await table.record(render_host(url), 0.1)
+
+    assert await fetch_for_render(f"{url}/article", "auto") == (None, "learned for this host")
+    assert hits == []
+
+    # An explicit "http" call ignores what was learned
+    fetched, reason = await fetch_for_render(f"{url}/article", "http")
+    assert reason is None and hits == ["/article"]
+
+
+async def test_host_learned_as_http_skips_the_heuristics(site, table):
+    url, hits = site
+    await table.record(render_host(url), 0.9)
+
+    fetched, reason = await fetch_for_render(f"{url}/shell", "auto")
+    assert reason is None
+
+    # The call's own selector is still checked
+    fetched, reason = await fetch_for_render(f"{url}/shell", "auto", wait_for_selector="#root h1")
+    assert "not in static HTML" in reason
+
+
+async def test_sampled_calls_use_the_browser(site, monkeypatch):
+    url, hits = site
+    monkeypatch.setattr(render_table, "_render_table", RenderTable(sample_rate=1))
+
+    fetched, reason = await fetch_for_render(f"{url}/article", "auto")
+    assert reason.startswith("sampled")
+    assert fetched is not None
+
+
+async def test_learn_render_records_the_host(table):
+    learned = await learn_render("https://docs.example/a", ARTICLE, RENDERED_ARTICLE)
+    assert learned == {"similarity": 1.0, "learned": "http"}
+
+    learned = await learn_render("https://app.example/", SHELL, RENDERED_ARTICLE)
+    assert learned == {"similarity": 0.0, "learned": "browser"}
+
+    assert table.stats() == {"hosts": 2, "http": 1, "browser": 1}
+
+
+async def test_get_page_content_uses_the_learned_renderer(site, table):
+    url, hits = site
+    await table.record(render_host(url), 0.95)
+    service = BrowserService()
+
+    result = await service.get_page_content(f"{url}/shell", render="auto", fields=["title"])
+
+    assert result["title"] == "App"
+    assert result["render"] == {"mode": "http"}
+    assert service._browser is None
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for per-call resource blocking, using fake Playwright routes.
+"""
+
+import pytest
+
+from mcp_server.browser.resource_blocking import ResourceBlocker, validate_block_resources
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, frame=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = frame or FakeFrame()
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "abort"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+async def route(blocker, url, resource_type, frame=None):
+    fake = FakeRoute(FakeRequest(url, resource_type, frame))
+    await blocker._handle(fake)
+    return fake.outcome
+
+
+async def test_blocks_by_type_host_and_pattern():
+    blocker = ResourceBlocker(validate_block_resources({
+        "resource_types": ["image", "font"],
+        "hosts": ["ads.example.net"],
+        "url_patterns": ["*/analytics.js*"],
+    }))
+
+    assert await route(blocker, "https://example.com/logo.png", "image") == "abort"
+    assert await route(blocker, "https://example.com/a.woff2", "font") == "abort"
+    assert await route(blocker, "https://cdn.ads.example.net/x.js", "script") == "abort"
+    assert await route(blocker, "https://example.com/js/analytics.js?v=2", "script") == "abort"
+    assert await route(blocker, "https://example.com/app.js", "script") == "fallback"
+    assert await route(blocker, "https://example.net/app.css", "stylesheet") == "fallback"
+
+    stats = blocker.stats()
+    assert stats["blocked_requests"] == 4
+    assert stats["blocked_by_type"] == {"image": 1, "font": 1, "script": 2}
+    assert stats["allowed_requests"] == 2
+
+
+async def test_main_document_is_never_blocked():
+    blocker = ResourceBlocker(validate_block_resources({"trackers": True}))
+
+    assert await route(blocker, "https://www.google-analytics.com/", "document") == "fallback"
+    # A tracker iframe is still blocked
+    assert await route(blocker, "https://www.google-analytics.com/frame", "document",
+                       FakeFrame(parent_frame=FakeFrame())) == "abort"
+    assert await route(blocker, "https://stats.g.doubleclick.net/collect", "xhr") == "abort"
+
+
+def test_validate_block_resources():
+    assert validate_block_resources(None) is None
+    assert validate_block_resources({"resource_types": []}) is None
+    assert validate_block_resources({"resource_types": ["IMAGE"]})["resource_types"] == ["image"]
+
+    with pytest.raises(ValueError):
+        validate_block_resources({"resource_types": ["document"]})
+    with pytest.raises(ValueError):
+        validate_block_resources({"hosts": "example.com"})
+    with pytest.raises(ValueError):
+        validate_block_resources({"images": True})
+    with pytest.raises(ValueError):
+        validate_block_resources(["image"])
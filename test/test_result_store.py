@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the chunked result store used to page large tool results.
+"""
+
+import json
+
+import pytest
+
+from mcp_server import result_store
+from mcp_server.result_store import ResultStore, paginate_text, parse_cursor, chunk_response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def read_all(store, first):
+    """Follow cursors from the first response and join every chunk."""
+    chunks = [first[0].text]
+    info = json.loads(first[1].text)["pagination"]
+    while info["next_cursor"]:
+        result_id, index = parse_cursor(info["next_cursor"])
+        response = chunk_response(store, result_id, index)
+        chunks.append(response[0].text)
+        info = json.loads(response[1].text)["pagination"]
+    return "".join(chunks)
+
+
+def test_small_results_are_returned_inline():
+    response = paginate_text("short", inline_limit=10)
+    assert len(response) == 1 and response[0].text == "short"
+
+
+def test_large_results_round_trip_through_cursors(monkeypatch):
+    store = ResultStore(chunk_size=16, ttl=60, max_bytes=10_000)
+    monkeypatch.setattr(result_store, "_result_store", store)
+
+    text = "中文 text mixed with multi-byte characters " * 20
+    first = paginate_text(text, inline_limit=10)
+
+    info = json.loads(first[1].text)["pagination"]
+    assert info["chunk"] == 0 and info["total_chunks"] > 1
+    assert read_all(store, first) == text
+
+
+def test_results_expire_after_ttl():
+    clock = FakeClock()
+    store = ResultStore(chunk_size=16, ttl=10, max_bytes=10_000, clock=clock)
+    result_id, _ = store.put("x" * 100)
+
+    clock.now = 9
+    store.get_chunk(result_id, 0)
+    clock.now = 11
+    with pytest.raises(KeyError):
+        store.get_chunk(result_id, 0)
+    assert store.stats()["results"] == 0
+
+
+def test_byte_budget_evicts_least_recently_read():
+    store = ResultStore(chunk_size=16, ttl=60, max_bytes=250)
+    first, _ = store.put("a" * 100)
+    second, _ = store.put("b" * 100)
+    store.get_chunk(first, 0)  # first is now the most recently read
+    store.put("c" * 100)
+
+    store.get_chunk(first, 0)
+    with pytest.raises(KeyError):
+        store.get_chunk(second, 0)
+    assert store.stats()["bytes"] == 200
+
+
+def test_oversized_result_is_rejected():
+    store = ResultStore(chunk_size=16, ttl=60, max_bytes=50)
+    with pytest.raises(ValueError):
+        store.put("x" * 51)
+
+
+@pytest.mark.parametrize("cursor", ["", "abc", "abc:", ":1", "abc:-1"])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        parse_cursor(cursor)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive settle wait used after page loads.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server.browser.settle import ActivityMonitor, validate_settle_options
+
+
+class FakePage:
+    """Records listeners and lets the test emit page events."""
+
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def emit(self, event, payload=None):
+        for callback in self.listeners.get(event, []):
+            callback(payload)
+
+
+async def test_quiet_page_returns_after_quiet_period():
+    page = FakePage()
+    monitor = ActivityMonitor(page)
+
+    settle = await monitor.wait(quiet_ms=50, max_ms=3000)
+
+    assert settle["settled"] is True
+    assert 40 <= settle["waited_ms"] < 500
+
+
+async def test_activity_extends_wait():
+    page = FakePage()
+    monitor = ActivityMonitor(page)
+
+    async def late_requests():
+        for event in ("request", "console", "requestfinished"):
+            await asyncio.sleep(0.03)
+            page.emit(event)
+
+    emitter = asyncio.ensure_future(late_requests())
+    settle = await monitor.wait(quiet_ms=50, max_ms=3000)
+    await emitter
+
+    assert settle["settled"] is True
+    assert settle["waited_ms"] >= 120
+    assert monitor.events == 3
+
+
+async def test_busy_page_stops_at_upper_bound():
+    page = FakePage()
+    monitor = ActivityMonitor(page)
+    stop = asyncio.Event()
+
+    async def polling():
+        while not stop.is_set():
+            page.emit("request")
+            await asyncio.sleep(0.01)
+
+    emitter = asyncio.ensure_future(polling())
+    settle = await monitor.wait(quiet_ms=100, max_ms=200)
+    stop.set()
+    await emitter
+
+    assert settle["settled"] is False
+    assert 190 <= settle["waited_ms"] < 600
+
+
+def test_validate_settle_options():
+    quiet_ms, max_ms = validate_settle_options(None, 1000)
+    assert quiet_ms > 0 and max_ms == 1000
+
+    with pytest.raises(ValueError):
+        validate_settle_options(-1, None)
+    with pytest.raises(ValueError):
+        validate_settle_options(None, "3000")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight coalescing: shared results and errors, cancellation,
+and identical concurrent get_page_content and crawl_web_page calls against
+a local HTTP server.
+"""
+
+import asyncio
+import os
+
+import pytest
+from aiohttp import web
+
+from mcp_server.browser.browser_service import BrowserService
+from mcp_server.crawl.crawl import crawl_web_page, get_crawl_flight_stats
+from mcp_server.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    runs = []
+    release = asyncio.Event()
+
+    async def work():
+        runs.append(1)
+        await release.wait()
+        return {"value": 42}
+
+    calls = [asyncio.ensure_future(flights.run("k", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert flights.in_flight("k")
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert runs == [1]
+    assert [joined for _, joined in results] == [False, True, True, True, True]
+    assert all(result == {"value": 42} for result, _ in results)
+    assert not flights.in_flight("k")
+    assert flights.stats() == {"in_flight": 0, "started": 1, "joined": 4}
+
+    # Once finished, the next call runs again
+    release.set()
+    await flights.run("k", work)
+    assert runs == [1, 1]
+
+
+async def test_errors_reach_every_waiter_and_are_not_kept():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise ValueError("boom")
+
+    calls = [asyncio.ensure_future(flights.run("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not flights.in_flight("k")
+
+    async def working():
+        return "ok"
+
+    assert await flights.run("k", working) == ("ok", False)
+
+
+async def test_cancelling_one_waiter_keeps_the_run_for_the_others():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flights.run("k", work))
+    second = asyncio.ensure_future(flights.run("k", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == ("done", True)
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_run_is_cancelled_when_every_waiter_leaves():
+    flights = SingleFlight()
+    started = asyncio.Event()
+    cancelled = []
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    calls = [asyncio.ensure_future(flights.run("k", work)) for _ in range(2)]
+    await started.wait()
+    for call in calls:
+        call.cancel()
+    await asyncio.gather(*calls, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert cancelled == [True]
+    assert not flights.in_flight("k")
+
+
+@pytest.fixture
+async def site(local_server):
+    requests = []
+
+    async def slow(request):
+        requests.append(request.path)
+        await asyncio.sleep(0.2)
+        return web.Response(text="<html><head><title>Slow</title></head><body><p>Text</p></body></html>",
+                            content_type="text/html")
+
+    return await local_server({"/slow": slow}), requests
+
+
+async def test_identical_get_page_content_calls_share_one_load(site):
+    url, requests = site
+    service = BrowserService()
+
+    results = await asyncio.gather(*[
+        service.get_page_content(f"{url}/slow", render="http", fields=["title"], bypass_cache=True)
+        for _ in range(4)
+    ])
+
+    assert requests == ["/slow"]
+    assert all(result["title"] == "Slow" for result in results)
+    # Every caller gets its own copy
+    assert len({id(result) for result in results}) == 4
+    assert service.get_stats()["single_flight"]["joined"] == 3
+
+
+async def test_identical_crawls_share_one_render(site, tmp_path):
+    url, requests = site
+    joined_before = get_crawl_flight_stats()["joined"]
+
+    messages = await asyncio.gather(*[
+        crawl_web_page(f"{url}/slow", str(tmp_path / name), render="http")
+        for name in ("a", "b", "c")
+    ])
+
+    assert requests == ["/slow"]
+    assert get_crawl_flight_stats()["joined"] - joined_before == 2
+    for message in messages:
+        assert message.startswith(f"Successfully crawled {url}/slow (HTTP)")
+        assert "output.html" in os.listdir(message.rsplit(" to ", 1)[1])
+
+
+async def test_identical_crawls_into_one_save_path_get_their_own_directories(site, tmp_path):
+    url, requests = site
+
+    messages = await asyncio.gather(*[
+        crawl_web_page(f"{url}/slow", str(tmp_path), render="http") for _ in range(3)
+    ])
+
+    assert requests == ["/slow"]
+    output_dirs = {message.rsplit(" to ", 1)[1] for message in messages}
+    assert len(output_dirs) == 3
+    assert all(sorted(os.listdir(output_dir)) == ["files", "output.html", "output.json"] for output_dir in output_dirs)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for the subresource cache: cache header handling, hits, revalidation,
+shared bodies, the byte budget and coalesced loads, using fake Playwright
+routes.
+"""
+
+import asyncio
+
+from mcp_server.browser.subresource_cache import SubresourceCache, freshness_lifetime, is_storable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET", headers=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = headers or {}
+
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class Origin:
+    """Answers route.fetch calls from a table of URL -> FakeResponse and records request headers."""
+
+    def __init__(self, responses, delay=0):
+        self.responses = responses
+        self.delay = delay
+        self.fetches = []
+
+    async def fetch(self, url, headers):
+        self.fetches.append((url, headers))
+        await asyncio.sleep(self.delay)
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response(headers) if callable(response) else response
+
+
+class FakeRoute:
+    def __init__(self, origin, request):
+        self.origin = origin
+        self.request = request
+        self.outcome = None
+        self.fulfilled = None
+
+    async def fetch(self, headers=None):
+        return await self.origin.fetch(self.request.url, headers if headers is not None else self.request.headers)
+
+    async def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.outcome = "cache" if response is None else "network"
+        self.fulfilled = {"status": status or response.status, "headers": headers, "body": body}
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+async def request(cache, origin, url, **kwargs):
+    route = FakeRoute(origin, FakeRequest(url, **kwargs))
+    await cache._handle(route)
+    return route
+
+
+def test_freshness_and_storability():
+    assert freshness_lifetime({"cache-control": "public, max-age=600", "age": "100"}) == 500
+    assert freshness_lifetime({"cache-control": "max-age=600, s-maxage=60"}) == 60
+    assert freshness_lifetime({"cache-control": "no-cache, max-age=600"}) == 0
+    assert freshness_lifetime({
+        "date": "Mon, 01 Jan 2024 00:00:00 GMT", "expires": "Mon, 01 Jan 2024 01:00:00 GMT",
+    }) == 3600
+    assert freshness_lifetime({"date": "Mon, 01 Jan 2024 00:00:00 GMT", "expires": "0"}) == 0
+    # 10% of the time since Last-Modified, at most a day
+    assert freshness_lifetime({
+        "date": "Mon, 11 Jan 2024 00:00:00 GMT", "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }) == 86400
+    assert freshness_lifetime({}) == 0
+
+    assert is_storable(200, {"cache-control": "public, max-age=60", "vary": "Accept-Encoding"})
+    assert not is_storable(200, {"cache-control": "no-store"})
+    assert not is_storable(200, {"cache-control": "private, max-age=60"})
+    assert not is_storable(200, {"vary": "Cookie"})
+    assert not is_storable(404, {"cache-control": "max-age=60"})
+
+
+async def test_fresh_responses_are_served_from_memory_until_they_expire():
+    clock = FakeClock()
+    cache = SubresourceCache(max_bytes=1024, clock=clock)
+    origin = Origin({"https://cdn.test/app.js": FakeResponse(headers={
+        "Cache-Control": "max-age=60", "Content-Type": "text/javascript",
+        "Content-Encoding": "gzip", "Set-Cookie": "id=1",
+    }, body=b"app()")})
+
+    first = await request(cache, origin, "https://cdn.test/app.js")
+    second = await request(cache, origin, "https://cdn.test/app.js#fragment")
+
+    assert first.outcome == "network"
+    assert second.outcome == "cache"
+    assert second.fulfilled["body"] == b"app()"
+    # Transfer details and cookies of the original response are not replayed
+    assert second.fulfilled["headers"] == {"cache-control": "max-age=60", "content-type": "text/javascript"}
+    assert len(origin.fetches) == 1
+
+    clock.now += 61
+    await request(cache, origin, "https://cdn.test/app.js")
+    assert len(origin.fetches) == 2
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 2, round(1 / 3, 4))
+
+
+async def test_stale_entries_are_revalidated():
+    clock = FakeClock()
+    cache = SubresourceCache(max_bytes=1024, clock=clock)
+
+    def respond(headers):
+        if headers.get("if-none-match") == '"v1"':
+            return FakeResponse(status=304, headers={"cache-control": "max-age=30"})
+        return FakeResponse(headers={"etag": '"v1"', "cache-control": "no-cache"}, body=b"body{}")
+
+    origin = Origin({"https://cdn.test/site.css": respond})
+
+    await request(cache, origin, "https://cdn.test/site.css", resource_type="stylesheet")
+    revalidated = await request(cache, origin, "https://cdn.test/site.css", resource_type="stylesheet")
+    assert revalidated.outcome == "cache"
+    assert revalidated.fulfilled["body"] == b"body{}"
+    assert origin.fetches[1][1]["if-none-match"] == '"v1"'
+
+    # The 304 made the entry fresh for 30 seconds
+    await request(cache, origin, "https://cdn.test/site.css", resource_type="stylesheet")
+    assert len(origin.fetches) == 2
+    assert cache.stats()["revalidations"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+async def test_uncacheable_requests_and_responses_pass_through():
+    cache = SubresourceCache(max_bytes=1024)
+    origin = Origin({
+        "https://cdn.test/a.js": FakeResponse(headers={"cache-control": "no-store"}, body=b"a"),
+        "https://cdn.test/b.js": FakeResponse(body=b"b"),
+    })
+
+    assert (await request(cache, origin, "https://cdn.test/page", resource_type="document")).outcome == "fallback"
+    assert (await request(cache, origin, "https://cdn.test/api", resource_type="fetch")).outcome == "fallback"
+    assert (await request(cache, origin, "https://cdn.test/a.js", method="POST")).outcome == "fallback"
+    assert (await request(cache, origin, "https://cdn.test/a.js", headers={"range": "bytes=0-1"})).outcome == "fallback"
+
+    for url in ("https://cdn.test/a.js", "https://cdn.test/b.js"):
+        for _ in range(2):
+            assert (await request(cache, origin, url)).outcome == "network"
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["uncacheable"] == 4
+
+
+async def test_identical_bodies_are_stored_once_and_the_budget_evicts_lru():
+    cache = SubresourceCache(max_bytes=100)
+    headers = {"cache-control": "max-age=600"}
+    origin = Origin({
+        "https://cdn-a.test/lib.js": FakeResponse(headers=headers, body=b"x" * 40),
+        "https://cdn-b.test/lib.js": FakeResponse(headers=headers, body=b"x" * 40),
+        "https://cdn.test/one.png": FakeResponse(headers=headers, body=b"1" * 40),
+        "https://cdn.test/two.png": FakeResponse(headers=headers, body=b"2" * 40),
+        "https://cdn.test/huge.png": FakeResponse(headers=headers, body=b"h" * 200),
+    })
+
+    await request(cache, origin, "https://cdn-a.test/lib.js")
+    await request(cache, origin, "https://cdn-b.test/lib.js")
+    assert cache.stats()["bytes"] == 40
+    assert cache.stats()["shared_bodies"] == 1
+
+    await request(cache, origin, "https://cdn.test/one.png", resource_type="image")
+    await request(cache, origin, "https://cdn-a.test/lib.js")
+    await request(cache, origin, "https://cdn-b.test/lib.js")
+    await request(cache, origin, "https://cdn.test/two.png", resource_type="image")
+
+    # one.png was the least recently used body
+    assert cache.stats()["bytes"] == 80
+    assert cache.stats()["evictions"] == 1
+    assert (await request(cache, origin, "https://cdn-b.test/lib.js")).outcome == "cache"
+    assert (await request(cache, origin, "https://cdn.test/one.png", resource_type="image")).outcome == "network"
+
+    # Larger than the budget: passed through without evicting anything
+    entries = cache.stats()["entries"]
+    await request(cache, origin, "https://cdn.test/huge.png", resource_type="image")
+    assert cache.stats()["entries"] == entries
+    assert cache.stats()["bytes"] <= 100
+
+
+async def test_concurrent_requests_share_one_fetch():
+    cache = SubresourceCache(max_bytes=1024)
+    origin = Origin({"https://cdn.test/font.woff2": FakeResponse(
+        headers={"cache-control": "max-age=600"}, body=b"font")}, delay=0.05)
+
+    routes = await asyncio.gather(*[
+        request(cache, origin, "https://cdn.test/font.woff2", resource_type="font") for _ in range(4)
+    ])
+
+    assert len(origin.fetches) == 1
+    assert sorted(route.outcome for route in routes) == ["cache", "cache", "cache", "network"]
+    assert all(route.fulfilled["body"] == b"font" for route in routes)
+
+
+async def test_failed_fetches_fall_back_to_the_network():
+    cache = SubresourceCache(max_bytes=1024)
+    origin = Origin({"https://cdn.test/app.js": ConnectionError("reset")})
+
+    route = await request(cache, origin, "https://cdn.test/app.js")
+
+    assert route.outcome == "fallback"
+    assert cache.stats()["entries"] == 0
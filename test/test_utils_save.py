@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the off-loop file writers in mcp_server.utils.
+"""
+
+import asyncio
+import os
+
+from mcp_server.utils import AsyncFileWriter, save_async, WRITE_CHUNK_SIZE
+
+
+async def test_save_async_writes_text_and_bytes(tmp_path):
+    saved = []
+    text = "页面内容 " * (WRITE_CHUNK_SIZE // 4)
+    data = os.urandom(WRITE_CHUNK_SIZE * 2 + 17)
+
+    await asyncio.gather(
+        save_async(str(tmp_path), "page.html", text, saved.append),
+        save_async(str(tmp_path), "page.pdf", data, saved.append),
+        save_async(str(tmp_path), "missing.png", None, saved.append),
+    )
+
+    assert (tmp_path / "page.html").read_text(encoding="utf-8") == text
+    assert (tmp_path / "page.pdf").read_bytes() == data
+    assert not (tmp_path / "missing.png").exists()
+    assert sorted(saved) == sorted([str(tmp_path / "page.html"), str(tmp_path / "page.pdf")])
+
+
+async def test_async_file_writer_streams_chunks(tmp_path):
+    async with AsyncFileWriter(str(tmp_path / "stream.bin")) as writer:
+        for i in range(5):
+            await writer.write(bytes([i]) * 1000)
+
+    assert (tmp_path / "stream.bin").read_bytes() == b"".join(bytes([i]) * 1000 for i in range(5))